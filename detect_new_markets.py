@@ -14,111 +14,135 @@ Usage:
 
 Output:
     - Prints new markets to stdout
-    - Updates last_checked_block.txt with latest block
+    - Updates cache/markets.json (incremental market index)
     - Saves new_markets.json with discovery details
 """
 
 import sys
-import json
+import time
+import bisect
+import functools
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import requests
 
 # Add scripts directory to path
 sys.path.append(str(Path(__file__).parent / "scripts"))
 
 from utils.routescan_api import RoutescanAPI
 from utils.web3_helpers import Web3Helper
+from utils.market_registry import MarketRegistryIndex
+from utils.constants import MARKET_REGISTRY, DEPLOYMENT_BLOCK
+from utils.json_io import load_json, dump_json
 
 # Constants
-MARKET_REGISTRY = '0x60f16b09a15f0c3210b40a735b19a6baf235dd18'
-MARKET_CREATED_SIG = '0x5eb977f82e9d0d89f65f05a56a99ab87e2ebb3909780e0b3642bec962789ba7a'
-LAST_CHECKED_FILE = Path(__file__).parent / "last_checked_block.txt"
 OUTPUT_FILE = Path(__file__).parent / "new_markets.json"
 
-def load_last_checked_block() -> int:
-    """Load the last checked block number from file"""
-    if LAST_CHECKED_FILE.exists():
-        with open(LAST_CHECKED_FILE, 'r') as f:
-            return int(f.read().strip())
-    else:
-        # Default: Start from TradeSta deployment
-        return 63_000_000
+FACTORY_DEPLOYMENTS_FILE = Path(__file__).parent.parent / "analysis" / "factory_deployments.json"
+
+# Verified source rarely changes - refresh cached copies after a day
+SOURCE_CACHE_TTL = 24 * 60 * 60
+SOURCE_FETCH_RETRIES = 4
+
+@functools.lru_cache(maxsize=4096)
+def _get_source_cached(api: RoutescanAPI, address: str) -> dict:
+    """
+    Fetch contract source once per address per run
+
+    Quartets across markets can share contracts, so repeated lookups are
+    coalesced in memory. Rate-limited (HTTP 429) responses are retried with
+    exponential backoff.
+    """
+    for attempt in range(SOURCE_FETCH_RETRIES):
+        try:
+            return api.get_contract_source(address, max_age=SOURCE_CACHE_TTL)
+        except requests.HTTPError as e:
+            rate_limited = e.response is not None and e.response.status_code == 429
+            if not rate_limited or attempt == SOURCE_FETCH_RETRIES - 1:
+                raise
+            time.sleep(2 ** attempt)
+
+@functools.lru_cache(maxsize=1)
+def load_factory_deployments() -> Optional[Dict[str, List[str]]]:
+    """
+    Load factory_deployments.json indexed by deployment transaction
 
-def save_last_checked_block(block: int):
-    """Save the last checked block number to file"""
-    with open(LAST_CHECKED_FILE, 'w') as f:
-        f.write(str(block))
+    Parsed once per process.
+
+    Returns:
+        {tx_hash: [contract1, contract2, ...]}, or None if the file is not available
+    """
+    if not FACTORY_DEPLOYMENTS_FILE.exists():
+        return None
+
+    deployments_by_tx: Dict[str, List[str]] = {}
+    for deployment in load_json(FACTORY_DEPLOYMENTS_FILE):
+        deployments_by_tx.setdefault(deployment['tx_hash'], []).append(deployment['contract'])
+
+    return deployments_by_tx
 
 def detect_new_markets(from_block: int = None):
     """
     Detect new TradeSta markets deployed since from_block
 
     Args:
-        from_block: Start searching from this block (default: last checked)
+        from_block: Report markets from this block (default: last checked)
 
     Returns:
         List of new market dictionaries
     """
     api = RoutescanAPI(cache_dir='cache')
     w3 = Web3Helper()
-
-    if from_block is None:
-        from_block = load_last_checked_block()
+    index = MarketRegistryIndex(api=api, cache_dir='cache')
 
     current_block = w3.get_latest_block()
+    run_timestamp = datetime.now(timezone.utc).isoformat()  # One timestamp for the whole run
+    search_from = from_block if from_block is not None else index.last_block + 1
 
     print("="*80)
     print("TRADESTA NEW MARKET DETECTION")
     print("="*80)
     print(f"\nMarketRegistry: {MARKET_REGISTRY}")
-    print(f"Searching: Block {from_block:,} → {current_block:,}")
-    print(f"Timestamp: {datetime.utcnow().isoformat()}")
+    print(f"Searching: Block {search_from:,} → {current_block:,}")
+    print(f"Timestamp: {run_timestamp}")
     print()
 
-    # Query MarketCreated events
+    # Query MarketCreated events (only blocks since the index was last updated)
     print("Querying MarketCreated events...")
-    events = api.get_all_logs(
-        address=MARKET_REGISTRY,
-        topic0=MARKET_CREATED_SIG,
-        from_block=from_block,
-        to_block=current_block,
-        offset=10000
-    )
+    discovered = index.update(current_block, verbose=True)
 
-    if not events:
+    if from_block is None:
+        markets = discovered
+    else:
+        # Index is ordered by block - slice instead of scanning every market
+        start = bisect.bisect_left(index.markets, from_block, key=lambda m: m['block'])
+        markets = index.markets[start:]
+
+    if not markets:
         print("✅ No new markets found since last check")
-        print(f"\nLast checked block: {from_block:,}")
+        print(f"\nLast checked block: {index.last_block:,}")
         return []
 
-    print(f"🎉 FOUND {len(events)} NEW MARKET(S)!\n")
+    print(f"🎉 FOUND {len(markets)} NEW MARKET(S)!\n")
     print("="*80)
 
     new_markets = []
 
-    for i, event in enumerate(events, 1):
-        # Parse event data
-        block = int(event['blockNumber'], 16)
-        tx_hash = event['transactionHash']
-        topics = event['topics']
-
-        pricefeed_id = topics[1]
-        position_manager = '0x' + topics[2][-40:]
-        order_manager = '0x' + topics[3][-40:]
-
-        market = {
-            'market_number': i,
-            'block': block,
-            'tx_hash': tx_hash,
-            'position_manager': position_manager,
-            'order_manager': order_manager,
-            'pricefeed_id': pricefeed_id,
-            'discovered_at': datetime.utcnow().isoformat()
-        }
+    for indexed_market in markets:
+        block = indexed_market['block']
+        tx_hash = indexed_market['tx_hash']
+        pricefeed_id = indexed_market['pricefeed_id']
+        position_manager = indexed_market['position_manager']
+        order_manager = indexed_market['order_manager']
+
+        market = dict(indexed_market, discovered_at=run_timestamp)
 
         new_markets.append(market)
 
         # Display
-        print(f"\nMarket #{i}")
+        print(f"\nMarket #{market['market_number']}")
         print(f"  Block: {block:,}")
         print(f"  PositionManager: {position_manager}")
         print(f"  OrderManager: {order_manager}")
@@ -130,12 +154,9 @@ def detect_new_markets(from_block: int = None):
         print(f"\n  Finding complete quartet...")
         try:
             # Load factory deployments if available
-            factory_file = Path(__file__).parent.parent / "analysis" / "factory_deployments.json"
-            if factory_file.exists():
-                with open(factory_file, 'r') as f:
-                    deployments = json.load(f)
-
-                quartet = [d['contract'] for d in deployments if d['tx_hash'] == tx_hash]
+            deployments_by_tx = load_factory_deployments()
+            if deployments_by_tx is not None:
+                quartet = deployments_by_tx.get(tx_hash, [])
 
                 if quartet:
                     print(f"  ✅ Found {len(quartet)} contracts in deployment:")
@@ -143,22 +164,23 @@ def detect_new_markets(from_block: int = None):
                     # Identify each contract type
                     for contract_addr in quartet:
                         try:
-                            source_info = api.get_contract_source(contract_addr)
+                            source_info = _get_source_cached(api, contract_addr.lower())
                             contract_type = source_info.get('ContractName', 'Unknown')
                             print(f"     {contract_type}: {contract_addr}")
 
                             # Add to market data
                             if contract_type not in market:
                                 market[contract_type.lower()] = contract_addr
-                        except:
-                            print(f"     Unknown: {contract_addr}")
+                        except (requests.RequestException, KeyError) as e:
+                            print(f"     Unknown: {contract_addr} ({e})")
                 else:
                     print(f"  ⚠️  Quartet not found in factory_deployments.json")
             else:
                 print(f"  ℹ️  factory_deployments.json not available")
                 print(f"  ℹ️  To get complete quartet, parse deployment transaction")
 
-        except Exception as e:
+        except (OSError, ValueError) as e:
+            # Unreadable or malformed factory_deployments.json
             print(f"  ⚠️  Error retrieving quartet: {e}")
 
     print("\n" + "="*80)
@@ -166,25 +188,20 @@ def detect_new_markets(from_block: int = None):
     print("="*80)
     print(f"New Markets: {len(new_markets)}")
     print(f"Current Block: {current_block:,}")
-    print(f"Last Checked: {from_block:,}")
+    print(f"Last Checked: {index.last_block:,}")
 
     # Save results
     if new_markets:
-        with open(OUTPUT_FILE, 'w') as f:
-            json.dump({
-                'timestamp': datetime.utcnow().isoformat(),
-                'from_block': from_block,
-                'to_block': current_block,
-                'total_new_markets': len(new_markets),
-                'markets': new_markets
-            }, f, indent=2)
+        dump_json({
+            'timestamp': run_timestamp,
+            'from_block': search_from,
+            'to_block': current_block,
+            'total_new_markets': len(new_markets),
+            'markets': new_markets
+        }, OUTPUT_FILE)
 
         print(f"\n✅ Results saved to: {OUTPUT_FILE}")
-
-        # Update last checked block to highest block found
-        latest_block = max(m['block'] for m in new_markets)
-        save_last_checked_block(latest_block)
-        print(f"✅ Updated last checked block to: {latest_block:,}")
+        print(f"✅ Market index updated to block: {index.last_block:,}")
 
     print("\n" + "="*80)
     print("NEXT STEPS")
@@ -220,7 +237,7 @@ def main():
     args = parser.parse_args()
 
     if args.all:
-        from_block = 63_000_000
+        from_block = DEPLOYMENT_BLOCK
         print("Querying ALL markets from genesis...")
     elif args.from_block:
         from_block = args.from_block
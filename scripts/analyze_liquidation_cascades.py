@@ -27,25 +27,61 @@ Output:
 """
 
 import sys
-import json
+import heapq
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 from decimal import Decimal
+import requests
+from eth_abi import decode
+from eth_abi.exceptions import DecodingError
+from web3.exceptions import ContractLogicError
 
 sys.path.append(str(Path(__file__).parent))
 
 from utils.routescan_api import RoutescanAPI
 from utils.web3_helpers import Web3Helper
+from utils.market_registry import MarketRegistryIndex
+from utils.json_io import dump_json
 from web3 import Web3
 
+# Max liquidation price levels analyzed per side (per market)
+MAX_CASCADE_LEVELS = 20
+
+# Liquidation levels closer than this (percent of current price) are critical
+CRITICAL_DISTANCE_PERCENT = 5
+
+# PositionManager view function selectors (calldata is built directly, bypassing web3 contract encoding)
+FIND_LIQUIDATABLE_PRICES_LONG = Web3.keccak(text='findLiquidatablePricesLong(uint256)')[:4]
+FIND_LIQUIDATABLE_PRICES_SHORTS = Web3.keccak(text='findLiquidatablePricesShorts(uint256)')[:4]
+GET_LIQUIDATION_MAPPINGS_FROM_PRICE = Web3.keccak(text='getLiquidationMappingsFromPrice(uint256)')[:4]
+
+# Errors an individual RPC read can raise (web3 v6 surfaces JSON-RPC errors as ValueError)
+RPC_ERRORS = (requests.exceptions.RequestException, ContractLogicError, ValueError)
+
+logger = logging.getLogger(__name__)
+
+# Attached by configure_logging() (once, however many times main() runs)
+_stdout_handler = logging.StreamHandler()
+_stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+
 class LiquidationCascadeAnalyzer:
     """Analyze liquidation cascade risks for TradeSta markets"""
 
-    def __init__(self, sample_size: int = None):
+    def __init__(self, sample_size: int = None, max_workers: int = 8):
         self.api = RoutescanAPI(cache_dir='cache')
         self.w3_helper = Web3Helper()
         self.sample_size = sample_size
+        self.max_workers = max_workers
+
+        # analyze_market runs on a thread pool - guards self.results["statistics"]
+        self._stats_lock = threading.Lock()
+
+        # Per-thread buffer for the output of the market being analyzed
+        self._market_output = threading.local()
 
         self.results = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -61,68 +97,10 @@ class LiquidationCascadeAnalyzer:
             }
         }
 
-        # PositionManager ABI for cascade functions
-        self.pm_abi = [
-            {
-                "inputs": [{"internalType": "uint256", "name": "referencePrice", "type": "uint256"}],
-                "name": "findLiquidatablePricesLong",
-                "outputs": [{"internalType": "uint256[]", "name": "liquidatable", "type": "uint256[]"}],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [{"internalType": "uint256", "name": "referencePrice", "type": "uint256"}],
-                "name": "findLiquidatablePricesShorts",
-                "outputs": [{"internalType": "uint256[]", "name": "liquidatable", "type": "uint256[]"}],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [{"internalType": "uint256", "name": "price", "type": "uint256"}],
-                "name": "getLiquidationMappingsFromPrice",
-                "outputs": [{"internalType": "bytes32[]", "name": "", "type": "bytes32[]"}],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [{"internalType": "bytes32", "name": "id", "type": "bytes32"}],
-                "name": "getPositionById",
-                "outputs": [{"internalType": "tuple", "name": "", "type": "tuple", "components": []}],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "marketConfig",
-                "outputs": [
-                    {"internalType": "bytes32", "name": "pricefeedId", "type": "bytes32"},
-                    {"internalType": "address", "name": "registry", "type": "address"},
-                    {"internalType": "address", "name": "vault", "type": "address"},
-                    {"internalType": "address", "name": "collateralToken", "type": "address"},
-                    {"internalType": "address", "name": "fundingTracker", "type": "address"},
-                    {"internalType": "address", "name": "priceBuffer", "type": "address"},
-                    {"internalType": "uint256", "name": "totalLongs", "type": "uint256"},
-                    {"internalType": "uint256", "name": "totalShorts", "type": "uint256"},
-                    {"internalType": "uint256", "name": "maxDeviation", "type": "uint256"},
-                    {"internalType": "uint256", "name": "nonce", "type": "uint256"}
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            }
-        ]
-
     def get_markets_to_verify(self) -> List[Dict[str, Any]]:
         """Get list of markets to verify"""
-        market_registry = Web3.to_checksum_address('0x60f16b09a15f0c3210b40a735b19a6baf235dd18')
-        market_created_sig = '0x5eb977f82e9d0d89f65f05a56a99ab87e2ebb3909780e0b3642bec962789ba7a'
-
-        events = self.api.get_all_logs(
-            address=market_registry,
-            topic0=market_created_sig,
-            from_block=63_000_000,
-            to_block=self.results["latest_block"],
-            offset=10000
-        )
+        index = MarketRegistryIndex(api=self.api, cache_dir='cache')
+        indexed_markets = index.get_markets(self.results["latest_block"])
 
         # Well-known market names (for sample)
         market_names = {
@@ -134,14 +112,13 @@ class LiquidationCascadeAnalyzer:
         }
 
         markets = []
-        for i, event in enumerate(events, 1):
-            topics = event['topics']
-            position_manager = '0x' + topics[2][-40:]
+        for indexed_market in indexed_markets:
+            i = indexed_market['market_number']
 
             markets.append({
                 "market_number": i,
                 "name": market_names.get(i, f"Market #{i}"),
-                "position_manager": Web3.to_checksum_address(position_manager)
+                "position_manager": indexed_market['position_manager']  # lowercase; checksummed at the web3 boundary
             })
 
         if self.sample_size:
@@ -149,7 +126,7 @@ class LiquidationCascadeAnalyzer:
 
         return markets
 
-    def get_current_price_estimate(self, contract, market_name: str) -> int:
+    def get_current_price_estimate(self, market_name: str) -> int:
         """
         Estimate current price for cascade analysis
 
@@ -173,129 +150,223 @@ class LiquidationCascadeAnalyzer:
         # Default fallback
         return 100_00000000  # $100
 
+    def get_liquidation_levels(self, position_manager: str, current_price: int):
+        """
+        Get liquidation price levels for longs and shorts
+
+        Both findLiquidatablePrices* calls are aggregated into a single
+        Multicall3 eth_call.
+
+        Only the first MAX_CASCADE_LEVELS levels of each array are decoded.
+
+        Returns:
+            (long_result, short_result) - each (levels, total_level_count),
+            or None for a side whose call failed
+        """
+        price_arg = current_price.to_bytes(32, byteorder='big')
+        calls = [
+            (position_manager, FIND_LIQUIDATABLE_PRICES_LONG + price_arg),
+            (position_manager, FIND_LIQUIDATABLE_PRICES_SHORTS + price_arg)
+        ]
+
+        try:
+            raw_results = self.w3_helper.multicall(calls)
+        except RPC_ERRORS as e:
+            self._log(f"    ⚠️  Error querying liquidation levels: {e}")
+            return None, None
+
+        return tuple(
+            self.w3_helper.decode_uint256_array(raw, limit=MAX_CASCADE_LEVELS) if raw is not None else None
+            for raw in raw_results
+        )
+
+    def get_liquidation_mappings(self, position_manager: str, price_levels: List[int]) -> Dict[int, Any]:
+        """
+        Get position IDs at each price level with one Multicall3 eth_call
+
+        Returns:
+            {price_level: [position_id, ...]} (None where the call failed)
+        """
+        unique_levels = list(dict.fromkeys(price_levels))
+
+        calls = [
+            (position_manager, GET_LIQUIDATION_MAPPINGS_FROM_PRICE + price_level.to_bytes(32, byteorder='big'))
+            for price_level in unique_levels
+        ]
+
+        try:
+            raw_results = self.w3_helper.multicall(calls)
+        except RPC_ERRORS as e:
+            self._log(f"    ⚠️  Error querying liquidation mappings: {e}")
+            return {}
+
+        mappings = {}
+        for price_level, raw in zip(unique_levels, raw_results):
+            try:
+                mappings[price_level] = decode(['bytes32[]'], raw)[0] if raw is not None else None
+            except DecodingError as e:
+                logger.debug(f"Undecodable mapping at price {price_level}: {e}")
+                mappings[price_level] = None
+
+        return mappings
+
     def analyze_long_cascades(
         self,
-        contract,
         current_price: int,
-        market_name: str
+        long_result: Optional[Tuple[List[int], int]],
+        mappings: Dict[int, Any]
     ) -> List[Dict[str, Any]]:
         """Analyze liquidation cascades for long positions"""
-        print(f"    Analyzing long position cascades...")
+        self._log(f"    Analyzing long position cascades...")
 
-        try:
-            # Get all liquidation price levels for longs
-            long_levels = contract.functions.findLiquidatablePricesLong(current_price).call()
+        if long_result is None:
+            self._log(f"    ⚠️  Error analyzing long cascades: findLiquidatablePricesLong call failed")
+            return []
 
-            if not long_levels:
-                print(f"    ✅ No long positions at risk")
-                return []
+        # Levels are already capped at MAX_CASCADE_LEVELS when decoded
+        long_levels, total_levels = long_result
 
-            print(f"    Found {len(long_levels)} liquidation price levels for longs")
+        if not long_levels:
+            self._log(f"    ✅ No long positions at risk")
+            return []
 
-            cascades = []
+        self._log(f"    Found {total_levels} liquidation price levels for longs")
 
-            for price_level in long_levels[:20]:  # Limit to top 20 levels for performance
-                # Get position IDs at this level
-                try:
-                    position_ids = contract.functions.getLiquidationMappingsFromPrice(price_level).call()
+        cascades = []
 
-                    # Calculate distance from current price
-                    distance_pct = abs(price_level - current_price) / current_price * 100
+        # Within 5% = critical: distance / price * 100 < 5, kept in integers
+        critical_threshold = current_price * CRITICAL_DISTANCE_PERCENT
 
-                    cascades.append({
-                        "price": price_level,
-                        "position_count": len(position_ids),
-                        "distance_percent": float(distance_pct),
-                        "direction": "long",
-                        "critical": distance_pct < 5  # Within 5% = critical
-                    })
+        for price_level in long_levels:
+            position_ids = mappings.get(price_level)
 
-                except Exception as e:
-                    # Skip levels that error
-                    continue
+            # Skip levels that error
+            if position_ids is None:
+                continue
 
-            # Sort by position count descending
-            cascades.sort(key=lambda x: x['position_count'], reverse=True)
+            # Calculate distance from current price
+            distance = price_level - current_price
+            if distance < 0:
+                distance = -distance
 
-            return cascades
+            cascades.append({
+                "price": price_level,
+                "position_count": len(position_ids),
+                "distance_percent": distance * 100 / current_price,
+                "direction": "long",
+                "critical": distance * 100 < critical_threshold
+            })
 
-        except Exception as e:
-            print(f"    ⚠️  Error analyzing long cascades: {e}")
-            return []
+        return cascades
 
     def analyze_short_cascades(
         self,
-        contract,
         current_price: int,
-        market_name: str
+        short_result: Optional[Tuple[List[int], int]],
+        mappings: Dict[int, Any]
     ) -> List[Dict[str, Any]]:
         """Analyze liquidation cascades for short positions"""
-        print(f"    Analyzing short position cascades...")
+        self._log(f"    Analyzing short position cascades...")
 
-        try:
-            # Get all liquidation price levels for shorts
-            short_levels = contract.functions.findLiquidatablePricesShorts(current_price).call()
+        if short_result is None:
+            self._log(f"    ⚠️  Error analyzing short cascades: findLiquidatablePricesShorts call failed")
+            return []
+
+        # Levels are already capped at MAX_CASCADE_LEVELS when decoded
+        short_levels, total_levels = short_result
+
+        if not short_levels:
+            self._log(f"    ✅ No short positions at risk")
+            return []
 
-            if not short_levels:
-                print(f"    ✅ No short positions at risk")
-                return []
+        self._log(f"    Found {total_levels} liquidation price levels for shorts")
 
-            print(f"    Found {len(short_levels)} liquidation price levels for shorts")
+        cascades = []
 
-            cascades = []
+        critical_threshold = current_price * CRITICAL_DISTANCE_PERCENT
 
-            for price_level in short_levels[:20]:  # Limit to top 20 levels
-                try:
-                    position_ids = contract.functions.getLiquidationMappingsFromPrice(price_level).call()
+        for price_level in short_levels:
+            position_ids = mappings.get(price_level)
 
-                    distance_pct = abs(price_level - current_price) / current_price * 100
+            if position_ids is None:
+                continue
 
-                    cascades.append({
-                        "price": price_level,
-                        "position_count": len(position_ids),
-                        "distance_percent": float(distance_pct),
-                        "direction": "short",
-                        "critical": distance_pct < 5
-                    })
+            distance = price_level - current_price
+            if distance < 0:
+                distance = -distance
 
-                except Exception as e:
-                    continue
+            cascades.append({
+                "price": price_level,
+                "position_count": len(position_ids),
+                "distance_percent": distance * 100 / current_price,
+                "direction": "short",
+                "critical": distance * 100 < critical_threshold
+            })
 
-            cascades.sort(key=lambda x: x['position_count'], reverse=True)
+        return cascades
 
-            return cascades
+    def _log(self, message: str):
+        """Log a per-market line (buffered while a market is being analyzed)"""
+        lines = getattr(self._market_output, 'lines', None)
+        if lines is not None:
+            lines.append(message)
+        else:
+            logger.info(message)
 
-        except Exception as e:
-            print(f"    ⚠️  Error analyzing short cascades: {e}")
-            return []
+    def analyze_market(self, market: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+        """
+        Analyze liquidation cascades for a single market
 
-    def analyze_market(self, market: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze liquidation cascades for a single market"""
-        print(f"\n{'='*80}")
-        print(f"{market['name']} (Market #{market['market_number']})")
-        print(f"{'='*80}")
-        print(f"PositionManager: {market['position_manager']}")
+        Runs on a worker thread. The market's output is buffered and returned,
+        so the collecting thread logs it as one record (in market order, and
+        inside the caller's captured_output block).
 
-        contract = self.w3_helper.w3.eth.contract(
-            address=market['position_manager'],
-            abi=self.pm_abi
-        )
+        Returns:
+            (market_result, buffered output)
+        """
+        self._market_output.lines = []
+        try:
+            market_result = self._analyze_market(market)
+            return market_result, "\n".join(self._market_output.lines)
+        finally:
+            self._market_output.lines = None
+
+    def _analyze_market(self, market: Dict[str, Any]) -> Dict[str, Any]:
+        """Analyze liquidation cascades for a single market (output buffered by analyze_market)"""
+        self._log(f"\n{'='*80}")
+        self._log(f"{market['name']} (Market #{market['market_number']})")
+        self._log(f"{'='*80}")
+        self._log(f"PositionManager: {market['position_manager']}")
 
         # Get estimated current price
-        current_price = self.get_current_price_estimate(contract, market['name'])
-        print(f"    Reference Price: ${current_price / 1e8:,.2f}")
+        current_price = self.get_current_price_estimate(market['name'])
+        self._log(f"    Reference Price: ${current_price / 1e8:,.2f}")
+
+        # Stage 1: liquidation price levels (one multicall)
+        long_result, short_result = self.get_liquidation_levels(market['position_manager'], current_price)
+
+        # Stage 2: position IDs at every retained level, longs + shorts (one multicall)
+        mappings = self.get_liquidation_mappings(
+            market['position_manager'],
+            (long_result[0] if long_result else []) + (short_result[0] if short_result else [])
+        )
 
         # Analyze both long and short cascades
-        long_cascades = self.analyze_long_cascades(contract, current_price, market['name'])
-        short_cascades = self.analyze_short_cascades(contract, current_price, market['name'])
+        long_cascades = self.analyze_long_cascades(current_price, long_result, mappings)
+        short_cascades = self.analyze_short_cascades(current_price, short_result, mappings)
 
         all_cascades = long_cascades + short_cascades
 
-        # Filter critical zones
-        critical_cascades = [c for c in all_cascades if c['critical']]
+        # Filter critical zones (largest first, as written to the results file)
+        critical_cascades = sorted(
+            (c for c in all_cascades if c['critical']),
+            key=lambda c: c['position_count'],
+            reverse=True
+        )
 
-        # Find max cascade
-        max_cascade = max(all_cascades, key=lambda x: x['position_count']) if all_cascades else None
+        # Top cascades by position count (only the top 10 are reported - no full sort)
+        top_cascades = heapq.nlargest(10, all_cascades, key=lambda x: x['position_count'])
+        max_cascade = top_cascades[0] if top_cascades else None
 
         market_result = {
             "market_number": market['market_number'],
@@ -314,111 +385,116 @@ class LiquidationCascadeAnalyzer:
                     "distance_percent": max_cascade['distance_percent'] if max_cascade else 0
                 } if max_cascade else None
             },
-            "cascades": all_cascades[:10],  # Top 10 cascades
+            "cascades": top_cascades,  # Top 10 cascades
             "critical_cascades": critical_cascades
         }
 
         # Update statistics
-        stats = self.results["statistics"]
-        stats["total_cascade_zones"] += len(all_cascades)
-        stats["total_critical_zones"] += len(critical_cascades)
+        with self._stats_lock:
+            stats = self.results["statistics"]
+            stats["total_cascade_zones"] += len(all_cascades)
+            stats["total_critical_zones"] += len(critical_cascades)
 
-        if max_cascade:
-            if max_cascade['position_count'] > stats["max_cascade_size"]:
-                stats["max_cascade_size"] = max_cascade['position_count']
+            if max_cascade:
+                if max_cascade['position_count'] > stats["max_cascade_size"]:
+                    stats["max_cascade_size"] = max_cascade['position_count']
 
-            stats["total_positions_at_risk"] += sum(c['position_count'] for c in all_cascades)
+                stats["total_positions_at_risk"] += sum(c['position_count'] for c in all_cascades)
 
         # Print summary
-        print(f"\n  📊 Cascade Summary:")
-        print(f"     Total Cascade Zones:    {len(all_cascades)}")
-        print(f"     Critical Zones (<5%):   {len(critical_cascades)}")
-        print(f"     Long Cascade Zones:     {len(long_cascades)}")
-        print(f"     Short Cascade Zones:    {len(short_cascades)}")
+        self._log(f"\n  📊 Cascade Summary:")
+        self._log(f"     Total Cascade Zones:    {len(all_cascades)}")
+        self._log(f"     Critical Zones (<5%):   {len(critical_cascades)}")
+        self._log(f"     Long Cascade Zones:     {len(long_cascades)}")
+        self._log(f"     Short Cascade Zones:    {len(short_cascades)}")
 
         if max_cascade:
-            print(f"\n  ⚠️  Maximum Cascade:")
-            print(f"     Price Level: ${max_cascade['price'] / 1e8:,.2f}")
-            print(f"     Position Count: {max_cascade['position_count']}")
-            print(f"     Direction: {max_cascade['direction'].upper()}")
-            print(f"     Distance: {max_cascade['distance_percent']:.2f}%")
+            self._log(f"\n  ⚠️  Maximum Cascade:")
+            self._log(f"     Price Level: ${max_cascade['price'] / 1e8:,.2f}")
+            self._log(f"     Position Count: {max_cascade['position_count']}")
+            self._log(f"     Direction: {max_cascade['direction'].upper()}")
+            self._log(f"     Distance: {max_cascade['distance_percent']:.2f}%")
 
             if max_cascade['critical']:
-                print(f"     🚨 CRITICAL - Within 5% of current price!")
+                self._log(f"     🚨 CRITICAL - Within 5% of current price!")
 
         if critical_cascades:
-            print(f"\n  🚨 Critical Zones:")
+            self._log(f"\n  🚨 Critical Zones:")
             for cascade in critical_cascades[:5]:
-                print(f"     ${cascade['price'] / 1e8:,.2f}: {cascade['position_count']} {cascade['direction']}s ({cascade['distance_percent']:.2f}% away)")
+                self._log(f"     ${cascade['price'] / 1e8:,.2f}: {cascade['position_count']} {cascade['direction']}s ({cascade['distance_percent']:.2f}% away)")
 
         return market_result
 
     def verify_all_markets(self):
         """Analyze cascades for all markets"""
-        print("="*80)
-        print("LIQUIDATION CASCADE ANALYSIS")
-        print("="*80)
-        print("\nIdentifies price levels where multiple positions liquidate")
-        print("Critical zones: Within 5% of current price")
+        logger.info("="*80)
+        logger.info("LIQUIDATION CASCADE ANALYSIS")
+        logger.info("="*80)
+        logger.info("\nIdentifies price levels where multiple positions liquidate")
+        logger.info("Critical zones: Within 5% of current price")
 
         markets = self.get_markets_to_verify()
 
         if self.sample_size:
-            print(f"\n⚠️  Sample mode: Analyzing first {self.sample_size} markets only")
+            logger.info(f"\n⚠️  Sample mode: Analyzing first {self.sample_size} markets only")
         else:
-            print(f"\n✅ Full analysis: {len(markets)} markets")
+            logger.info(f"\n✅ Full analysis: {len(markets)} markets")
+
+        logger.info(f"\n⚠️  NOTE: Using placeholder prices (production would query Pyth oracle)")
 
-        print(f"\n⚠️  NOTE: Using placeholder prices (production would query Pyth oracle)")
+        # Markets are independent and I/O-bound - analyze them concurrently
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            market_results = list(executor.map(self.analyze_market, markets))
+
+        for market_result, output in market_results:
+            logger.info(output)
 
-        for market in markets:
-            market_result = self.analyze_market(market)
             self.results["markets"].append(market_result)
             self.results["statistics"]["total_markets"] += 1
 
     def generate_report(self):
         """Generate summary report"""
-        print(f"\n{'='*80}")
-        print(f"CASCADE ANALYSIS SUMMARY")
-        print(f"{'='*80}")
+        logger.info(f"\n{'='*80}")
+        logger.info(f"CASCADE ANALYSIS SUMMARY")
+        logger.info(f"{'='*80}")
 
         stats = self.results["statistics"]
 
-        print(f"\n📊 Aggregate Statistics:")
-        print(f"   Markets Analyzed:          {stats['total_markets']}")
-        print(f"   Total Cascade Zones:       {stats['total_cascade_zones']}")
-        print(f"   Critical Zones (<5%):      {stats['total_critical_zones']}")
-        print(f"   Largest Cascade:           {stats['max_cascade_size']} positions")
-        print(f"   Total Positions at Risk:   {stats['total_positions_at_risk']}")
+        logger.info(f"\n📊 Aggregate Statistics:")
+        logger.info(f"   Markets Analyzed:          {stats['total_markets']}")
+        logger.info(f"   Total Cascade Zones:       {stats['total_cascade_zones']}")
+        logger.info(f"   Critical Zones (<5%):      {stats['total_critical_zones']}")
+        logger.info(f"   Largest Cascade:           {stats['max_cascade_size']} positions")
+        logger.info(f"   Total Positions at Risk:   {stats['total_positions_at_risk']}")
 
-        print(f"\n🎯 Risk Assessment:")
+        logger.info(f"\n🎯 Risk Assessment:")
         if stats['total_critical_zones'] == 0:
-            print(f"   ✅ No critical cascade zones detected")
-            print(f"   ✅ Low liquidation cascade risk")
+            logger.info(f"   ✅ No critical cascade zones detected")
+            logger.info(f"   ✅ Low liquidation cascade risk")
         else:
-            print(f"   ⚠️  {stats['total_critical_zones']} critical cascade zones detected")
+            logger.info(f"   ⚠️  {stats['total_critical_zones']} critical cascade zones detected")
 
             if stats['max_cascade_size'] > 10:
-                print(f"   🚨 LARGE CASCADE RISK - {stats['max_cascade_size']} positions at single level")
+                logger.info(f"   🚨 LARGE CASCADE RISK - {stats['max_cascade_size']} positions at single level")
             elif stats['max_cascade_size'] > 5:
-                print(f"   ⚠️  MODERATE CASCADE RISK - {stats['max_cascade_size']} positions at single level")
+                logger.info(f"   ⚠️  MODERATE CASCADE RISK - {stats['max_cascade_size']} positions at single level")
             else:
-                print(f"   ✅ LOW CASCADE RISK - Max {stats['max_cascade_size']} positions at single level")
+                logger.info(f"   ✅ LOW CASCADE RISK - Max {stats['max_cascade_size']} positions at single level")
 
-        print(f"\n💡 Methodology:")
-        print(f"   ✅ Uses PositionManager.findLiquidatablePrices*()")
-        print(f"   ✅ Identifies exact liquidation price levels")
-        print(f"   ✅ Counts positions per level")
-        print(f"   ⚠️  Note: Uses placeholder prices (production needs Pyth oracle)")
+        logger.info(f"\n💡 Methodology:")
+        logger.info(f"   ✅ Uses PositionManager.findLiquidatablePrices*()")
+        logger.info(f"   ✅ Identifies exact liquidation price levels")
+        logger.info(f"   ✅ Counts positions per level")
+        logger.info(f"   ⚠️  Note: Uses placeholder prices (production needs Pyth oracle)")
 
     def save_results(self, filename: str = "liquidation_cascades_analyzed.json"):
         """Save results to JSON file"""
         output_path = Path("results") / filename
         output_path.parent.mkdir(exist_ok=True)
 
-        with open(output_path, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        dump_json(self.results, output_path)
 
-        print(f"\n✅ Results saved to: {output_path}")
+        logger.info(f"\n✅ Results saved to: {output_path}")
 
     def run(self):
         """Run full analysis"""
@@ -427,18 +503,35 @@ class LiquidationCascadeAnalyzer:
             self.generate_report()
             self.save_results()
 
-            print("\n" + "="*80)
-            print("ANALYSIS COMPLETE")
-            print("="*80)
+            logger.info("\n" + "="*80)
+            logger.info("ANALYSIS COMPLETE")
+            logger.info("="*80)
 
         except Exception as e:
-            print(f"\n❌ ERROR: {e}")
+            logger.error(f"\n❌ ERROR: {e}")
             import traceback
             traceback.print_exc()
             sys.exit(1)
 
 
-def main():
+def configure_logging(quiet: bool = False):
+    """
+    Send this module's log records to stdout as plain messages
+
+    Configures the module logger rather than the root logger: basicConfig()
+    is a no-op once anything else in the (shared, in-process) interpreter
+    has configured logging. The handler is added once and re-pointed at the
+    current sys.stdout on every call, so suite runners can capture it.
+    """
+    _stdout_handler.setStream(sys.stdout)
+    if _stdout_handler not in logger.handlers:
+        logger.addHandler(_stdout_handler)
+
+    logger.setLevel(logging.WARNING if quiet else logging.INFO)
+    logger.propagate = False
+
+
+def main(argv=None):
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -449,11 +542,24 @@ def main():
         type=int,
         help='Analyze only first N markets (for testing)'
     )
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Only print warnings and errors'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=8,
+        help='Number of markets analyzed concurrently (default: 8)'
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     sample_size = args.sample if args.sample else None
 
-    analyzer = LiquidationCascadeAnalyzer(sample_size=sample_size)
+    configure_logging(quiet=args.quiet)
+
+    analyzer = LiquidationCascadeAnalyzer(sample_size=sample_size, max_workers=args.workers)
     analyzer.run()
 
 
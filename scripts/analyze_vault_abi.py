@@ -6,46 +6,58 @@ CRITICAL: Vault contracts hold all user USDC collateral.
 This script examines what can be verified about vault state and security.
 """
 
+import re
 import sys
-import json
+import functools
+import threading
 from pathlib import Path
 
 # Add utils to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from utils.routescan_api import RoutescanAPI
+from utils.json_io import dump_json
+from utils.web3_helpers import function_selector
+
+# Keyword patterns, compiled once (one case-insensitive search per ABI name)
+SECURITY_VIEW_RE = re.compile(
+    r"balance|reserve|collateral|total|vault|usdc|asset|inflow|outflow|solvency|health|deficit",
+    re.IGNORECASE
+)
+SECURITY_WRITE_RE = re.compile(r"deposit|withdraw|transfer|send|move|claim|rescue|drain", re.IGNORECASE)
+ACCESS_CONTROL_RE = re.compile(r"owner|role|grant|revoke|admin", re.IGNORECASE)
+
+SECURITY_EVENT_RE = re.compile(
+    r"deposit|withdraw|transfer|send|inflow|outflow|moved|claimed",
+    re.IGNORECASE
+)
+CRITICAL_EVENT_RE = re.compile(r"deficit|underfund|shortage|insolvency", re.IGNORECASE)
+ACCESS_EVENT_RE = re.compile(r"owner|role|grant|revoke", re.IGNORECASE)
 
 def categorize_function(func):
     """Categorize function by type and security relevance"""
-    name = func.get('name', '')
-    state_mutability = func.get('stateMutability', '')
+    return _categorize_function(func.get('name', ''), func.get('stateMutability', ''), func['type'])
 
+@functools.lru_cache(maxsize=1024)
+def _categorize_function(name, state_mutability, func_type):
+    """Memoized on the fields that decide the bucket (ABIs share many functions)"""
     # View/pure functions (read-only)
-    if state_mutability in ['view', 'pure']:
+    if state_mutability in ('view', 'pure'):
         # Security-critical view functions
-        if any(keyword in name.lower() for keyword in [
-            'balance', 'reserve', 'collateral', 'total',
-            'vault', 'usdc', 'asset', 'inflow', 'outflow',
-            'solvency', 'health', 'deficit'
-        ]):
+        if SECURITY_VIEW_RE.search(name):
             return 'SECURITY_VIEW'
 
         # General view functions
         return 'VIEW'
 
     # State-changing functions
-    elif func['type'] == 'function':
+    elif func_type == 'function':
         # Fund movement functions
-        if any(keyword in name.lower() for keyword in [
-            'deposit', 'withdraw', 'transfer', 'send',
-            'move', 'claim', 'rescue', 'drain'
-        ]):
+        if SECURITY_WRITE_RE.search(name):
             return 'SECURITY_WRITE'
 
         # Access control
-        if any(keyword in name.lower() for keyword in [
-            'owner', 'role', 'grant', 'revoke', 'admin'
-        ]):
+        if ACCESS_CONTROL_RE.search(name):
             return 'ACCESS_CONTROL'
 
         return 'WRITE'
@@ -54,29 +66,51 @@ def categorize_function(func):
 
 def categorize_event(event):
     """Categorize event by security relevance"""
-    name = event.get('name', '')
+    return _categorize_event(event.get('name', ''))
 
+@functools.lru_cache(maxsize=1024)
+def _categorize_event(name):
+    """Memoized on the event name"""
     # Fund movement events
-    if any(keyword in name.lower() for keyword in [
-        'deposit', 'withdraw', 'transfer', 'send',
-        'inflow', 'outflow', 'moved', 'claimed'
-    ]):
+    if SECURITY_EVENT_RE.search(name):
         return 'SECURITY_EVENT'
 
     # Underfunding/deficit events
-    if any(keyword in name.lower() for keyword in [
-        'deficit', 'underfund', 'shortage', 'insolvency'
-    ]):
+    if CRITICAL_EVENT_RE.search(name):
         return 'CRITICAL_EVENT'
 
     # Access control events
-    if any(keyword in name.lower() for keyword in [
-        'owner', 'role', 'grant', 'revoke'
-    ]):
+    if ACCESS_EVENT_RE.search(name):
         return 'ACCESS_EVENT'
 
     return 'REGULAR_EVENT'
 
+def build_selector_index(abi):
+    """
+    Map each function's 4-byte selector to its category
+
+    Returns:
+        {"0x12345678": "SECURITY_VIEW", ...}
+    """
+    index = {}
+
+    for func in abi:
+        if func.get('type') != 'function':
+            continue
+
+        signature = f"{func['name']}({','.join(canonical_type(i) for i in func.get('inputs', []))})"
+        index[f"0x{function_selector(signature).hex()}"] = categorize_function(func)
+
+    return index
+
+def canonical_type(param):
+    """Canonical ABI type for signatures (tuples expand to their components)"""
+    type_ = param['type']
+    if type_.startswith('tuple'):
+        components = ','.join(canonical_type(c) for c in param.get('components', []))
+        return f"({components}){type_[len('tuple'):]}"
+    return type_
+
 def analyze_vault_abi(address):
     """Fetch and analyze Vault contract ABI"""
 
@@ -113,16 +147,20 @@ def analyze_vault_abi(address):
         'OTHER': []               # Constructors, fallback, etc.
     }
 
+    # Single pass: categorize and count functions/events together
+    total_functions = 0
+    total_events = 0
+
     for item in abi:
         item_type = item.get('type', '')
 
         if item_type == 'function':
-            category = categorize_function(item)
-            categories[category].append(item)
+            total_functions += 1
+            categories[categorize_function(item)].append(item)
 
         elif item_type == 'event':
-            category = categorize_event(item)
-            categories[category].append(item)
+            total_events += 1
+            categories[categorize_event(item)].append(item)
 
         else:
             categories['OTHER'].append(item)
@@ -230,26 +268,29 @@ def analyze_vault_abi(address):
     print("5. Are there emergency withdrawal functions?")
     print("6. Are there any underfunding events?")
 
-    # Save detailed analysis
+    # Save detailed analysis in the background (non-daemon thread, so the
+    # interpreter still waits for the write to finish before exiting)
     output_file = Path("cache") / f"vault_abi_analysis_{address.lower()}.json"
-    with open(output_file, 'w') as f:
-        json.dump({
-            "address": address,
-            "analysis_categories": {
-                category: [item['name'] for item in items]
-                for category, items in categories.items()
-            },
-            "full_abi": abi,
-            "statistics": {
-                "total_functions": len([i for i in abi if i['type'] == 'function']),
-                "total_events": len([i for i in abi if i['type'] == 'event']),
-                "security_view": len(categories['SECURITY_VIEW']),
-                "security_write": len(categories['SECURITY_WRITE']),
-                "security_events": len(categories['SECURITY_EVENT'])
-            }
-        }, f, indent=2)
-
-    print(f"\n✅ Detailed analysis saved to: {output_file}")
+    analysis = {
+        "address": address,
+        "analysis_categories": {
+            category: [item['name'] for item in items]
+            for category, items in categories.items()
+        },
+        "selector_index": build_selector_index(abi),
+        "full_abi": abi,
+        "statistics": {
+            "total_functions": total_functions,
+            "total_events": total_events,
+            "security_view": len(categories['SECURITY_VIEW']),
+            "security_write": len(categories['SECURITY_WRITE']),
+            "security_events": len(categories['SECURITY_EVENT'])
+        }
+    }
+
+    threading.Thread(target=dump_json, args=(analysis, output_file), name="save-analysis").start()
+
+    print(f"\n✅ Detailed analysis saving to: {output_file}")
 
     return categories, abi
 
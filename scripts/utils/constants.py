@@ -0,0 +1,14 @@
+"""
+Shared TradeSta protocol constants
+
+Single definition of on-chain identifiers used across scripts.
+"""
+
+# MarketRegistry (market factory)
+MARKET_REGISTRY = '0x60f16b09a15f0c3210b40a735b19a6baf235dd18'
+
+# MarketCreated(bytes32 indexed pricefeedId, address indexed positionManager, address indexed orderManager, ...)
+MARKET_CREATED_SIG = '0x5eb977f82e9d0d89f65f05a56a99ab87e2ebb3909780e0b3642bec962789ba7a'
+
+# TradeSta deployment start
+DEPLOYMENT_BLOCK = 63_000_000
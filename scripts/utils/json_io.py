@@ -0,0 +1,197 @@
+"""
+JSON file helpers for TradeSta verification
+
+Uses orjson when it is installed (several times faster than the stdlib
+json module for both parsing and serialization) and falls back to the
+stdlib otherwise, so the package still runs with only the core
+requirements.
+
+- Paths ending in .gz are transparently gzip-compressed
+- Writes are atomic (temp file + os.replace), so an interrupted run never
+  leaves a truncated file behind
+- JSONListWriter streams one list field item by item (memory stays flat
+  however many items are written)
+- JSONLinesWriter appends one JSON document per line, flushed as written
+  (checkpoints that survive a crash)
+"""
+
+import os
+import gzip
+import json
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+PathLike = Union[str, Path]
+
+
+def _is_gzip(path: PathLike) -> bool:
+    return str(path).endswith('.gz')
+
+
+def read_raw(path: PathLike) -> bytes:
+    """Read a (possibly gzipped) JSON file as raw bytes without parsing it"""
+    opener = gzip.open if _is_gzip(path) else open
+    with opener(path, 'rb') as f:
+        return f.read()
+
+
+def load_json(path: PathLike) -> Any:
+    """
+    Read and parse a JSON file
+
+    Note: orjson parses integers wider than 64 bits as floats. Files read
+    through this helper (caches, market index, deployment lists) only hold
+    hex strings and block-sized integers.
+    """
+    data = read_raw(path)
+
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def _serialize(obj: Any, indent: bool) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            # orjson rejects integers wider than 64 bits - use the stdlib instead
+            pass
+
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def _atomic_temp(path: PathLike):
+    """Open a unique temp file next to path (concurrent writers never share one)"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+    return os.fdopen(fd, 'wb'), tmp_path
+
+
+def _atomic_commit(tmp_path: str, path: PathLike):
+    os.chmod(tmp_path, 0o644)  # mkstemp creates files as 0600
+    os.replace(tmp_path, path)
+
+
+def dump_json(obj: Any, path: PathLike, indent: bool = True):
+    """
+    Serialize obj to a JSON file
+
+    Args:
+        obj: JSON-serializable object
+        path: Output file (gzip-compressed if it ends in .gz)
+        indent: Pretty-print with 2-space indentation
+    """
+    data = _serialize(obj, indent)
+
+    f, tmp_path = _atomic_temp(path)
+    try:
+        with f:
+            if _is_gzip(path):
+                with gzip.GzipFile(fileobj=f, mode='wb') as gz:
+                    gz.write(data)
+            else:
+                f.write(data)
+        _atomic_commit(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class JSONListWriter:
+    """
+    Write a JSON object whose list field is appended one item at a time
+
+    The list is written first, then the remaining fields on close(), so
+    items never need to be held in memory. The file only appears (via an
+    atomic rename) once close() succeeds; discard() drops it.
+
+    Usage:
+        writer = JSONListWriter("results/out.json", "markets")
+        writer.append({...})
+        writer.close({"statistics": {...}})
+    """
+
+    def __init__(self, path: PathLike, list_key: str):
+        """
+        Args:
+            path: Output file (plain JSON)
+            list_key: Name of the streamed list field
+        """
+        self.path = path
+        self._file, self._tmp_path = _atomic_temp(path)
+        self._count = 0
+
+        self._file.write(b'{' + _serialize(list_key, False) + b': [\n')
+
+    def append(self, item: Any):
+        """Write one list item"""
+        if self._count:
+            self._file.write(b',\n')
+        self._file.write(_serialize(item, True))
+        self._count += 1
+
+    def close(self, fields: Dict[str, Any]):
+        """Write the remaining fields and move the file into place"""
+        self._file.write(b'\n]')
+        for key, value in fields.items():
+            self._file.write(b',\n' + _serialize(key, False) + b': ' + _serialize(value, True))
+        self._file.write(b'\n}\n')
+        self._file.close()
+        _atomic_commit(self._tmp_path, self.path)
+
+    def discard(self):
+        """Drop the partially written file"""
+        self._file.close()
+        os.unlink(self._tmp_path)
+
+
+def load_json_lines(path: PathLike) -> List[Any]:
+    """
+    Read a JSON-lines file (one JSON document per line)
+
+    A truncated last line - left by a crash mid-write - is ignored.
+    """
+    with open(path, 'rb') as f:
+        lines = [line for line in f.read().split(b'\n') if line.strip()]
+
+    items = []
+    for i, line in enumerate(lines):
+        try:
+            items.append(orjson.loads(line) if orjson is not None else json.loads(line))
+        except ValueError:
+            if i != len(lines) - 1:
+                raise
+
+    return items
+
+
+class JSONLinesWriter:
+    """
+    Append JSON documents to a file, one per line
+
+    Each line is flushed as it is written, so everything written before a
+    crash can be read back with load_json_lines(). Not atomic by design.
+    """
+
+    def __init__(self, path: PathLike):
+        """
+        Args:
+            path: Output file (plain JSON lines, replaced if it exists)
+        """
+        self.path = path
+        self._file = open(path, 'wb')
+
+    def write(self, item: Any):
+        """Write one document as a line"""
+        self._file.write(_serialize(item, False) + b'\n')
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
@@ -0,0 +1,69 @@
+"""
+In-process LRU cache with per-entry expiry for TradeSta verification
+
+Used to memoize read-only RPC/API results:
+- Data pinned to a mined block or transaction never changes (no expiry)
+- Data read at "latest" is only reused for a few seconds
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+# Returned by get() on a miss (None is a valid cached value)
+MISSING = object()
+
+
+class LRUCacheTTL:
+    """Thread-safe LRU cache whose entries can expire after a time-to-live"""
+
+    def __init__(self, maxsize: int = 10_000, ttl: Optional[float] = 300):
+        """
+        Args:
+            maxsize: Max number of entries (least recently used are evicted first)
+            ttl: Default time-to-live in seconds (None = never expires)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at or None, value)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for key, or MISSING if absent/expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+
+            expires_at, value = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._entries[key]
+                return MISSING
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = MISSING):
+        """
+        Store value under key
+
+        Args:
+            ttl: Time-to-live for this entry (default: the cache's ttl, None = never expires)
+        """
+        if ttl is MISSING:
+            ttl = self.ttl
+
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,165 @@
+"""
+MarketRegistry index for TradeSta verification
+
+Keeps a persistent index of MarketCreated events so each run only scans
+blocks produced since the previous run:
+- Stored in cache/markets.json as {"last_block": int, "markets": [...]}
+- Atomic rewrites (via json_io.dump_json)
+- File lock around read-modify-write so concurrent runs are safe
+- Rebuilt from scratch (and rewritten) when the API's read_disk_cache is off
+"""
+
+import fcntl
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Any
+
+from .routescan_api import RoutescanAPI, RoutescanAPIError
+from .json_io import load_json, dump_json
+from .constants import MARKET_REGISTRY, MARKET_CREATED_SIG, DEPLOYMENT_BLOCK
+
+# An address topic is 32 bytes; the address is the last 20 bytes (40 hex chars)
+TOPIC_ADDRESS_SLICE = slice(-40, None)
+
+# Block range per parallel getLogs chunk. Routescan is rate limited to 2 req/sec,
+# so chunks are sized in the 1M-block range (see PAGINATION_TEST_FINDINGS.md)
+# rather than the ~5k blocks typical for raw RPC providers.
+LOG_CHUNK_BLOCKS = 1_000_000
+LOG_CHUNK_WORKERS = 4
+
+
+class MarketRegistryIndex:
+    """Incrementally maintained index of markets created by the MarketRegistry"""
+
+    def __init__(self, api: RoutescanAPI = None, cache_dir: str = "cache"):
+        self.api = api or RoutescanAPI(cache_dir=cache_dir)
+        self.index_file = Path(cache_dir) / "markets.json"
+        self.lock_file = Path(cache_dir) / "markets.json.lock"
+        self.index_file.parent.mkdir(exist_ok=True)
+
+        self.last_block = DEPLOYMENT_BLOCK - 1
+        self.markets: List[Dict[str, Any]] = []
+        self._indexed = False  # True once loaded from disk or scanned
+        self._load()
+
+    @contextmanager
+    def _locked(self):
+        """Hold an exclusive lock on the index for the duration of the block"""
+        with open(self.lock_file, 'w') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _load(self):
+        """Load index from disk (empty index if not yet created or the disk cache is bypassed)"""
+        if self.api.read_disk_cache and self.index_file.exists():
+            index = load_json(self.index_file)
+            self.last_block = index['last_block']
+            self.markets = index['markets']
+            self._indexed = True
+
+    def _save(self):
+        """Atomically rewrite the index file"""
+        dump_json({
+            "last_block": self.last_block,
+            "markets": self.markets
+        }, self.index_file)
+
+    def _registry_deployment_block(self) -> int:
+        """
+        Block the MarketRegistry was deployed in
+
+        Only needed for the first scan of a fresh index, so it never scans
+        blocks before the registry existed. Falls back to DEPLOYMENT_BLOCK
+        if the creation transaction can't be resolved.
+        """
+        try:
+            creation = self.api.get_contract_creation([MARKET_REGISTRY])
+            if creation:
+                receipt = self.api.get_transaction_receipt(creation[0]['txHash'])
+                if receipt and receipt.get('blockNumber'):
+                    return int(receipt['blockNumber'], 16)
+        except RoutescanAPIError:
+            pass  # Scan from DEPLOYMENT_BLOCK instead
+
+        return DEPLOYMENT_BLOCK
+
+    @staticmethod
+    def parse_market_created(event: Dict[str, Any], market_number: int) -> Dict[str, Any]:
+        """
+        Parse a MarketCreated event log into a market record
+
+        Returns:
+            Market record (addresses normalized to lowercase once, here):
+            {
+                "market_number": 1,
+                "block": 63...,
+                "tx_hash": "0x...",
+                "pricefeed_id": "0x...",
+                "position_manager": "0x...",
+                "order_manager": "0x..."
+            }
+        """
+        topics = event['topics']
+
+        return {
+            "market_number": market_number,
+            "block": int(event['blockNumber'], 16),
+            "tx_hash": event['transactionHash'],
+            "pricefeed_id": topics[1],
+            "position_manager": f"0x{topics[2][TOPIC_ADDRESS_SLICE]}".lower(),
+            "order_manager": f"0x{topics[3][TOPIC_ADDRESS_SLICE]}".lower()
+        }
+
+    def update(self, latest_block: int, verbose: bool = False) -> List[Dict[str, Any]]:
+        """
+        Scan blocks since the last update and append any new markets
+
+        Args:
+            latest_block: Scan up to (and including) this block
+            verbose: Print scan progress (block range, chunk and event counts)
+
+        Returns:
+            List of markets discovered by this update
+        """
+        with self._locked():
+            self._load()
+
+            if not self._indexed:
+                self.last_block = self._registry_deployment_block() - 1
+
+            from_block = self.last_block + 1
+            if from_block > latest_block:
+                return []
+
+            if verbose:
+                print(f"  Market index: scanning blocks {from_block:,} → {latest_block:,}")
+
+            events = self.api.get_all_logs_chunked(
+                address=MARKET_REGISTRY,
+                topic0=MARKET_CREATED_SIG,
+                from_block=from_block,
+                to_block=latest_block,
+                chunk=LOG_CHUNK_BLOCKS,
+                workers=LOG_CHUNK_WORKERS,
+                verbose=verbose
+            )
+
+            new_markets = [
+                self.parse_market_created(event, len(self.markets) + i)
+                for i, event in enumerate(events, 1)
+            ]
+
+            self.markets.extend(new_markets)
+            self.last_block = latest_block
+            self._indexed = True
+            self._save()
+
+        return new_markets
+
+    def get_markets(self, latest_block: int, verbose: bool = False) -> List[Dict[str, Any]]:
+        """Bring the index up to latest_block and return all known markets"""
+        self.update(latest_block, verbose=verbose)
+        return self.markets
@@ -0,0 +1,65 @@
+"""
+Per-thread output capture for TradeSta verification
+
+Lets the suite runners execute several verification scripts in-process on
+parallel threads while still printing each script's log as one block:
+- sys.stdout/sys.stderr are replaced (once) by routers
+- A thread inside captured_output() writes to its own buffer
+- Every other thread writes straight through to the real stream
+"""
+
+import io
+import sys
+import threading
+from contextlib import contextmanager
+
+_install_lock = threading.Lock()
+_local = threading.local()
+
+
+class _ThreadRouter:
+    """File-like object that sends writes to the current thread's buffer, if any"""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        buffer = getattr(_local, 'buffer', None)
+        return (buffer if buffer is not None else self._stream).write(text)
+
+    def flush(self):
+        if getattr(_local, 'buffer', None) is None:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _install():
+    """Replace sys.stdout/sys.stderr with routers (idempotent)"""
+    with _install_lock:
+        if not isinstance(sys.stdout, _ThreadRouter):
+            sys.stdout = _ThreadRouter(sys.stdout)
+        if not isinstance(sys.stderr, _ThreadRouter):
+            sys.stderr = _ThreadRouter(sys.stderr)
+
+
+@contextmanager
+def captured_output():
+    """
+    Capture everything the current thread prints (stdout and stderr)
+
+    Output from threads started inside the block is not captured; it is
+    written through immediately.
+
+    Yields:
+        io.StringIO holding the captured text
+    """
+    _install()
+
+    buffer = io.StringIO()
+    _local.buffer = buffer
+    try:
+        yield buffer
+    finally:
+        _local.buffer = None
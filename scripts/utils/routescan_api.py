@@ -3,54 +3,238 @@ Routescan API wrapper for TradeSta verification
 
 Provides high-level functions for querying Routescan API with:
 - Automatic pagination support
+- Parallel block-range chunking
 - Rate limiting
+- Pooled keep-alive connections with retries
 - Error handling
-- Result caching
+- Result caching (memory → disk → network)
 """
 
+import os
 import requests
 import time
 import json
-from typing import Dict, List, Any, Optional
+import threading
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from typing import Dict, List, Any, Callable, Iterator, Optional, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .json_io import load_json, dump_json
+from .lru_cache import LRUCacheTTL, MISSING
+
+# Max events the API returns for one query across all pages (page * offset)
+LOG_RESULT_WINDOW = 10_000
+
+# Blocks behind the requested tip after which event counts are treated as
+# final and kept in the grouped counters' running cache (C-Chain finality
+# is ~1-2s, so this is a generous margin).
+LOG_COUNT_CONFIRMATIONS = 64
+
+# Routescan allows 2 req/sec per client. The limiter is process-wide, not per
+# RoutescanAPI instance: suite runners execute several scripts in-process at
+# once, each with its own instance.
+MIN_REQUEST_INTERVAL = 0.5
+_rate_lock = threading.Lock()
+_last_request_time = 0.0
+
+# Pages fetched concurrently once a query is known to span several pages.
+# Kept small: pages past the end are wasted requests against the daily quota.
+LOG_PAGE_PREFETCH = 3
+
+
+class RoutescanAPIError(Exception):
+    """The API answered, but with an error status (rate limit, bad query, too many results, ...)"""
+
+
+def _hex_to_int(value: str) -> int:
+    """Parse a hex quantity from the API ("0x" is returned for zero)"""
+    return int(value, 16) if value and value != "0x" else 0
+
+
+def _event_address(event: Dict[str, Any]) -> str:
+    """Contract that emitted a log"""
+    return event['address']
+
+
+def _event_topic0(event: Dict[str, Any]) -> str:
+    """topic0 of a log (empty for anonymous events)"""
+    topics = event['topics']
+    return topics[0] if topics else ""
+
+
+def _is_range_error(error: Exception) -> bool:
+    """Check whether an API error means the requested block range was too large"""
+    message = str(error).lower()
+    return "-32600" in message or "too large" in message or "block range" in message
+
 class RoutescanAPI:
     """Wrapper for Routescan API with pagination and rate limiting"""
 
-    def __init__(self, base_url: str = None, cache_dir: str = None):
+    def __init__(
+        self,
+        base_url: str = None,
+        cache_dir: str = None,
+        session: requests.Session = None,
+        read_disk_cache: bool = True
+    ):
+        """
+        Args:
+            base_url: Etherscan-compatible API endpoint (default: Routescan, Avalanche C-Chain)
+            cache_dir: Directory for the disk cache (default: cache/)
+            session: HTTP session to share with other clients (default: a new pooled
+                session owned - and closed - by this instance)
+            read_disk_cache: Reuse results cached on disk by earlier runs. When False,
+                every result is fetched again (once per run - the memory cache still
+                applies) and the disk copy is refreshed.
+        """
         self.base_url = base_url or "https://api.routescan.io/v2/network/mainnet/evm/43114/etherscan/api"
         self.cache_dir = Path(cache_dir) if cache_dir else Path("cache")
         self.cache_dir.mkdir(exist_ok=True)
+        self.read_disk_cache = read_disk_cache
+
+        # Persistent HTTP session: pooled keep-alive connections (no TCP+TLS
+        # handshake per request) and automatic retry of transient errors.
+        # raise_on_status=False hands the final response back so
+        # raise_for_status() still surfaces an HTTPError.
+        self._owns_session = session is None
+        if session is not None:
+            self.session = session
+        else:
+            retries = Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False
+            )
+            self.session = requests.Session()
+            self.session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries))
 
-        # Rate limiting
-        self.last_request_time = 0
-        self.min_request_interval = 0.5  # 2 req/sec = 0.5s interval
+        # Mined transactions/receipts never change (no expiry)
+        self._tx_cache = LRUCacheTTL(maxsize=10_000, ttl=None)
+
+        # In-memory layer in front of the disk cache (abi/source/creation)
+        self._mem_cache = LRUCacheTTL(maxsize=1024, ttl=None)
+
+    def prewarm(self) -> threading.Thread:
+        """
+        Open a pooled connection in the background, ahead of the first API call
+
+        Moves the DNS + TCP + TLS setup off the critical path: call it before
+        other startup work (e.g. the first RPC call) and the first query finds
+        a warm keep-alive connection. Not an API call, so it isn't rate limited.
+
+        Returns:
+            The (daemon) thread doing the warm-up
+        """
+        def warm_up():
+            try:
+                self.session.head(self.base_url, timeout=10)
+            except requests.RequestException:
+                pass  # The first real request connects by itself
+
+        thread = threading.Thread(target=warm_up, daemon=True)
+        thread.start()
+        return thread
+
+    def close(self):
+        """Close pooled connections (a session passed in by the caller is left open)"""
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _rate_limit(self):
-        """Enforce rate limiting"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            time.sleep(self.min_request_interval - elapsed)
-        self.last_request_time = time.time()
+        """Enforce rate limiting across every instance and thread in the process"""
+        global _last_request_time
+
+        with _rate_lock:
+            elapsed = time.time() - _last_request_time
+            if elapsed < MIN_REQUEST_INTERVAL:
+                time.sleep(MIN_REQUEST_INTERVAL - elapsed)
+            _last_request_time = time.time()
 
     def _make_request(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Make HTTP request with rate limiting"""
         self._rate_limit()
 
-        response = requests.get(self.base_url, params=params, timeout=30)
+        response = self.session.get(self.base_url, params=params, timeout=30)
         response.raise_for_status()
 
-        data = response.json()
+        # A full getLogs page is several MB - orjson parses it several times faster
+        data = orjson.loads(response.content) if orjson is not None else response.json()
+
+        # Proxy module (eth_*) responses are a JSON-RPC envelope
+        # {"jsonrpc", "id", "result" | "error"} with no status field
+        if "status" not in data:
+            error = data.get("error")
+            if error is not None or "result" not in data:
+                if isinstance(error, dict):
+                    error = f"{error.get('code', '')} {error.get('message', '')}".strip()
+                raise RoutescanAPIError(f"API error: {error if error else 'Unknown error'}")
+            return data
 
         if data.get("status") != "1":
-            # Handle "No records found" as empty result, not error
+            # Handle "No records found" as empty result, not error. A bare
+            # NOTOK is a real failure (e.g. rate limit hit) - returning it as
+            # empty would be cached as a count of 0.
             message = data.get('message', '')
-            if 'No records found' in message or message == 'NOTOK':
+            result = data.get('result')
+            if 'No records found' in message or (isinstance(result, str) and 'No records found' in result):
                 return {"status": "1", "result": []}
-            raise Exception(f"API error: {message if message else 'Unknown error'}")
+            if isinstance(result, str) and result and result != message:
+                message = f"{message} - {result}" if message else result
+            raise RoutescanAPIError(f"API error: {message if message else 'Unknown error'}")
 
         return data
 
+    def _disk_cached(self, cache_file: Path) -> bool:
+        """Check whether a disk cache file may be served (False when read_disk_cache is off)"""
+        return self.read_disk_cache and cache_file.exists()
+
+    def _cache_read(self, cache_file: Path, max_age: Optional[float] = None) -> Any:
+        """
+        Read a cached API result: memory first, then disk
+
+        Args:
+            max_age: Treat the disk copy as missing if older than this many seconds
+
+        Returns:
+            Cached value, or MISSING
+        """
+        cached = self._mem_cache.get(cache_file)
+        if cached is not MISSING:
+            return cached
+
+        if not self._disk_cached(cache_file):
+            return MISSING
+
+        ttl = None
+        if max_age is not None:
+            ttl = max_age - (time.time() - os.path.getmtime(cache_file))
+            if ttl <= 0:
+                return MISSING
+
+        cached = load_json(cache_file)
+        self._mem_cache.set(cache_file, cached, ttl=ttl)
+        return cached
+
+    def _cache_write(self, cache_file: Path, value: Any, ttl: Optional[float] = None):
+        """Write an API result to disk and to the memory cache"""
+        dump_json(value, cache_file, indent=False)
+        self._mem_cache.set(cache_file, value, ttl=ttl)
+
     def get_contract_abi(self, address: str) -> Dict[str, Any]:
         """
         Fetch contract ABI from Routescan
@@ -65,12 +249,12 @@ class RoutescanAPI:
                 "runs": 200
             }
         """
-        cache_file = self.cache_dir / f"abi_{address.lower()}.json"
+        cache_file = self.cache_dir / f"abi_{address.lower()}.json.gz"
 
         # Check cache
-        if cache_file.exists():
-            with open(cache_file) as f:
-                return json.load(f)
+        cached = self._cache_read(cache_file)
+        if cached is not MISSING:
+            return cached
 
         # Fetch from API
         params = {
@@ -80,7 +264,7 @@ class RoutescanAPI:
         }
 
         data = self._make_request(params)
-        abi = json.loads(data["result"])
+        abi = orjson.loads(data["result"]) if orjson is not None else json.loads(data["result"])
 
         result = {
             "address": address.lower(),
@@ -89,15 +273,19 @@ class RoutescanAPI:
         }
 
         # Cache result
-        with open(cache_file, 'w') as f:
-            json.dump(result, f, indent=2)
+        self._cache_write(cache_file, result)
 
         return result
 
-    def get_contract_source(self, address: str) -> Dict[str, Any]:
+    def get_contract_source(self, address: str, max_age: Optional[float] = None) -> Dict[str, Any]:
         """
         Fetch contract source code from Routescan
 
+        Args:
+            address: Contract address
+            max_age: Refetch if the cached copy is older than this many seconds
+                     (default: cached copy never expires)
+
         Returns:
             {
                 "address": "0x...",
@@ -115,11 +303,11 @@ class RoutescanAPI:
                 "swarm_source": ""
             }
         """
-        cache_file = self.cache_dir / f"source_{address.lower()}.json"
+        cache_file = self.cache_dir / f"source_{address.lower()}.json.gz"
 
-        if cache_file.exists():
-            with open(cache_file) as f:
-                return json.load(f)
+        cached = self._cache_read(cache_file, max_age)
+        if cached is not MISSING:
+            return cached
 
         params = {
             "module": "contract",
@@ -133,81 +321,134 @@ class RoutescanAPI:
         result["address"] = address.lower()
         result["cached"] = False
 
-        with open(cache_file, 'w') as f:
-            json.dump(result, f, indent=2)
+        self._cache_write(cache_file, result, max_age)
 
         return result
 
-    def get_contract_creation(self, addresses: List[str], batch_size: int = 5) -> List[Dict[str, Any]]:
+    def _fetch_many(
+        self,
+        fetch,
+        addresses: List[str],
+        workers: int,
+        errors: Tuple[type, ...] = ()
+    ) -> Dict[str, Dict[str, Any]]:
         """
-        Get contract creation transaction and deployer
+        Run a per-address fetch for many addresses in parallel
 
-        Args:
-            addresses: List of contract addresses
-            batch_size: Max addresses per API call (default 5 to avoid errors)
+        Cache hits return without touching the network; misses share the
+        global rate limit, so workers overlap request latency rather than
+        exceeding 2 req/sec.
 
-        Returns:
-            [{
-                "contractAddress": "0x...",
-                "contractCreator": "0x...",
-                "txHash": "0x..."
-            }, ...]
+        Args:
+            errors: Exception types reported as {"error": message} for that
+                address instead of aborting the whole batch
         """
-        # If few addresses, try single request first
-        if len(addresses) <= batch_size:
-            cache_key = "_".join(sorted([a.lower() for a in addresses]))
-            cache_file = self.cache_dir / f"creation_{cache_key[:32]}.json"
+        unique = list(dict.fromkeys(a.lower() for a in addresses))
 
-            if cache_file.exists():
-                with open(cache_file) as f:
-                    return json.load(f)
+        if errors:
+            unsafe_fetch = fetch
 
-            params = {
-                "module": "contract",
-                "action": "getcontractcreation",
-                "contractaddresses": ",".join(addresses)
-            }
+            def fetch(address):
+                try:
+                    return unsafe_fetch(address)
+                except errors as e:
+                    return {"error": str(e)}
 
-            try:
-                data = self._make_request(params)
-                result = data.get("result", [])
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(fetch, unique)
+            return dict(zip(unique, results))
 
-                with open(cache_file, 'w') as f:
-                    json.dump(result, f, indent=2)
+    def get_contract_abis(
+        self,
+        addresses: List[str],
+        workers: int = 4,
+        errors: Tuple[type, ...] = ()
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch ABIs for many contracts in parallel
 
-                return result
-            except Exception as e:
-                # If single request fails, fall through to batching
-                print(f"  Single request failed ({e}), switching to batch mode...")
+        Args:
+            errors: Exception types reported as {"error": message} for that
+                address instead of raising
 
-        # Batch requests
-        all_results = []
+        Returns:
+            {address (lowercase): get_contract_abi() result}
+        """
+        return self._fetch_many(self.get_contract_abi, addresses, workers, errors)
 
-        for i in range(0, len(addresses), batch_size):
-            batch = addresses[i:i+batch_size]
-            cache_key = "_".join(sorted([a.lower() for a in batch]))
-            cache_file = self.cache_dir / f"creation_{cache_key[:32]}.json"
+    def get_contract_sources(self, addresses: List[str], workers: int = 4) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch source code for many contracts in parallel
 
-            if cache_file.exists():
-                with open(cache_file) as f:
-                    all_results.extend(json.load(f))
-                continue
+        Returns:
+            {address (lowercase): get_contract_source() result}
+        """
+        return self._fetch_many(self.get_contract_source, addresses, workers)
 
-            params = {
-                "module": "contract",
-                "action": "getcontractcreation",
-                "contractaddresses": ",".join(batch)
-            }
+    def get_contract_creation(
+        self,
+        addresses: List[str],
+        batch_size: int = 5,
+        workers: int = 4
+    ) -> List[Dict[str, Any]]:
+        """
+        Get contract creation transaction and deployer
 
-            data = self._make_request(params)
-            result = data.get("result", [])
+        Creation data never changes, so each address is cached on its own:
+        any later call containing an already-seen address skips it, whatever
+        the grouping. Only uncached addresses are requested, batch_size per
+        API call, with the batches sent in parallel (sharing the rate limit).
 
-            with open(cache_file, 'w') as f:
-                json.dump(result, f, indent=2)
+        Args:
+            addresses: List of contract addresses
+            batch_size: Max addresses per API call (default 5 to avoid errors)
+            workers: Max batches in flight
+
+        Returns:
+            [{
+                "contractAddress": "0x...",
+                "contractCreator": "0x...",
+                "txHash": "0x..."
+            }, ...] in input order (addresses without creation info are omitted)
+        """
+        creations = {}
+        missing = []
+
+        for address in dict.fromkeys(a.lower() for a in addresses):
+            cached = self._cache_read(self.cache_dir / f"creation_{address}.json.gz")
+            if cached is not MISSING:
+                creations[address] = cached
+            else:
+                missing.append(address)
+
+        batches = [missing[i:i+batch_size] for i in range(0, len(missing), batch_size)]
+
+        if batches:
+            with ThreadPoolExecutor(max_workers=max(min(len(batches), workers), 1)) as executor:
+                fetched = list(executor.map(self._fetch_creation_batch, batches))
+
+            for batch_creations in fetched:
+                for creation in batch_creations:
+                    address = creation["contractAddress"].lower()
+                    creations[address] = creation
+                    self._cache_write(self.cache_dir / f"creation_{address}.json.gz", creation)
+
+        return [
+            creations[address]
+            for address in dict.fromkeys(a.lower() for a in addresses)
+            if address in creations
+        ]
 
-            all_results.extend(result)
+    def _fetch_creation_batch(self, batch: List[str]) -> List[Dict[str, Any]]:
+        """One getcontractcreation call (up to batch_size addresses)"""
+        params = {
+            "module": "contract",
+            "action": "getcontractcreation",
+            "contractaddresses": ",".join(batch)
+        }
 
-        return all_results
+        data = self._make_request(params)
+        return data.get("result", []) or []
 
     def get_logs(
         self,
@@ -250,17 +491,65 @@ class RoutescanAPI:
         topic1: Optional[str] = None,
         from_block: int = 0,
         to_block: int = 99999999,
-        offset: int = 10000
+        offset: int = 10000,
+        verbose: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Get ALL event logs by automatically paginating through results
 
         This is the recommended method for fetching events.
 
+        Args:
+            verbose: Print per-page progress (disabled for chunked fetches)
+
         Returns:
             List of event log dictionaries
         """
-        # Generate cache key
+        cache_file = self._log_cache_file(address, topic0, topic1, from_block, to_block)
+
+        # Check cache
+        if self._disk_cached(cache_file):
+            cached = load_json(cache_file)
+            if verbose:
+                print(f"  [Cache hit] Loaded {len(cached['events'])} events from cache")
+            return cached['events']
+
+        # Fetch all pages
+        all_events = list(self.iter_logs(
+            address=address,
+            topic0=topic0,
+            topic1=topic1,
+            from_block=from_block,
+            to_block=to_block,
+            offset=offset,
+            verbose=verbose
+        ))
+
+        # Cache result
+        dump_json({
+            "query": {
+                "address": address,
+                "topic0": topic0,
+                "topic1": topic1,
+                "from_block": from_block,
+                "to_block": to_block
+            },
+            "total_events": len(all_events),
+            "events": all_events
+        }, cache_file, indent=False)
+
+        return all_events
+
+    def _log_cache_file(
+        self,
+        address: Optional[str],
+        topic0: Optional[str],
+        topic1: Optional[str],
+        from_block: int,
+        to_block: int,
+        suffix: str = ".json.gz"
+    ) -> Path:
+        """Cache file for one log query (logs/ subdirectory)"""
         cache_parts = [
             f"addr_{address[:10] if address else 'all'}",
             f"t0_{topic0[:10] if topic0 else 'none'}",
@@ -268,25 +557,267 @@ class RoutescanAPI:
             f"fb_{from_block}",
             f"tb_{to_block}"
         ]
-        cache_key = "_".join(cache_parts)
-        cache_file = self.cache_dir / "logs" / f"{cache_key}.json"
+        cache_file = self.cache_dir / "logs" / ("_".join(cache_parts) + suffix)
         cache_file.parent.mkdir(exist_ok=True)
+        return cache_file
 
-        # Check cache
-        if cache_file.exists():
-            with open(cache_file) as f:
-                cached = json.load(f)
-                print(f"  [Cache hit] Loaded {len(cached['events'])} events from cache")
-                return cached['events']
+    def iter_logs(
+        self,
+        address: Optional[str] = None,
+        topic0: Optional[str] = None,
+        topic1: Optional[str] = None,
+        from_block: int = 0,
+        to_block: int = 99999999,
+        offset: int = 10000,
+        verbose: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield ALL event logs, page by page, without keeping earlier pages
 
-        # Fetch all pages
-        all_events = []
+        Pages are prefetched a few at a time and the result window is slid
+        forward when full, so memory stays at a few pages however many
+        events match. Not cached (get_all_logs() caches the full list).
+
+        Args:
+            verbose: Print per-page progress
+        """
         page = 1
+        window_from = from_block
+        skip = 0               # Events at the start of the window that were already yielded
+        last_block = None      # Block of the last yielded event
+        last_block_count = 0   # Events yielded from last_block
+        total = 0
 
-        print(f"  Fetching events (offset={offset})...")
+        if verbose:
+            print(f"  Fetching events (offset={offset})...")
 
         while True:
-            events = self.get_logs(
+            # After a full page, fetch the next few pages of the window concurrently
+            # (only pages that end inside the result window: page * offset <= window)
+            pages_left = max(LOG_RESULT_WINDOW // offset - page + 1, 1)
+            pages = list(range(page, page + (1 if page == 1 else min(LOG_PAGE_PREFETCH, pages_left))))
+
+            batch = self._get_log_pages(address, topic0, topic1, window_from, to_block, pages, offset)
+
+            last_page = None
+            for page_number, events in zip(pages, batch):
+                if not events:
+                    if verbose:
+                        print(f"    Page {page_number}: No more events")
+                    break
+
+                if verbose:
+                    print(f"    Page {page_number}: {len(events)} events")
+
+                fresh = events
+                if skip:
+                    skipped = min(skip, len(fresh))
+                    skip -= skipped
+                    fresh = fresh[skipped:]
+
+                if fresh:
+                    # Track the last block once per page rather than per event:
+                    # only the trailing run of equal blocks matters
+                    block_hex = fresh[-1]['blockNumber']
+                    run = 1
+                    while run < len(fresh) and fresh[-run - 1]['blockNumber'] == block_hex:
+                        run += 1
+
+                    block = _hex_to_int(block_hex)
+                    if run == len(fresh) and block == last_block:
+                        last_block_count += run
+                    else:
+                        last_block, last_block_count = block, run
+
+                    total += len(fresh)
+                    yield from fresh
+
+                if len(events) < offset:
+                    # Last page
+                    break
+
+                last_page = page_number
+
+            if last_page != pages[-1]:
+                # Stopped on an empty/short page (trailing speculative pages are discarded)
+                break
+
+            if (last_page + 1) * offset > LOG_RESULT_WINDOW:
+                # Full page and the next one would end past the result window -
+                # the API won't page further (offsets need not divide the
+                # window), so restart the window at the last block seen, skipping
+                # the events from that block that were already yielded.
+                if last_block == window_from:
+                    raise RoutescanAPIError(f"API error: more than {LOG_RESULT_WINDOW} events in block {last_block}")
+
+                if verbose:
+                    print(f"    Result window full, continuing from block {last_block:,}")
+
+                skip = last_block_count
+                window_from = last_block
+                page = 1
+                continue
+
+            page = last_page + 1
+
+        if verbose:
+            print(f"  Total: {total} events")
+
+    def count_logs_by_address(
+        self,
+        topic0: str,
+        addresses: Optional[List[str]] = None,
+        from_block: int = 0,
+        to_block: int = 99999999,
+        offset: int = 10000,
+        stable_to: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Count one event type for many contracts with a single query
+
+        getLogs filters on one address at most, so the query is made with
+        no address filter and the streamed events are counted per emitting
+        contract. One sweep replaces a count per address, but
+        every matching event on chain is transferred - only worth it when
+        addresses covers most emitters of topic0.
+
+        Args:
+            addresses: Contracts to report counts for (None = every emitting contract)
+            stable_to: Last block whose events can no longer change (e.g.
+                latest_block - LOG_COUNT_CONFIRMATIONS). When below to_block,
+                the counts up to stable_to are kept in a running cache that
+                each run only extends, and just the tail (stable_to, to_block]
+                is counted fresh.
+
+        Returns:
+            {address_lower: count} for every address in addresses (contracts
+            without events are absent when addresses is None)
+        """
+        counts = self._grouped_counts(
+            _event_address, None, topic0, from_block, to_block, offset, stable_to, ".by_address.count.json"
+        )
+
+        if addresses is None:
+            return dict(counts)
+
+        return {address.lower(): counts[address.lower()] for address in addresses}
+
+    def count_logs_by_topic(
+        self,
+        address: str,
+        from_block: int = 0,
+        to_block: int = 99999999,
+        offset: int = 10000,
+        stable_to: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Count every event type a contract emitted with a single query
+
+        getLogs can't OR several topic0 values, so the query is made with no
+        topic filter and the streamed events are counted per topic0. One
+        sweep replaces a count per event type; events of types
+        the caller doesn't need are transferred too.
+
+        Args:
+            stable_to: As in count_logs_by_address()
+
+        Returns:
+            {topic0_lower: count} for every event type the contract emitted
+        """
+        return dict(self._grouped_counts(
+            _event_topic0, address, None, from_block, to_block, offset, stable_to, ".by_topic.count.json"
+        ))
+
+    def _grouped_counts(
+        self,
+        group_by: Callable[[Dict[str, Any]], str],
+        address: Optional[str],
+        topic0: Optional[str],
+        from_block: int,
+        to_block: int,
+        offset: int,
+        stable_to: Optional[int],
+        suffix: str
+    ) -> Counter:
+        """
+        Count the logs of one query per group_by(event)
+
+        A fixed range is cached as a whole; with stable_to below to_block,
+        see count_logs_by_address() for the running cache.
+        """
+        if stable_to is None or stable_to >= to_block:
+            count_file = self._log_cache_file(address, topic0, None, from_block, to_block, suffix=suffix)
+
+            if self._disk_cached(count_file):
+                return Counter(load_json(count_file)["counts"])
+
+            counts = self._count_grouped(group_by, address, topic0, from_block, to_block, offset)
+
+            dump_json({
+                "query": {"address": address, "topic0": topic0, "from_block": from_block, "to_block": to_block},
+                "counts": counts
+            }, count_file, indent=False)
+
+            return counts
+
+        stable_to = max(stable_to, from_block - 1)
+        running_file = self._log_cache_file(address, topic0, None, from_block, "stable", suffix=suffix)
+
+        counted_to, counts = from_block - 1, Counter()
+        if self._disk_cached(running_file):
+            running = load_json(running_file)
+            # A running count past stable_to can't be narrowed - recount from scratch
+            if running["stable_to"] <= stable_to:
+                counted_to, counts = running["stable_to"], Counter(running["counts"])
+
+        if counted_to < stable_to:
+            counts += self._count_grouped(group_by, address, topic0, counted_to + 1, stable_to, offset)
+
+            dump_json({
+                "query": {"address": address, "topic0": topic0, "from_block": from_block},
+                "stable_to": stable_to,
+                "counts": counts
+            }, running_file, indent=False)
+
+        return counts + self._count_grouped(group_by, address, topic0, stable_to + 1, to_block, offset)
+
+    def _count_grouped(
+        self,
+        group_by: Callable[[Dict[str, Any]], str],
+        address: Optional[str],
+        topic0: Optional[str],
+        from_block: int,
+        to_block: int,
+        offset: int
+    ) -> Counter:
+        """Stream the logs of a block range and count them per group_by(event), lowercased"""
+        if from_block > to_block:
+            return Counter()
+
+        raw_counts = Counter(map(group_by, self.iter_logs(
+            address=address, topic0=topic0, from_block=from_block, to_block=to_block, offset=offset
+        )))
+
+        # Normalize once per distinct key rather than once per event
+        counts = Counter()
+        for key, count in raw_counts.items():
+            counts[key.lower()] += count
+
+        return counts
+
+    def _get_log_pages(
+        self,
+        address: Optional[str],
+        topic0: Optional[str],
+        topic1: Optional[str],
+        from_block: int,
+        to_block: int,
+        pages: List[int],
+        offset: int
+    ) -> List[List[Dict[str, Any]]]:
+        """Fetch several pages of one log query (concurrently if more than one)"""
+        def fetch(page: int) -> List[Dict[str, Any]]:
+            return self.get_logs(
                 address=address,
                 topic0=topic0,
                 topic1=topic1,
@@ -296,56 +827,125 @@ class RoutescanAPI:
                 offset=offset
             )
 
-            if not events:
-                print(f"    Page {page}: No more events")
-                break
+        if len(pages) == 1:
+            return [fetch(pages[0])]
 
-            print(f"    Page {page}: {len(events)} events")
-            all_events.extend(events)
+        with ThreadPoolExecutor(max_workers=len(pages)) as executor:
+            return list(executor.map(fetch, pages))
 
-            if len(events) < offset:
-                # Last page
-                break
+    def get_all_logs_chunked(
+        self,
+        address: Optional[str] = None,
+        topic0: Optional[str] = None,
+        from_block: int = 0,
+        to_block: int = 99999999,
+        chunk: int = 5000,
+        workers: int = 8,
+        topic1: Optional[str] = None,
+        offset: int = 10000,
+        verbose: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Get ALL event logs by splitting the block range into chunks fetched in parallel
 
-            page += 1
+        Each chunk is fetched with get_all_logs() (pagination + cache). A chunk
+        rejected by the API as too large is halved and retried.
 
-        print(f"  Total: {len(all_events)} events")
+        Args:
+            chunk: Blocks per chunk
+            workers: Max concurrent chunk fetches (still bound by rate limiting)
+            verbose: Print chunk and total counts
 
-        # Cache result
-        with open(cache_file, 'w') as f:
-            json.dump({
-                "query": {
-                    "address": address,
-                    "topic0": topic0,
-                    "topic1": topic1,
-                    "from_block": from_block,
-                    "to_block": to_block
-                },
-                "total_pages": page,
-                "total_events": len(all_events),
-                "events": all_events
-            }, f)
+        Returns:
+            List of event log dictionaries ordered by (blockNumber, logIndex)
+        """
+        ranges = [
+            (start, min(start + chunk - 1, to_block))
+            for start in range(from_block, to_block + 1, chunk)
+        ]
+
+        if verbose:
+            print(f"  Fetching events in {len(ranges)} chunk(s) of {chunk:,} blocks ({workers} workers)...")
+
+        all_events = []
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._get_logs_range, address, topic0, topic1, start, end, offset)
+                for start, end in ranges
+            ]
+            for future in futures:
+                all_events.extend(future.result())
+
+        all_events.sort(key=lambda e: (_hex_to_int(e['blockNumber']), _hex_to_int(e.get('logIndex'))))
+
+        if verbose:
+            print(f"  Total: {len(all_events)} events")
 
         return all_events
 
-    def get_transaction(self, tx_hash: str) -> Dict[str, Any]:
-        """Get transaction details"""
+    def _get_logs_range(
+        self,
+        address: Optional[str],
+        topic0: Optional[str],
+        topic1: Optional[str],
+        from_block: int,
+        to_block: int,
+        offset: int
+    ) -> List[Dict[str, Any]]:
+        """Fetch logs for one block range, halving the range if the API rejects it"""
+        try:
+            return self.get_all_logs(
+                address=address,
+                topic0=topic0,
+                topic1=topic1,
+                from_block=from_block,
+                to_block=to_block,
+                offset=offset,
+                verbose=False
+            )
+        except Exception as e:
+            if from_block >= to_block or not _is_range_error(e):
+                raise
+
+            mid = (from_block + to_block) // 2
+            print(f"    Range {from_block:,}-{to_block:,} too large, splitting...")
+
+            return (
+                self._get_logs_range(address, topic0, topic1, from_block, mid, offset) +
+                self._get_logs_range(address, topic0, topic1, mid + 1, to_block, offset)
+            )
+
+    def _get_mined(self, action: str, tx_hash: str) -> Dict[str, Any]:
+        """
+        Fetch a transaction or receipt by hash, memoized once mined
+
+        A result with blockNumber set is immutable, so it is cached for the
+        lifetime of this instance; pending/missing results are refetched.
+        """
+        cache_key = (action, tx_hash.lower())
+        cached = self._tx_cache.get(cache_key)
+        if cached is not MISSING:
+            return cached
+
         params = {
             "module": "proxy",
-            "action": "eth_getTransactionByHash",
+            "action": action,
             "txhash": tx_hash
         }
 
         data = self._make_request(params)
-        return data.get("result", {})
+        result = data.get("result") or {}
+
+        if result.get("blockNumber"):
+            self._tx_cache.set(cache_key, result)
+
+        return result
+
+    def get_transaction(self, tx_hash: str) -> Dict[str, Any]:
+        """Get transaction details"""
+        return self._get_mined("eth_getTransactionByHash", tx_hash)
 
     def get_transaction_receipt(self, tx_hash: str) -> Dict[str, Any]:
         """Get transaction receipt"""
-        params = {
-            "module": "proxy",
-            "action": "eth_getTransactionReceipt",
-            "txhash": tx_hash
-        }
-
-        data = self._make_request(params)
-        return data.get("result", {})
+        return self._get_mined("eth_getTransactionReceipt", tx_hash)
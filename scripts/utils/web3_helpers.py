@@ -3,28 +3,194 @@ Web3 helpers for TradeSta verification
 
 Provides functions for:
 - RPC calls (eth_call for reading contract state)
+- JSON-RPC batching of eth_call
+- Multicall3 aggregation (many view calls in one eth_call)
 - Event decoding
 - Address utilities
 """
 
 from web3 import Web3
-from eth_abi import decode
-from typing import Any, List, Dict, Optional
+from typing import Any, List, Dict, Optional, Tuple, Union
 import json
+import functools
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .lru_cache import LRUCacheTTL, MISSING
+
+# Multicall3 (same address on every EVM chain, including Avalanche C-Chain)
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
+# Seconds to reuse state read at "latest" / the latest block number
+LATEST_TTL = 5
+BLOCK_NUMBER_TTL = 1
+
+# Shared HTTP session for all RPC traffic (keep-alive across calls). JSON-RPC
+# reads are idempotent, so POSTs are retried on transient errors too
+# (allowed_methods=None retries every method).
+_rpc_session = requests.Session()
+_rpc_session.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=None,
+        raise_on_status=False
+    )
+))
+
+
+@functools.lru_cache(maxsize=256)
+def function_selector(function_signature: str) -> bytes:
+    """4-byte selector for a function signature, e.g. "hasRole(bytes32,address)" (memoized)"""
+    return bytes(Web3.keccak(text=function_signature)[:4])
+
+
+@functools.lru_cache(maxsize=256)
+def role_hash(name: str) -> str:
+    """AccessControl role id for a role name, e.g. "ADMIN_ROLE" (memoized)"""
+    return "0x" + bytes(Web3.keccak(text=name)).hex()
+
+
+HAS_ROLE_SELECTOR = function_selector("hasRole(bytes32,address)")
+IS_WHITELISTED_SELECTOR = function_selector("isWhitelisted(address)")
+
+
+def _to_word(value: str) -> bytes:
+    """Left-pad a hex string (address or bytes32, with or without 0x) to a 32-byte word"""
+    return bytes.fromhex(value[2:] if value.startswith('0x') else value).rjust(32, b'\x00')
+
+
+@functools.lru_cache(maxsize=1024)
+def _data_to_bytes(data: str) -> bytes:
+    """Hex event data -> bytes, memoized so decoding several fields parses the hex once"""
+    return bytes.fromhex(data[2:])  # Remove 0x
+
 
 class Web3Helper:
     """Helper class for Web3/RPC interactions"""
 
-    def __init__(self, rpc_url: str = None):
+    def __init__(self, rpc_url: str = None, session: requests.Session = None):
+        """
+        Args:
+            rpc_url: JSON-RPC endpoint (default: public Avalanche C-Chain RPC)
+            session: HTTP session to send requests over (default: shared pooled session)
+        """
         self.rpc_url = rpc_url or "https://api.avax.network/ext/bc/C/rpc"
-        self.w3 = Web3(Web3.HTTPProvider(self.rpc_url))
+        self.session = session or _rpc_session
+        self.w3 = Web3(Web3.HTTPProvider(self.rpc_url, session=self.session))
 
         if not self.w3.is_connected():
             raise Exception(f"Failed to connect to RPC: {self.rpc_url}")
 
+        self.multicall3 = self.w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+
+        # Memoized read-only results (state read at "latest" is reused briefly)
+        self._cache = LRUCacheTTL(maxsize=10_000, ttl=LATEST_TTL)
+
+    def _post(self, payload: Any) -> Any:
+        """POST a JSON-RPC payload and return the decoded response (orjson when installed)"""
+        if orjson is None:
+            response = self.session.post(self.rpc_url, json=payload, timeout=30)
+            response.raise_for_status()
+            return response.json()
+
+        response = self.session.post(
+            self.rpc_url,
+            data=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=30
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def _rpc(self, method: str, params: List[Any]) -> Any:
+        """
+        Send one JSON-RPC request directly over the shared session
+
+        Bypasses web3.py's request pipeline (middleware, formatters) for hot
+        paths that only need the raw result.
+
+        Raises:
+            ValueError: The node returned a JSON-RPC error (same as web3.py)
+        """
+        data = self._post({"jsonrpc": "2.0", "id": 1, "method": method, "params": params})
+        if "error" in data:
+            raise ValueError(data["error"])
+
+        return data["result"]
+
+    def eth_call(self, to: str, data: Union[str, bytes], block: Union[str, int] = "latest") -> bytes:
+        """
+        Raw eth_call
+
+        Args:
+            to: Contract address
+            data: Calldata as hex string or bytes
+            block: Block number or "latest"
+
+        Returns:
+            Raw return data
+        """
+        if isinstance(data, bytes):
+            data = "0x" + data.hex()
+
+        block_param = hex(block) if isinstance(block, int) else block
+        result = self._rpc("eth_call", [{"to": to, "data": data}, block_param])
+
+        return bytes.fromhex(result[2:])
+
     def get_latest_block(self) -> int:
-        """Get latest block number"""
-        return self.w3.eth.block_number
+        """Get latest block number (cached for 1 second so polling loops collapse)"""
+        block_number = self._cache.get("block_number")
+        if block_number is MISSING:
+            block_number = int(self._rpc("eth_blockNumber", []), 16)
+            self._cache.set("block_number", block_number, ttl=BLOCK_NUMBER_TTL)
+
+        return block_number
 
     def call_contract(
         self,
@@ -50,19 +216,134 @@ class Web3Helper:
             args = []
 
         # Create function selector
-        selector = Web3.keccak(text=function_signature)[:4].hex()
+        selector = function_selector(function_signature)
 
         # Encode arguments (simplified - would need full ABI encoding for complex types)
         data = selector
 
         # Make eth_call
-        result = self.w3.eth.call({
-            "to": contract_address,
-            "data": data
-        }, block)
+        result = self.eth_call(contract_address, data, block)
 
         return result
 
+    def _batch_rpc(self, method: str, params_list: List[List[Any]], batch_size: int) -> List[Any]:
+        """
+        Send many requests for one JSON-RPC method as batch requests
+
+        Public RPCs cap the number of requests per batch, so they are sent
+        in groups of batch_size (one HTTP round-trip per group). Endpoints
+        that don't support batching (single error object instead of an
+        array) are handled by falling back to one request at a time.
+
+        Returns:
+            Raw result for each request in input order (None if it failed)
+        """
+        results = []
+
+        for i in range(0, len(params_list), batch_size):
+            batch = params_list[i:i+batch_size]
+            payload = [
+                {"jsonrpc": "2.0", "id": j, "method": method, "params": params}
+                for j, params in enumerate(batch)
+            ]
+
+            data = self._post(payload)
+            if not isinstance(data, list):
+                results.extend(self._rpc_each(method, batch))
+                continue
+
+            # Batch responses may arrive in any order - match on id
+            responses = {item.get("id"): item for item in data}
+            results.extend(responses.get(j, {}).get("result") for j in range(len(batch)))
+
+        return results
+
+    def _rpc_each(self, method: str, params_list: List[List[Any]]) -> List[Any]:
+        """Sequential fallback for _batch_rpc (None for requests that failed)"""
+        results = []
+        for params in params_list:
+            try:
+                results.append(self._rpc(method, params))
+            except ValueError:
+                results.append(None)
+        return results
+
+    def batch_call(
+        self,
+        calls: List[Dict[str, str]],
+        block: Union[str, int] = "latest",
+        batch_size: int = 10
+    ) -> List[Optional[bytes]]:
+        """
+        Execute many eth_calls as JSON-RPC batch requests
+
+        Args:
+            calls: List of {"to": address, "data": hex calldata}
+            block: Block number or "latest"
+            batch_size: Max calls per JSON-RPC batch
+
+        Returns:
+            Raw return data for each call in input order (None if the call failed)
+        """
+        block_param = hex(block) if isinstance(block, int) else block
+        results = self._batch_rpc("eth_call", [[call, block_param] for call in calls], batch_size)
+
+        return [bytes.fromhex(result[2:]) if result is not None else None for result in results]
+
+    def batch_get_code(
+        self,
+        addresses: List[str],
+        block: Union[str, int] = "latest",
+        batch_size: int = 10
+    ) -> Dict[str, Optional[bool]]:
+        """
+        Check which addresses have contract bytecode, as JSON-RPC batch requests
+
+        Args:
+            addresses: Addresses to check (duplicates are queried once)
+            block: Block number or "latest"
+            batch_size: Max eth_getCode requests per JSON-RPC batch
+
+        Returns:
+            {address (lowercase): True if bytecode is deployed, None if the request failed}
+        """
+        block_param = hex(block) if isinstance(block, int) else block
+        unique = list(dict.fromkeys(address.lower() for address in addresses))
+
+        results = self._batch_rpc("eth_getCode", [[address, block_param] for address in unique], batch_size)
+
+        return {
+            address: (code not in ("0x", "")) if code is not None else None
+            for address, code in zip(unique, results)
+        }
+
+    def multicall(
+        self,
+        calls: List[Tuple[str, Union[str, bytes]]],
+        block: Union[str, int] = "latest"
+    ) -> List[Optional[bytes]]:
+        """
+        Execute many view calls inside a single eth_call via Multicall3.aggregate3
+
+        Args:
+            calls: List of (target address, calldata as hex string or bytes)
+            block: Block number or "latest"
+
+        Returns:
+            Raw return data for each call in input order (None if the call reverted)
+        """
+        if not calls:
+            return []
+
+        call3 = [
+            (self.to_checksum(target), True, data if isinstance(data, bytes) else Web3.to_bytes(hexstr=data))
+            for target, data in calls
+        ]
+
+        results = self.multicall3.functions.aggregate3(call3).call(block_identifier=block)
+
+        return [return_data if success else None for success, return_data in results]
+
     def has_role(
         self,
         contract_address: str,
@@ -80,28 +361,21 @@ class Web3Helper:
         Returns:
             True if account has role
         """
-        # Function signature: hasRole(bytes32,address) returns (bool)
-        function_sig = "hasRole(bytes32,address)"
-        selector = Web3.keccak(text=function_sig)[:4]
-
-        # Encode parameters
-        role_bytes = bytes.fromhex(role[2:] if role.startswith('0x') else role)
-        account_bytes = bytes.fromhex(account[2:] if account.startswith('0x') else account.lower())
+        cache_key = ("hasRole", contract_address.lower(), role.lower(), account.lower())
+        cached = self._cache.get(cache_key)
+        if cached is not MISSING:
+            return cached
 
-        # Pad to 32 bytes
-        role_padded = role_bytes.rjust(32, b'\x00')
-        account_padded = account_bytes.rjust(32, b'\x00')
-
-        data = selector + role_padded + account_padded
+        # hasRole(bytes32,address) returns (bool)
+        data = HAS_ROLE_SELECTOR + _to_word(role) + _to_word(account)
 
         try:
-            result = self.w3.eth.call({
-                "to": contract_address,
-                "data": "0x" + data.hex()
-            })
+            result = self.eth_call(contract_address, data)
 
             # Decode bool result
-            return int.from_bytes(result, byteorder='big') == 1
+            has_role = int.from_bytes(result, byteorder='big') == 1
+            self._cache.set(cache_key, has_role)
+            return has_role
 
         except Exception as e:
             print(f"  Error checking role: {e}")
@@ -117,26 +391,46 @@ class Web3Helper:
 
         Function signature: isWhitelisted(address) returns (bool)
         """
-        function_sig = "isWhitelisted(address)"
-        selector = Web3.keccak(text=function_sig)[:4]
-
-        account_bytes = bytes.fromhex(account[2:] if account.startswith('0x') else account.lower())
-        account_padded = account_bytes.rjust(32, b'\x00')
+        cache_key = ("isWhitelisted", contract_address.lower(), account.lower())
+        cached = self._cache.get(cache_key)
+        if cached is not MISSING:
+            return cached
 
-        data = selector + account_padded
+        data = IS_WHITELISTED_SELECTOR + _to_word(account)
 
         try:
-            result = self.w3.eth.call({
-                "to": contract_address,
-                "data": "0x" + data.hex()
-            })
+            result = self.eth_call(contract_address, data)
 
-            return int.from_bytes(result, byteorder='big') == 1
+            is_whitelisted = int.from_bytes(result, byteorder='big') == 1
+            self._cache.set(cache_key, is_whitelisted)
+            return is_whitelisted
 
         except Exception as e:
             print(f"  Error checking whitelist: {e}")
             return False
 
+    def batch_is_whitelisted(
+        self,
+        contract_address: str,
+        accounts: List[str],
+        block: Union[str, int] = "latest"
+    ) -> List[bool]:
+        """
+        Check isWhitelisted() for many accounts with JSON-RPC batching
+
+        Returns:
+            True/False for each account in input order (False if the call failed)
+        """
+        calls = [
+            {"to": contract_address, "data": "0x" + (IS_WHITELISTED_SELECTOR + _to_word(account)).hex()}
+            for account in accounts
+        ]
+
+        return [
+            result is not None and int.from_bytes(result, byteorder='big') == 1
+            for result in self.batch_call(calls, block)
+        ]
+
     def decode_address_from_topic(self, topic: str) -> str:
         """
         Decode address from event topic (32 bytes)
@@ -168,7 +462,7 @@ class Web3Helper:
         if not data or data == "0x":
             return None
 
-        data_bytes = bytes.fromhex(data[2:])  # Remove 0x
+        data_bytes = _data_to_bytes(data)
 
         start = offset
         end = offset + 32
@@ -179,6 +473,65 @@ class Web3Helper:
         value_bytes = data_bytes[start:end]
         return int.from_bytes(value_bytes, byteorder='big')
 
+    @staticmethod
+    def decode_uint256_bulk(data_list: List[str], word_index: int) -> List[Optional[int]]:
+        """
+        Decode the same uint256 field from many event data fields at once
+
+        With NumPy installed, all words are converted in one vectorized pass
+        when they fit in 64 bits (block numbers, leverage, small amounts);
+        otherwise falls back to Python ints.
+
+        Args:
+            data_list: Hex data strings of events with the same layout
+            word_index: Index of the 32-byte word to decode (0, 1, 2, ...)
+
+        Returns:
+            Decoded values in input order (None where the data is too short)
+        """
+        start = 2 + word_index * 64
+        end = start + 64
+
+        words = [data[start:end] if data and len(data) >= end else None for data in data_list]
+        present = [w for w in words if w is not None]
+
+        if np is not None and present:
+            lanes = np.frombuffer(bytes.fromhex("".join(present)), dtype='>u8').reshape(-1, 4)
+
+            # Only use the fast path when the upper 192 bits are zero everywhere
+            if not lanes[:, :3].any():
+                values = iter(lanes[:, 3].tolist())
+                return [next(values) if w is not None else None for w in words]
+
+        return [int(w, 16) if w is not None else None for w in words]
+
+    @staticmethod
+    def decode_uint256_array(data: bytes, limit: Optional[int] = None) -> Tuple[List[int], int]:
+        """
+        Decode a uint256[] return value, materializing at most `limit` elements
+
+        Avoids decoding (and allocating) the whole array when only a prefix
+        is needed.
+
+        Args:
+            data: Raw ABI-encoded return data of a function returning uint256[]
+            limit: Max number of elements to decode (default: all)
+
+        Returns:
+            (first elements, total array length)
+        """
+        offset = int.from_bytes(data[0:32], byteorder='big')
+        length = int.from_bytes(data[offset:offset + 32], byteorder='big')
+        count = length if limit is None else min(length, limit)
+
+        start = offset + 32
+        values = [
+            int.from_bytes(data[start + 32 * i:start + 32 * (i + 1)], byteorder='big')
+            for i in range(count)
+        ]
+
+        return values, length
+
     def decode_int256_from_data(self, data: str, offset: int = 0) -> int:
         """
         Decode int256 (signed) from event data field using two's complement
@@ -205,14 +558,20 @@ class Web3Helper:
         value = self.decode_uint256_from_data(data, offset)
         return value == 1 if value is not None else None
 
+    @staticmethod
+    def role_name(role_hash: str) -> Optional[str]:
+        """Name of a known role (see ROLES) from its hash, or None"""
+        return ROLE_HASH_TO_NAME.get(Web3.to_bytes(hexstr=role_hash))
+
     @staticmethod
     def keccak256(text: str) -> str:
         """Calculate keccak256 hash of text"""
         return Web3.keccak(text=text).hex()
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def to_checksum(address: str) -> str:
-        """Convert address to checksum format"""
+        """Convert address to checksum format (memoized - checksumming costs a keccak)"""
         return Web3.to_checksum_address(address)
 
     @staticmethod
@@ -245,5 +604,8 @@ EVENT_SIGNATURES = {
 # OpenZeppelin role constants
 ROLES = {
     "DEFAULT_ADMIN_ROLE": "0x0000000000000000000000000000000000000000000000000000000000000000",
-    "ADMIN_ROLE": Web3.keccak(text="ADMIN_ROLE").hex(),
+    "ADMIN_ROLE": role_hash("ADMIN_ROLE"),
 }
+
+# Reverse lookup keyed by raw 32 bytes (hex case/prefix differences don't matter)
+ROLE_HASH_TO_NAME = {Web3.to_bytes(hexstr=role_hash): name for name, role_hash in ROLES.items()}
@@ -12,32 +12,68 @@ These scripts provide deep insights into protocol health and security.
 """
 
 import sys
-import subprocess
+import importlib
+import traceback
+import threading
 import argparse
 from pathlib import Path
 from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 
-def run_script(script_name: str, description: str, args: list = None) -> bool:
-    """Run a verification script and return success status"""
-    print(f"\n{'='*80}")
-    print(f"Running: {description}")
-    print(f"{'='*80}\n")
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent))
 
-    script_path = Path(__file__).parent / script_name
-    cmd = [sys.executable, str(script_path)]
-    if args:
-        cmd.extend(args)
+from utils.output_capture import captured_output
 
+_print_lock = threading.Lock()
+
+def _run_main(script_name: str, args: list = None) -> int:
+    """Import a verification script, call its main() and return its exit code"""
     try:
-        result = subprocess.run(
-            cmd,
-            check=True,
-            capture_output=False
-        )
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"\n❌ {script_name} failed with exit code {e.returncode}")
-        return False
+        module = importlib.import_module(Path(script_name).stem)
+        module.main(args or [])
+    except SystemExit as e:
+        # Scripts report failure via sys.exit(1)
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception:
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+def run_script(script_name: str, description: str, args: list = None, stream: bool = False) -> bool:
+    """
+    Run a verification script in-process and return success status
+
+    The script is imported and its main() called directly, so web3 and
+    requests are imported once rather than by a fresh interpreter per
+    script.
+
+    Args:
+        stream: Print output live (sequential runs). Otherwise output is
+                captured and printed as one block when the script finishes,
+                so scripts running in parallel don't interleave their logs.
+    """
+    header = f"\n{'='*80}\nRunning: {description}\n{'='*80}\n"
+
+    if stream:
+        print(header)
+        returncode = _run_main(script_name, args)
+        output = ""
+    else:
+        with captured_output() as captured:
+            returncode = _run_main(script_name, args)
+        output = captured.getvalue()
+
+    with _print_lock:
+        if not stream:
+            print(header)
+            print(output, end="")
+
+        if returncode != 0:
+            print(f"\n❌ {script_name} failed with exit code {returncode}")
+
+    return returncode == 0
 
 def main():
     parser = argparse.ArgumentParser(
@@ -55,6 +91,13 @@ def main():
         help='Verify all 24 markets (overrides --sample)'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Scripts to run in parallel (default: 4, use 1 to run sequentially with live output)'
+    )
+
     args = parser.parse_args()
 
     print("="*80)
@@ -86,11 +129,16 @@ def main():
         ("verify_protocol_solvency.py", "Protocol Solvency Verification (fund safety)")
     ]
 
-    results = []
-
-    for script_name, description in scripts:
-        success = run_script(script_name, description, script_args)
-        results.append((description, success))
+    # Scripts are independent and I/O-bound - run them concurrently
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = [
+            executor.submit(run_script, script_name, description, script_args, stream=args.workers == 1)
+            for script_name, description in scripts
+        ]
+        results = [
+            (description, future.result())
+            for (_, description), future in zip(scripts, futures)
+        ]
 
     # Print final summary
     print("\n" + "="*80)
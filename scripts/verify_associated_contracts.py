@@ -20,17 +20,79 @@ This script uses ONLY public data sources:
 """
 
 import sys
-import json
+import functools
+from dataclasses import dataclass, field, asdict
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Any
-from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Tuple
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent))
 
+from web3 import Web3
+
 from utils.routescan_api import RoutescanAPI
 from utils.web3_helpers import Web3Helper
+from utils.output_capture import captured_output
+from utils.json_io import load_json, dump_json
+
+# Contract types deployed together for each market (tuple keeps report order)
+QUARTET_TYPES = ("PositionManager", "Orders", "Vault", "FundingTracker")
+EXPECTED_QUARTET_TYPES = frozenset(QUARTET_TYPES)
+
+# Top 3 markets for sample verification (checksummed once at import)
+SAMPLE_MARKETS: Tuple[Tuple[str, str], ...] = (
+    ("AVAX/USD", Web3.to_checksum_address("0x8d07fa9ac8b4bf833f099fb24971d2a808874c25")),
+    ("BTC/USD", Web3.to_checksum_address("0x7da6e6d1b3582a2348fa76b3fe3b5e88d95281e7")),
+    ("ETH/USD", Web3.to_checksum_address("0x5bd078689c358ca2c64daff8761dbf8cfddfc51f")),
+)
+
+
+@dataclass(slots=True)
+class ContractDetail:
+    """A quartet contract identified through its verified source"""
+    type: str
+    address: str
+    name: str
+    compiler: str
+    verified: bool
+
+
+@dataclass(slots=True)
+class MarketRecord:
+    """Verification result for one market (saved via dataclasses.asdict)"""
+    market: str
+    position_manager: str
+    deployment_tx: Optional[str] = None
+    contracts: Dict[str, str] = field(default_factory=dict)
+    complete_quartet: bool = False
+    contract_details: List[ContractDetail] = field(default_factory=list)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_quartets_cached(path: str, mtime_ns: int) -> Dict[str, Tuple[str, ...]]:
+    """
+    Parse factory_deployments.json into complete quartets
+
+    Memoized on (path, mtime) so the file is only re-parsed when it changes.
+
+    Returns:
+        {tx_hash: (contract1, contract2, contract3, contract4)}
+    """
+    deployments = load_json(path)
+
+    # Group by transaction hash
+    quartets = defaultdict(list)
+    for deployment in deployments:
+        quartets[deployment['tx_hash']].append(deployment['contract'])
+
+    # Keep only complete quartets (4 contracts)
+    return {
+        tx: tuple(contracts) for tx, contracts in quartets.items()
+        if len(contracts) == 4
+    }
 
 class AssociatedContractsVerifier:
     """Verify associated contracts (Orders, Vault, FundingTracker) for each market"""
@@ -41,8 +103,8 @@ class AssociatedContractsVerifier:
         self.sample_size = sample_size
 
         self.results = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "latest_block": self.w3.get_latest_block(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            "latest_block": None,  # Set in run()
             "markets_verified": [],
             "statistics": {
                 "total_markets": 0,
@@ -58,23 +120,10 @@ class AssociatedContractsVerifier:
         }
 
         # Known addresses from analysis
-        from web3 import Web3
-
-        # Top 3 markets for sample verification
         self.markets = [
-            {
-                "name": "AVAX/USD",
-                "position_manager": Web3.to_checksum_address("0x8d07fa9ac8b4bf833f099fb24971d2a808874c25")
-            },
-            {
-                "name": "BTC/USD",
-                "position_manager": Web3.to_checksum_address("0x7da6e6d1b3582a2348fa76b3fe3b5e88d95281e7")
-            },
-            {
-                "name": "ETH/USD",
-                "position_manager": Web3.to_checksum_address("0x5bd078689c358ca2c64daff8761dbf8cfddfc51f")
-            }
-        ][:sample_size]
+            {"name": name, "position_manager": position_manager}
+            for name, position_manager in SAMPLE_MARKETS[:sample_size]
+        ]
 
     def get_contract_source_info(self, address: str) -> Dict[str, Any]:
         """
@@ -102,48 +151,62 @@ class AssociatedContractsVerifier:
 
         return []
 
-    def verify_market_quartet(self, market: Dict[str, str], quartets: Dict[str, List[str]]) -> Dict[str, Any]:
+    def verify_market_quartet(
+        self,
+        market: Dict[str, str],
+        quartets: Dict[str, List[str]],
+        tx_hash: Optional[str] = None,
+        quartet_index: Optional[Dict[str, str]] = None
+    ) -> MarketRecord:
         """
         Verify all 4 contracts for a market
 
+        Args:
+            tx_hash: Prefetched deployment transaction (looked up if not given)
+            quartet_index: {contract_address: tx_hash} for every quartet member.
+                If given, markets missing from it are skipped without any API call.
+
         Returns:
-            {
-                "market": "AVAX/USD",
-                "position_manager": "0x...",
-                "deployment_tx": "0x...",
-                "contracts": {
+            MarketRecord, e.g.
+                market="AVAX/USD"
+                position_manager="0x..."
+                deployment_tx="0x..."
+                contracts={
                     "PositionManager": "0x...",
                     "Orders": "0x...",
                     "Vault": "0x...",
                     "FundingTracker": "0x..."
-                },
-                "complete_quartet": True/False
-            }
+                }
+                complete_quartet=True/False
         """
         print(f"\n{'='*80}")
         print(f"VERIFYING MARKET: {market['name']}")
         print(f"{'='*80}")
         print(f"PositionManager: {market['position_manager']}")
 
-        market_data = {
-            "market": market["name"],
-            "position_manager": market["position_manager"].lower(),
-            "deployment_tx": None,
-            "contracts": {},
-            "complete_quartet": False,
-            "contract_details": []
-        }
+        market_data = MarketRecord(
+            market=market["name"],
+            position_manager=market["position_manager"].lower()
+        )
+
+        # Fail fast: no quartet contains this PositionManager, so the
+        # deployment transaction lookup can't lead anywhere
+        if quartet_index is not None and market_data.position_manager not in quartet_index:
+            print("\n  ⚠️  PositionManager not found in quartet data - skipping")
+            print(f"  Note: Pre-analysis may be stale or this market may use a different deployment pattern")
+            return market_data
 
         # Get deployment transaction
         print("\n1. Getting deployment transaction...")
-        creation_info = self.api.get_contract_creation([market["position_manager"]])
+        if tx_hash is None:
+            creation_info = self.api.get_contract_creation([market["position_manager"]])
+            tx_hash = creation_info[0]['txHash'] if creation_info else None
 
-        if not creation_info or len(creation_info) == 0:
+        if tx_hash is None:
             print("  ❌ Could not get deployment transaction")
             return market_data
 
-        tx_hash = creation_info[0]['txHash']
-        market_data["deployment_tx"] = tx_hash
+        market_data.deployment_tx = tx_hash
         print(f"  ✅ Deployment TX: {tx_hash}")
 
         # Find quartet for this transaction
@@ -162,67 +225,65 @@ class AssociatedContractsVerifier:
 
         contract_types_found = {}
 
+        # Fetch source info for the whole quartet in one parallel call
+        sources = self.api.get_contract_sources(quartet_contracts)
+
         for i, contract_addr in enumerate(quartet_contracts, 1):
-            print(f"\n  Contract {i}/{len(quartet_contracts)}: {contract_addr}")
+            # Collect this contract's lines and write them in one go
+            lines = [f"\n  Contract {i}/{len(quartet_contracts)}: {contract_addr}"]
 
-            # Get source code to identify contract type
-            source_info = self.get_contract_source_info(contract_addr)
+            # Source code identifies the contract type
+            source_info = sources.get(contract_addr.lower())
 
             if source_info and source_info.get("ContractName"):
                 contract_name = source_info["ContractName"]
                 contract_type = contract_name  # The contract name IS the type
 
-                print(f"    ✅ Type: {contract_type}")
-                print(f"    📝 Verified: {source_info.get('verified', 'Unknown')}")
+                lines.append(f"    ✅ Type: {contract_type}")
+                lines.append(f"    📝 Verified: {source_info.get('verified', 'Unknown')}")
 
                 # Store in market data
-                market_data["contracts"][contract_type] = contract_addr.lower()
-                market_data["contract_details"].append({
-                    "type": contract_type,
-                    "address": contract_addr.lower(),
-                    "name": contract_name,
-                    "compiler": source_info.get("CompilerVersion", "Unknown"),
-                    "verified": source_info.get("verified", False)
-                })
+                market_data.contracts[contract_type] = contract_addr.lower()
+                market_data.contract_details.append(ContractDetail(
+                    type=contract_type,
+                    address=contract_addr.lower(),
+                    name=contract_name,
+                    compiler=source_info.get("CompilerVersion", "Unknown"),
+                    verified=source_info.get("verified", False)
+                ))
 
                 contract_types_found[contract_type] = contract_addr
             else:
-                print(f"    ⚠️  Could not get source code")
+                lines.append(f"    ⚠️  Could not get source code")
+
+            sys.stdout.write("\n".join(lines) + "\n")
 
         # Check if we have complete quartet
-        expected_types = ["PositionManager", "Orders", "Vault", "FundingTracker"]
-        found_types = set(contract_types_found.keys())
+        found_types = contract_types_found.keys()
 
         print(f"\n4. Quartet Verification:")
-        for expected_type in expected_types:
+        for expected_type in QUARTET_TYPES:
             if expected_type in found_types:
                 addr = contract_types_found[expected_type]
                 print(f"  ✅ {expected_type:<20} {addr}")
-
-                # Track statistics
-                if expected_type == "Vault":
-                    self.results["statistics"]["vaults_identified"] += 1
-                elif expected_type == "Orders":
-                    self.results["statistics"]["orders_identified"] += 1
-                elif expected_type == "FundingTracker":
-                    self.results["statistics"]["funding_trackers_identified"] += 1
             else:
                 print(f"  ❌ {expected_type:<20} NOT FOUND")
 
-        market_data["complete_quartet"] = (found_types == set(expected_types))
+        # Extra contracts in the deployment don't invalidate the quartet
+        market_data.complete_quartet = found_types >= EXPECTED_QUARTET_TYPES
 
-        if market_data["complete_quartet"]:
+        if market_data.complete_quartet:
             print(f"\n  ✅ COMPLETE QUARTET VERIFIED!")
         else:
-            print(f"\n  ⚠️  Incomplete quartet: {found_types}")
+            print(f"\n  ⚠️  Incomplete quartet: {set(found_types)}")
 
         return market_data
 
-    def load_preanalyzed_quartets(self) -> Dict[str, List[str]]:
+    def load_preanalyzed_quartets(self) -> Dict[str, Tuple[str, ...]]:
         """
         Load pre-analyzed quartet data from previous analysis
 
-        Returns dict of {tx_hash: [contract1, contract2, contract3, contract4]}
+        Returns dict of {tx_hash: (contract1, contract2, contract3, contract4)}
         """
         # Check if we have factory_deployments.json from parent analysis
         parent_analysis = Path(__file__).parent.parent.parent / "analysis" / "factory_deployments.json"
@@ -232,21 +293,7 @@ class AssociatedContractsVerifier:
 
         print(f"\n📁 Loading pre-analyzed deployment data: {parent_analysis}")
 
-        with open(parent_analysis, 'r') as f:
-            deployments = json.load(f)
-
-        # Group by transaction hash
-        quartets = defaultdict(list)
-        for deployment in deployments:
-            tx_hash = deployment['tx_hash']
-            contract = deployment['contract']
-            quartets[tx_hash].append(contract)
-
-        # Filter to only complete quartets (4 contracts)
-        complete_quartets = {
-            tx: contracts for tx, contracts in quartets.items()
-            if len(contracts) == 4
-        }
+        complete_quartets = _load_quartets_cached(str(parent_analysis), parent_analysis.stat().st_mtime_ns)
 
         print(f"   ✅ Loaded {len(complete_quartets)} complete quartets (4 contracts each)")
         print(f"   ✅ Total contracts: {sum(len(c) for c in complete_quartets.values())}")
@@ -272,15 +319,57 @@ class AssociatedContractsVerifier:
         if not quartets:
             print("\n⚠️  No quartet data available. Using limited verification.")
 
-        for market in self.markets:
-            market_data = self.verify_market_quartet(market, quartets)
-            self.results["markets_verified"].append(market_data)
-            self.results["statistics"]["total_markets"] += 1
-            self.results["statistics"]["total_contracts_found"] += len(market_data.get("contract_details", []))
+        # Reverse index of quartet members - markets outside it are skipped
+        quartet_index = {
+            contract.lower(): tx for tx, contracts in quartets.items() for contract in contracts
+        }
+
+        # Deployment transactions for known markets only (batched, 5 addresses per call)
+        known = [m["position_manager"] for m in self.markets if m["position_manager"].lower() in quartet_index]
+        creations = self.api.get_contract_creation(known) if known else []
+        deployment_txs = {c['contractAddress'].lower(): c['txHash'] for c in creations}
+
+        # Markets are independent - verify them concurrently, then print
+        # each market's log as one block in the original order
+        with ThreadPoolExecutor(max_workers=max(min(len(self.markets), 8), 1)) as executor:
+            verified = list(executor.map(
+                lambda market: self._verify_market_captured(
+                    market, quartets, deployment_txs.get(market["position_manager"].lower()), quartet_index
+                ),
+                self.markets
+            ))
+
+        stats = self.results["statistics"]
+        type_counts = Counter()
+
+        for market_data, output in verified:
+            print(output, end="")
+
+            self.results["markets_verified"].append(asdict(market_data))
+            stats["total_markets"] += 1
+            stats["total_contracts_found"] += len(market_data.contract_details)
 
             # Update statistics
-            if market_data["complete_quartet"]:
-                self.results["statistics"]["markets_with_complete_quartet"] += 1
+            if market_data.complete_quartet:
+                stats["markets_with_complete_quartet"] += 1
+            type_counts.update(market_data.contracts.keys())
+
+        stats["vaults_identified"] = type_counts["Vault"]
+        stats["orders_identified"] = type_counts["Orders"]
+        stats["funding_trackers_identified"] = type_counts["FundingTracker"]
+
+    def _verify_market_captured(
+        self,
+        market: Dict[str, str],
+        quartets: Dict[str, List[str]],
+        tx_hash: Optional[str],
+        quartet_index: Optional[Dict[str, str]] = None
+    ) -> Tuple[MarketRecord, str]:
+        """Run verify_market_quartet, returning its result and captured output"""
+        with captured_output() as output:
+            market_data = self.verify_market_quartet(market, quartets, tx_hash, quartet_index)
+
+        return market_data, output.getvalue()
 
     def generate_report(self):
         """Generate summary report"""
@@ -322,13 +411,17 @@ class AssociatedContractsVerifier:
             print(f"   ⚠️  Some quartets incomplete")
             print(f"   ℹ️  Sample verification demonstrates methodology")
 
-    def save_results(self, filename: str = "associated_contracts_verified.json"):
-        """Save results to JSON file"""
+    def save_results(self, filename: str = "associated_contracts_verified.json", pretty: bool = True):
+        """
+        Save results to JSON file
+
+        Args:
+            pretty: Indent the output (compact when False, for machine consumers)
+        """
         output_path = Path("results") / filename
         output_path.parent.mkdir(exist_ok=True)
 
-        with open(output_path, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        dump_json(self.results, output_path, indent=pretty)
 
         print(f"\n✅ Results saved to: {output_path}")
 
@@ -343,6 +436,7 @@ class AssociatedContractsVerifier:
         print("- No MongoDB or private infrastructure required")
 
         try:
+            self.results["latest_block"] = self.w3.get_latest_block()
             self.verify_all_markets()
             self.generate_report()
             self.save_results()
@@ -16,30 +16,77 @@ Associated contracts verified:
 """
 
 import sys
-import json
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.append(str(Path(__file__).parent))
 
 from utils.routescan_api import RoutescanAPI
-from utils.web3_helpers import Web3Helper
+from utils.web3_helpers import Web3Helper, function_selector
+from utils.output_capture import captured_output
+from utils.market_registry import MarketRegistryIndex
+from utils.json_io import load_json, dump_json, JSONListWriter
 from web3 import Web3
 
+# MarketRegistry getters for each quartet member (selectors computed once)
+QUARTET_GETTERS = (
+    ('position_manager', function_selector('getPositionManagerAddress(bytes32)')),
+    ('orders', function_selector('getOrderManagerAddress(bytes32)')),
+    ('vault', function_selector('getVaultAddress(bytes32)')),
+    ('funding_tracker', function_selector('getFundingManagerAddress(bytes32)'))
+)
+
+# Same selectors as 0x-prefixed hex, for calldata built as strings (JSON-RPC)
+QUARTET_GETTERS_HEX = tuple((contract_type, '0x' + selector.hex()) for contract_type, selector in QUARTET_GETTERS)
+
+ZERO_ADDRESS = '0x0000000000000000000000000000000000000000'
+ZERO_ADDRESS_BYTES = bytes(20)
+
+COLLATERAL_TOKEN_SELECTOR = function_selector('collateralTokenAddress()')
+
+
+def _address_from_word(word: bytes) -> str:
+    """Lowercase 0x address from an ABI-encoded address word (last 20 bytes)"""
+    address = word[-20:]
+
+    # Unset registry entries are common during partial deployments - skip the hex encode
+    if address == ZERO_ADDRESS_BYTES:
+        return ZERO_ADDRESS
+
+    return '0x' + bytes(address).hex()
+
+# MarketRegistry state that never changes once a market is deployed
+# (collateral token, complete quartets by pricefeed ID)
+REGISTRY_CACHE_FILE = Path('cache') / 'quartets.json'
+
+# eth_calls per JSON-RPC batch when prefetching all quartets
+QUARTET_BATCH_SIZE = 100
+
 class AssociatedContractsVerifierV2:
     """Verify associated contracts using MarketRegistry getter functions"""
 
-    def __init__(self, sample_size: int = None):
-        self.api = RoutescanAPI(cache_dir='cache')
+    def __init__(self, sample_size: int = None, quiet: bool = False, refresh: bool = False, use_cache: bool = True):
+        """
+        Args:
+            sample_size: Verify only the first N markets (None = all)
+            quiet: Skip the per-market output (summary is still printed)
+            refresh: Ignore cached MarketRegistry state and query it again
+            use_cache: Reuse Routescan results cached on disk by earlier runs
+        """
+        self.api = RoutescanAPI(cache_dir='cache', read_disk_cache=use_cache)
         self.w3_helper = Web3Helper()
         self.sample_size = sample_size
+        self.quiet = quiet
+        self._results_writer: Optional[JSONListWriter] = None
+
+        self._registry_cache = self._load_registry_cache(refresh)
 
         self.results = {
             "timestamp": datetime.utcnow().isoformat(),
             "latest_block": self.w3_helper.get_latest_block(),
             "verification_method": "marketregistry_getter_functions",
-            "markets": [],
             "statistics": {
                 "total_markets": 0,
                 "complete_quartets": 0,
@@ -53,7 +100,24 @@ class AssociatedContractsVerifierV2:
         self.market_registry = Web3.to_checksum_address(
             '0x60f16b09a15f0c3210b40a735b19a6baf235dd18'
         )
-        self.market_created_sig = '0x5eb977f82e9d0d89f65f05a56a99ab87e2ebb3909780e0b3642bec962789ba7a'
+
+    @staticmethod
+    def _load_registry_cache(refresh: bool) -> Dict[str, Any]:
+        """Load cached MarketRegistry state (empty when refreshing or not yet created)"""
+        if not refresh and REGISTRY_CACHE_FILE.exists():
+            return load_json(REGISTRY_CACHE_FILE)
+
+        return {"collateral_token": None, "quartets": {}}
+
+    def _save_registry_cache(self):
+        """Atomically rewrite the MarketRegistry state cache"""
+        REGISTRY_CACHE_FILE.parent.mkdir(exist_ok=True)
+        dump_json(self._registry_cache, REGISTRY_CACHE_FILE)
+
+    def _cache_quartet(self, pricefeed_id: str, quartet: Dict[str, str]):
+        """Remember a quartet (only complete ones - a zero address may still be filled in)"""
+        if all(addr != ZERO_ADDRESS for addr in quartet.values()):
+            self._registry_cache["quartets"][pricefeed_id] = quartet
 
     def verify_collateral_token(self):
         """Verify collateral token is USDC"""
@@ -61,25 +125,23 @@ class AssociatedContractsVerifierV2:
         print("VERIFYING COLLATERAL TOKEN")
         print("="*80)
 
-        # Call collateralTokenAddress()
-        function_sig = Web3.keccak(text='collateralTokenAddress()')[:4]
+        # Call collateralTokenAddress() (fixed at deployment - cached)
+        collateral_token = self._registry_cache.get("collateral_token")
+        if collateral_token is None:
+            result = self.w3_helper.eth_call(self.market_registry, COLLATERAL_TOKEN_SELECTOR)
+            collateral_token = _address_from_word(result)
+            self._registry_cache["collateral_token"] = collateral_token
 
-        result = self.w3_helper.w3.eth.call({
-            'to': self.market_registry,
-            'data': function_sig.hex()
-        })
-
-        collateral_token = '0x' + result[-20:].hex()
         expected_usdc = '0xb97ef9ef8734c71904d8002f8b6bc66dd9c48a6e'
 
-        is_match = collateral_token.lower() == expected_usdc
+        is_match = collateral_token == expected_usdc
 
         print(f"\nCollateral Token: {collateral_token}")
         print(f"Expected (USDC):  {expected_usdc}")
         print(f"Match: {'✅' if is_match else '❌'}")
 
         self.results["collateral_token"] = {
-            "address": collateral_token.lower(),
+            "address": collateral_token,
             "expected": expected_usdc,
             "verified": is_match,
             "symbol": "USDC" if is_match else "Unknown"
@@ -89,104 +151,174 @@ class AssociatedContractsVerifierV2:
         return is_match
 
     def get_market_created_events(self) -> List[Dict[str, Any]]:
-        """Query all MarketCreated events"""
+        """
+        Get all markets from MarketCreated events
+
+        Uses the persistent market index (cache/markets.json), so only blocks
+        produced since the previous run are queried.
+
+        Returns:
+            Market records (see MarketRegistryIndex.parse_market_created)
+        """
         print("\n" + "="*80)
         print("QUERYING MARKET DEPLOYMENTS")
         print("="*80)
 
         print(f"\nQuerying MarketCreated events from MarketRegistry...")
 
-        events = self.api.get_all_logs(
-            address=self.market_registry,
-            topic0=self.market_created_sig,
-            from_block=63_000_000,
-            to_block=self.results["latest_block"],
-            offset=10000
-        )
+        index = MarketRegistryIndex(api=self.api, cache_dir='cache')
+        markets = index.get_markets(self.results["latest_block"], verbose=not self.quiet)
 
-        print(f"✅ Found {len(events)} markets")
+        print(f"✅ Found {len(markets)} markets")
 
-        return events
+        return markets
 
     def get_quartet_for_market(self, pricefeed_id: str) -> Dict[str, str]:
         """
         Query MarketRegistry getter functions to get complete quartet
 
+        All 4 getters are executed in a single eth_call via Multicall3.
+        Complete quartets are served from the registry cache.
+
         Args:
             pricefeed_id: Pyth price feed ID (bytes32)
 
         Returns:
             Dictionary with all 4 contract addresses
         """
-        quartet = {}
+        cached = self._registry_cache["quartets"].get(pricefeed_id)
+        if cached is not None:
+            return cached
 
-        # Define getter functions
-        functions = {
-            'position_manager': 'getPositionManagerAddress(bytes32)',
-            'orders': 'getOrderManagerAddress(bytes32)',
-            'vault': 'getVaultAddress(bytes32)',
-            'funding_tracker': 'getFundingManagerAddress(bytes32)'
-        }
+        pricefeed_bytes = bytes.fromhex(pricefeed_id[2:])
+
+        results = self.w3_helper.multicall([
+            (self.market_registry, selector + pricefeed_bytes)
+            for _, selector in QUARTET_GETTERS
+        ])
 
-        for contract_type, function_name in functions.items():
-            function_sig = Web3.keccak(text=function_name)[:4]
-            call_data = function_sig + bytes.fromhex(pricefeed_id[2:])
+        quartet = {}
+        for (contract_type, _), result in zip(QUARTET_GETTERS, results):
+            if result is None:
+                raise ValueError(f"MarketRegistry getter for {contract_type} reverted ({pricefeed_id})")
 
-            result = self.w3_helper.w3.eth.call({
-                'to': self.market_registry,
-                'data': call_data.hex()
-            })
+            quartet[contract_type] = _address_from_word(result)
 
-            address = '0x' + result[-20:].hex()
-            quartet[contract_type] = address.lower()
+        self._cache_quartet(pricefeed_id, quartet)
 
         return quartet
 
-    def verify_market(self, event: Dict[str, Any], market_number: int) -> Dict[str, Any]:
-        """Verify complete quartet for a single market"""
-        topics = event['topics']
-        pricefeed_id = topics[1]
-        block = int(event['blockNumber'], 16)
-        tx_hash = event['transactionHash']
+    def get_quartets(self, pricefeed_ids: List[str]) -> List[Optional[Dict[str, str]]]:
+        """
+        Query the complete quartet of many markets in JSON-RPC batches
+
+        Cached quartets are reused; for the rest every (market, getter)
+        eth_call is sent in batches of QUARTET_BATCH_SIZE, so all markets
+        take one or a few HTTP round-trips.
+
+        Args:
+            pricefeed_ids: Pyth price feed IDs (bytes32)
+
+        Returns:
+            Quartet per price feed ID in input order (None if any getter failed)
+        """
+        cached = self._registry_cache["quartets"]
+        missing = [pricefeed_id for pricefeed_id in dict.fromkeys(pricefeed_ids) if pricefeed_id not in cached]
+
+        # pricefeed_id is already a 32-byte hex word - append it to the selector as-is
+        calls = [
+            {'to': self.market_registry, 'data': selector_hex + pricefeed_id[2:]}
+            for pricefeed_id in missing
+            for _, selector_hex in QUARTET_GETTERS_HEX
+        ]
+
+        results = self.w3_helper.batch_call(calls, batch_size=QUARTET_BATCH_SIZE) if calls else []
+
+        fetched = {}
+        for pricefeed_id, i in zip(missing, range(0, len(results), len(QUARTET_GETTERS))):
+            market_results = results[i:i+len(QUARTET_GETTERS)]
+
+            if any(result is None for result in market_results):
+                continue
+
+            fetched[pricefeed_id] = {
+                contract_type: _address_from_word(result)
+                for (contract_type, _), result in zip(QUARTET_GETTERS, market_results)
+            }
+            self._cache_quartet(pricefeed_id, fetched[pricefeed_id])
+
+        return [cached.get(pricefeed_id) or fetched.get(pricefeed_id) for pricefeed_id in pricefeed_ids]
 
-        # Get position manager from event
-        position_manager_from_event = '0x' + topics[2][-40:]
+    def verify_market(
+        self,
+        market: Dict[str, Any],
+        quartet: Optional[Dict[str, str]] = None,
+        has_code: Optional[Dict[str, Optional[bool]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Verify complete quartet for a single market
 
-        print(f"\n{'='*80}")
-        print(f"MARKET #{market_number}")
-        print(f"{'='*80}")
-        print(f"Block: {block:,}")
-        print(f"TX: {tx_hash}")
-        print(f"PriceFeed ID: {pricefeed_id}")
+        Args:
+            market: Market record from get_market_created_events()
+            quartet: Prefetched quartet (queried from MarketRegistry if not given)
+            has_code: Prefetched {address: has bytecode} (addresses not in it are checked here)
+        """
+        market_number = market['market_number']
+        pricefeed_id = market['pricefeed_id']
+        block = market['block']
+        tx_hash = market['tx_hash']
+
+        # Position manager from the MarketCreated event
+        position_manager_from_event = market['position_manager']
+
+        # Market output is collected and written in one go
+        lines = [
+            f"\n{'='*80}",
+            f"MARKET #{market_number}",
+            f"{'='*80}",
+            f"Block: {block:,}",
+            f"TX: {tx_hash}",
+            f"PriceFeed ID: {pricefeed_id}",
+            f"\nQuerying MarketRegistry getter functions..."
+        ]
 
         # Query complete quartet from MarketRegistry
-        print(f"\nQuerying MarketRegistry getter functions...")
-        quartet = self.get_quartet_for_market(pricefeed_id)
+        if quartet is None:
+            quartet = self.get_quartet_for_market(pricefeed_id)
 
         # Verify position manager matches event
-        pm_match = quartet['position_manager'] == position_manager_from_event.lower()
+        pm_match = quartet['position_manager'] == position_manager_from_event
 
-        print(f"\n  Contract Addresses (from MarketRegistry state):")
-        print(f"  ├─ PositionManager: {quartet['position_manager']}")
-        print(f"  │  └─ Matches event: {'✅' if pm_match else '❌'}")
-        print(f"  ├─ Orders:          {quartet['orders']}")
-        print(f"  ├─ Vault:           {quartet['vault']} ⚠️  HOLDS USER FUNDS")
-        print(f"  └─ FundingTracker:  {quartet['funding_tracker']}")
+        lines += [
+            f"\n  Contract Addresses (from MarketRegistry state):",
+            f"  ├─ PositionManager: {quartet['position_manager']}",
+            f"  │  └─ Matches event: {'✅' if pm_match else '❌'}",
+            f"  ├─ Orders:          {quartet['orders']}",
+            f"  ├─ Vault:           {quartet['vault']} ⚠️  HOLDS USER FUNDS",
+            f"  └─ FundingTracker:  {quartet['funding_tracker']}"
+        ]
 
         # Check for complete quartet (no zero addresses)
-        has_all = all(
-            addr != '0x0000000000000000000000000000000000000000'
-            for addr in quartet.values()
-        )
+        has_all = all(addr != ZERO_ADDRESS for addr in quartet.values())
+
+        # Every non-zero address must have contract bytecode deployed
+        has_code = has_code or {}
+        deployed = [addr for addr in quartet.values() if addr != ZERO_ADDRESS]
+        unchecked = [addr for addr in deployed if addr not in has_code]
+        if unchecked:
+            has_code = {**has_code, **self.w3_helper.batch_get_code(unchecked)}
 
-        if has_all:
-            print(f"\n  ✅ COMPLETE QUARTET VERIFIED")
-            self.results["statistics"]["complete_quartets"] += 1
-            self.results["statistics"]["vaults_verified"] += 1
-            self.results["statistics"]["orders_verified"] += 1
-            self.results["statistics"]["funding_trackers_verified"] += 1
+        has_bytecode = all(has_code.get(addr) for addr in deployed)
+
+        if has_all and has_bytecode:
+            lines.append(f"\n  ✅ COMPLETE QUARTET VERIFIED")
+        elif not has_all:
+            lines.append(f"\n  ⚠️  Incomplete quartet (contains zero addresses)")
         else:
-            print(f"\n  ⚠️  Incomplete quartet (contains zero addresses)")
+            no_code = [addr for addr in deployed if not has_code.get(addr)]
+            lines.append(f"\n  ⚠️  Incomplete quartet (no bytecode confirmed at {', '.join(no_code)})")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
         market_data = {
             "market_number": market_number,
@@ -197,7 +329,8 @@ class AssociatedContractsVerifierV2:
             "orders": quartet['orders'],
             "vault": quartet['vault'],
             "funding_tracker": quartet['funding_tracker'],
-            "complete_quartet": has_all,
+            "complete_quartet": has_all and has_bytecode,
+            "has_bytecode": has_bytecode,
             "position_manager_matches_event": pm_match
         }
 
@@ -215,10 +348,10 @@ class AssociatedContractsVerifierV2:
         self.verify_collateral_token()
 
         # Get all market deployments
-        events = self.get_market_created_events()
+        markets = self.get_market_created_events()
 
         if self.sample_size:
-            events = events[:self.sample_size]
+            markets = markets[:self.sample_size]
             print(f"\n⚠️  Sample mode: Verifying first {self.sample_size} markets only")
 
         # Verify each market
@@ -226,10 +359,53 @@ class AssociatedContractsVerifierV2:
         print("VERIFYING MARKET QUARTETS")
         print("="*80)
 
-        for i, event in enumerate(events, 1):
-            market_data = self.verify_market(event, i)
-            self.results["markets"].append(market_data)
-            self.results["statistics"]["total_markets"] += 1
+        # All quartets in JSON-RPC batches (markets whose batch failed are
+        # re-queried individually in verify_market)
+        quartets = self.get_quartets([market['pricefeed_id'] for market in markets])
+
+        # Bytecode check for every quartet address in JSON-RPC batches
+        has_code = self.w3_helper.batch_get_code([
+            addr for quartet in quartets if quartet
+            for addr in quartet.values() if addr != ZERO_ADDRESS
+        ], batch_size=QUARTET_BATCH_SIZE)
+
+        stats = self.results["statistics"]
+
+        # Markets are independent - verify them concurrently, then print
+        # each market's log as one block (and stream its record to the
+        # results file) in market order
+        with ThreadPoolExecutor(max_workers=max(min(len(markets), 8), 1)) as executor:
+            verified = executor.map(
+                lambda market, quartet: self._verify_market_captured(market, quartet, has_code),
+                markets, quartets
+            )
+
+            for market_data, output in verified:
+                if not self.quiet:
+                    print(output, end="")
+
+                self.append_market(market_data)
+                stats["total_markets"] += 1
+
+                if market_data["complete_quartet"]:
+                    stats["complete_quartets"] += 1
+                    stats["vaults_verified"] += 1
+                    stats["orders_verified"] += 1
+                    stats["funding_trackers_verified"] += 1
+
+        self._save_registry_cache()
+
+    def _verify_market_captured(
+        self,
+        market: Dict[str, Any],
+        quartet: Optional[Dict[str, str]] = None,
+        has_code: Optional[Dict[str, Optional[bool]]] = None
+    ) -> Tuple[Dict[str, Any], str]:
+        """Run verify_market, returning its result and captured output"""
+        with captured_output() as output:
+            market_data = self.verify_market(market, quartet, has_code)
+
+        return market_data, output.getvalue()
 
     def generate_report(self):
         """Generate summary report"""
@@ -275,28 +451,49 @@ class AssociatedContractsVerifierV2:
             incomplete = stats['total_markets'] - stats['complete_quartets']
             print(f"   ⚠️  {incomplete} market(s) have incomplete quartets")
 
-    def save_results(self, filename: str = "associated_contracts_v2_verified.json"):
-        """Save results to JSON file"""
-        output_path = Path("results") / filename
-        output_path.parent.mkdir(exist_ok=True)
+    def open_results(self, filename: str = "associated_contracts_v2_verified.json"):
+        """
+        Start the results file
+
+        Market records are streamed to it as they are verified (not kept in
+        self.results); everything else is written by close_results().
+        """
+        self._output_path = Path("results") / filename
+        self._output_path.parent.mkdir(exist_ok=True)
 
-        with open(output_path, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        self._results_writer = JSONListWriter(self._output_path, "markets")
 
-        print(f"\n✅ Results saved to: {output_path}")
+    def append_market(self, market_data: Dict[str, Any]):
+        """Write one verified market to the results file"""
+        self._results_writer.append(market_data)
+
+    def close_results(self):
+        """Write the remaining results and move the file into place"""
+        self._results_writer.close(self.results)
+        self._results_writer = None
+
+        print(f"\n✅ Results saved to: {self._output_path}")
+
+    def discard_results(self):
+        """Drop a partially written results file"""
+        if self._results_writer is not None:
+            self._results_writer.discard()
+            self._results_writer = None
 
     def run(self):
         """Run full verification"""
         try:
+            self.open_results()
             self.verify_all_markets()
             self.generate_report()
-            self.save_results()
+            self.close_results()
 
             print("\n" + "="*80)
             print("VERIFICATION COMPLETE")
             print("="*80)
 
         except Exception as e:
+            self.discard_results()
             print(f"\n❌ ERROR: {e}")
             import traceback
             traceback.print_exc()
@@ -319,12 +516,27 @@ def main():
         action='store_true',
         help='Verify all 24 markets (default)'
     )
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Skip per-market output (summary only)'
+    )
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Ignore cached MarketRegistry state (cache/quartets.json) and query it again'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore Routescan results cached on disk (ABIs, sources, creation info)'
+    )
 
     args = parser.parse_args()
 
     sample_size = args.sample if args.sample else None
 
-    verifier = AssociatedContractsVerifierV2(sample_size=sample_size)
+    verifier = AssociatedContractsVerifierV2(sample_size=sample_size, quiet=args.quiet, refresh=args.refresh, use_cache=not args.no_cache)
     verifier.run()
 
 
@@ -20,22 +20,65 @@ Expected structure:
 """
 
 import sys
-import json
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any
+import requests
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent))
 
-from utils.routescan_api import RoutescanAPI
+from utils.routescan_api import RoutescanAPI, RoutescanAPIError
+from utils.json_io import dump_json
 from utils.web3_helpers import Web3Helper, EVENT_SIGNATURES
+from web3 import Web3
+
+# Errors a single ABI fetch can raise (HTTP failure, API error status,
+# unparseable ABI) - anything else is a bug and propagates
+ABI_FETCH_ERRORS = (requests.RequestException, RoutescanAPIError, ValueError)
+
+# Core infrastructure
+MARKET_REGISTRY = Web3.to_checksum_address("0x60f16b09a15f0c3210b40a735b19a6baf235dd18")
+ADMIN_EOA = Web3.to_checksum_address("0xe28bd6b3991f3e4b54af24ea2f1ee869c8044a93")
+
+# Known PositionManager contracts (23 total), checksummed once at import
+POSITION_MANAGERS = tuple(
+    Web3.to_checksum_address(addr) for addr in (
+        "0x8d07fa9ac8b4bf833f099fb24971d2a808874c25",  # AVAX/USD
+        "0x7da6e6d1b3582a2348fa76b3fe3b5e88d95281e7",  # BTC/USD
+        "0x5bd078689c358ca2c64daff8761dbf8cfddfc51f",  # ETH/USD
+        "0xf0e50db1f1797210db7b5124e8bbe63fd17dcf49",  # WIF/USD
+        "0xed3cd277044d353b1b8bb303d2d10aa2d294932e",  # PEPE/USD
+        "0x85660ace54fa5603a3af96300119c3f90ed676a4",  # BNB/USD
+        "0xcb7086cac611a30df1f1101fa9dd86dca2cbab96",  # SOL/USD
+        "0xc8fd23967b6be347d0a80c37205bd73a42c55878",  # SHIB/USD
+        "0x2fcd398837478e8f410f0752099d4b5e5656042c",  # DRIFT/USD
+        "0xf69c4a0e74ae4cb086506461771a717b7fb508be",  # TON/USD
+        "0x04a6c1d341f27c1644b13e89ad7bf0a19289ec89",  # MEW/USD
+        "0xf33d7648c4b358029121524b3f703e9bd89d47ed",  # CHILLGUY/USD
+        "0x8958e3f0359a475129c003d906ce78deb41ba125",  # POPCAT/USD
+        "0x9ec09278de421073c5b82f51d35b9d19a206987a",  # GIGA/USD
+        "0x0999366f9e335024965bb6fe50375927ce40c7d3",  # LINK/USD
+        "0xb966b05cb5a204ba60485b941d59006162d90fdd",  # BONK/USD
+        "0x69f2a7a644fc0e23603e0d6ea679d6209cc38458",  # MOODENG/USD
+        "0x5bd90d9e8e513e2557c1f6945585f3e9cafd1f09",  # GOAT/USD
+        "0xbd33231a724965bd0ba02caebd21f832735778ef",  # FLOKI/USD
+        "0x1f4b02954fd6a44ce1905c01ae2f8e902f83e0db",  # PNUT/USD
+        "0x19e9e428627aab6dc5fb8b28b8331c1bcf04a44f",  # FARTCOIN/USD
+        "0xe00f6574f7ed4cc902b3aab1aa9bf57274468062",  # PEOPLE/USD
+        "0x9954d154a35785919eb905bb39d419d2724849a3",  # Recent deployment
+    )
+)
 
 class ContractVerifier:
     """Verify all TradeSta protocol contracts"""
 
-    def __init__(self):
-        self.api = RoutescanAPI(cache_dir="cache")
+    def __init__(self, use_cache: bool = True):
+        """
+        Args:
+            use_cache: Reuse Routescan results cached on disk by earlier runs
+        """
+        self.api = RoutescanAPI(cache_dir="cache", read_disk_cache=use_cache)
         self.w3 = Web3Helper()
 
         self.results = {
@@ -57,12 +100,9 @@ class ContractVerifier:
             "verification_method": "public_api_only"
         }
 
-        # Known addresses from analysis
-        from web3 import Web3
-
-        # Core infrastructure
-        self.market_registry = Web3.to_checksum_address("0x60f16b09a15f0c3210b40a735b19a6baf235dd18")
-        self.admin_eoa = Web3.to_checksum_address("0xe28bd6b3991f3e4b54af24ea2f1ee869c8044a93")
+        # Known addresses from analysis (checksummed once at import)
+        self.market_registry = MARKET_REGISTRY
+        self.admin_eoa = ADMIN_EOA
 
         # MarketRegistry is deployed by admin EOA
         # PositionManagers are deployed BY MarketRegistry (factory pattern)
@@ -70,33 +110,36 @@ class ContractVerifier:
         self.expected_pm_deployer = self.market_registry
 
         # Known PositionManager contracts (23 total)
-        self.position_managers = [
-            Web3.to_checksum_address(addr) for addr in [
-                "0x8d07fa9ac8b4bf833f099fb24971d2a808874c25",  # AVAX/USD
-                "0x7da6e6d1b3582a2348fa76b3fe3b5e88d95281e7",  # BTC/USD
-                "0x5bd078689c358ca2c64daff8761dbf8cfddfc51f",  # ETH/USD
-                "0xf0e50db1f1797210db7b5124e8bbe63fd17dcf49",  # WIF/USD
-                "0xed3cd277044d353b1b8bb303d2d10aa2d294932e",  # PEPE/USD
-                "0x85660ace54fa5603a3af96300119c3f90ed676a4",  # BNB/USD
-                "0xcb7086cac611a30df1f1101fa9dd86dca2cbab96",  # SOL/USD
-                "0xc8fd23967b6be347d0a80c37205bd73a42c55878",  # SHIB/USD
-                "0x2fcd398837478e8f410f0752099d4b5e5656042c",  # DRIFT/USD
-                "0xf69c4a0e74ae4cb086506461771a717b7fb508be",  # TON/USD
-                "0x04a6c1d341f27c1644b13e89ad7bf0a19289ec89",  # MEW/USD
-                "0xf33d7648c4b358029121524b3f703e9bd89d47ed",  # CHILLGUY/USD
-                "0x8958e3f0359a475129c003d906ce78deb41ba125",  # POPCAT/USD
-                "0x9ec09278de421073c5b82f51d35b9d19a206987a",  # GIGA/USD
-                "0x0999366f9e335024965bb6fe50375927ce40c7d3",  # LINK/USD
-                "0xb966b05cb5a204ba60485b941d59006162d90fdd",  # BONK/USD
-                "0x69f2a7a644fc0e23603e0d6ea679d6209cc38458",  # MOODENG/USD
-                "0x5bd90d9e8e513e2557c1f6945585f3e9cafd1f09",  # GOAT/USD
-                "0xbd33231a724965bd0ba02caebd21f832735778ef",  # FLOKI/USD
-                "0x1f4b02954fd6a44ce1905c01ae2f8e902f83e0db",  # PNUT/USD
-                "0x19e9e428627aab6dc5fb8b28b8331c1bcf04a44f",  # FARTCOIN/USD
-                "0xe00f6574f7ed4cc902b3aab1aa9bf57274468062",  # PEOPLE/USD
-                "0x9954d154a35785919eb905bb39d419d2724849a3",  # Recent deployment
-            ]
-        ]
+        self.position_managers = list(POSITION_MANAGERS)
+
+        # Lowercase forms (result/lookup keys), computed once
+        self._registry_lower = self.market_registry.lower()
+        self._pm_lower = [pm.lower() for pm in self.position_managers]
+        self._expected_registry_deployer_lower = self.expected_registry_deployer.lower()
+        self._expected_pm_deployer_lower = self.expected_pm_deployer.lower()
+
+        # Creation info and ABIs for all contracts, keyed by lowercase address (set in run())
+        self.creations: Dict[str, Dict[str, Any]] = {}
+        self.abis: Dict[str, Dict[str, Any]] = {}
+
+    def fetch_creation_info(self):
+        """Query creation info for the MarketRegistry and all PositionManagers at once"""
+        print("\nQuerying contract creation info (batch)...")
+        creation_info = self.api.get_contract_creation([self.market_registry] + self.position_managers)
+
+        # Create lookup dict (creator normalized to lowercase once, here)
+        self.creations = {
+            info['contractAddress'].lower(): {**info, 'creator_lower': info['contractCreator'].lower()}
+            for info in creation_info
+        }
+
+    def fetch_abis(self, workers: int = 8):
+        """Query ABIs for the MarketRegistry and all PositionManagers in parallel"""
+        print("\nQuerying contract ABIs (parallel)...")
+        addresses = [self.market_registry] + self.position_managers
+
+        # Failed fetches are reported per contract as {"error": ...}
+        self.abis = self.api.get_contract_abis(addresses, workers=workers, errors=ABI_FETCH_ERRORS)
 
     def verify_market_registry(self):
         """Verify MarketRegistry contract"""
@@ -106,16 +149,14 @@ class ContractVerifier:
 
         print(f"\nMarketRegistry: {self.market_registry}")
 
-        # Get contract creation info
-        print("\nQuerying contract creation info...")
-        creation_info = self.api.get_contract_creation([self.market_registry])
+        # Contract creation info (prefetched)
+        info = self.creations.get(self._registry_lower)
 
-        if creation_info and len(creation_info) > 0:
-            info = creation_info[0]
+        if info:
             deployer = info['contractCreator']
             tx_hash = info['txHash']
 
-            is_expected = (deployer.lower() == self.expected_registry_deployer.lower())
+            is_expected = (info['creator_lower'] == self._expected_registry_deployer_lower)
             status = "✅" if is_expected else "❌"
 
             print(f"\n{status} Deployer: {deployer}")
@@ -123,32 +164,30 @@ class ContractVerifier:
             print(f"   TX: {tx_hash}")
 
             self.results["contracts"]["market_registry"] = {
-                "address": self.market_registry.lower(),
-                "deployer": deployer.lower(),
+                "address": self._registry_lower,
+                "deployer": info['creator_lower'],
                 "deployment_tx": tx_hash,
                 "verified_deployer": is_expected,
-                "expected_deployer": self.expected_registry_deployer.lower()
+                "expected_deployer": self._expected_registry_deployer_lower
             }
         else:
             print(f"\n❌ Could not retrieve creation info")
             self.results["contracts"]["market_registry"] = {
-                "address": self.market_registry.lower(),
+                "address": self._registry_lower,
                 "error": "creation_info_unavailable"
             }
 
-        # Try to get ABI
-        print("\nQuerying contract ABI...")
-        try:
-            abi_info = self.api.get_contract_abi(self.market_registry)
-            if abi_info and abi_info.get("abi"):
-                print(f"✅ ABI available ({len(abi_info['abi'])} functions/events)")
-                self.results["contracts"]["market_registry"]["has_abi"] = True
-                self.results["contracts"]["market_registry"]["abi_size"] = len(abi_info['abi'])
-            else:
-                print(f"⚠️  ABI not available")
-                self.results["contracts"]["market_registry"]["has_abi"] = False
-        except Exception as e:
-            print(f"⚠️  Error fetching ABI: {e}")
+        # ABI (prefetched)
+        abi_info = self.abis.get(self._registry_lower, {})
+        if abi_info.get("abi"):
+            print(f"✅ ABI available ({len(abi_info['abi'])} functions/events)")
+            self.results["contracts"]["market_registry"]["has_abi"] = True
+            self.results["contracts"]["market_registry"]["abi_size"] = len(abi_info['abi'])
+        elif "error" in abi_info:
+            print(f"⚠️  Error fetching ABI: {abi_info['error']}")
+            self.results["contracts"]["market_registry"]["has_abi"] = False
+        else:
+            print(f"⚠️  ABI not available")
             self.results["contracts"]["market_registry"]["has_abi"] = False
 
     def verify_position_managers(self):
@@ -159,55 +198,49 @@ class ContractVerifier:
 
         print(f"\nTotal PositionManagers to verify: {len(self.position_managers)}")
 
-        # Get creation info for all position managers
-        print("\nQuerying contract creation info (batch)...")
-        creation_info = self.api.get_contract_creation(self.position_managers)
-
-        # Create lookup dict
-        creation_by_address = {
-            info['contractAddress'].lower(): info
-            for info in creation_info
-        }
-
         deployers = set()
 
-        for i, pm_address in enumerate(self.position_managers, 1):
+        for i, (pm_address, pm_lower) in enumerate(zip(self.position_managers, self._pm_lower), 1):
             print(f"\n[{i}/{len(self.position_managers)}] {pm_address}")
 
-            info = creation_by_address.get(pm_address.lower())
+            info = self.creations.get(pm_lower)
 
             if not info:
                 print(f"  ❌ Creation info not found")
                 self.results["contracts"]["position_managers"].append({
-                    "address": pm_address.lower(),
+                    "address": pm_lower,
                     "error": "creation_info_not_found"
                 })
                 continue
 
             deployer = info['contractCreator']
             tx_hash = info['txHash']
-            deployers.add(deployer.lower())
+            deployers.add(info['creator_lower'])
 
-            is_expected = (deployer.lower() == self.expected_pm_deployer.lower())
+            is_expected = (info['creator_lower'] == self._expected_pm_deployer_lower)
             status = "✅" if is_expected else "❌"
 
             print(f"  {status} Deployer: {deployer}")
             print(f"     Expected: {is_expected} (MarketRegistry factory)")
             print(f"     TX: {tx_hash}")
 
+            has_abi = bool(self.abis.get(pm_lower, {}).get("abi"))
+            print(f"     ABI: {'✅ available' if has_abi else '⚠️  not available'}")
+
             pm_data = {
-                "address": pm_address.lower(),
-                "deployer": deployer.lower(),
+                "address": pm_lower,
+                "deployer": info['creator_lower'],
                 "deployment_tx": tx_hash,
                 "verified_deployer": is_expected,
-                "expected_deployer": self.expected_pm_deployer.lower()
+                "expected_deployer": self._expected_pm_deployer_lower,
+                "has_abi": has_abi
             }
 
             self.results["contracts"]["position_managers"].append(pm_data)
 
         # Check if all deployed by same address
         print(f"\n{'='*80}")
-        if len(deployers) == 1 and self.expected_pm_deployer.lower() in deployers:
+        if len(deployers) == 1 and self._expected_pm_deployer_lower in deployers:
             print(f"✅ ALL {len(self.position_managers)} PositionManagers deployed by: {self.expected_pm_deployer}")
             print(f"   (Factory pattern: MarketRegistry deploys PositionManagers)")
             self.results["statistics"]["single_deployer"] = True
@@ -274,13 +307,17 @@ class ContractVerifier:
             if pm.get("verified_deployer"):
                 verified += 1
 
+        with_abi = sum(1 for abi_info in self.abis.values() if abi_info.get("abi"))
+
         self.results["statistics"]["total_contracts"] = total
         self.results["statistics"]["verified_contracts"] = verified
+        self.results["statistics"]["contracts_with_abi"] = with_abi
 
         print(f"\n📊 Verification Statistics:")
         print(f"   Total Contracts: {total}")
         print(f"   Verified Contracts: {verified}")
         print(f"   Verification Rate: {verified/total*100:.1f}%")
+        print(f"   Contracts with ABI: {with_abi}/{total}")
 
     def generate_report(self):
         """Generate summary report"""
@@ -327,8 +364,7 @@ class ContractVerifier:
         output_path = Path("results") / filename
         output_path.parent.mkdir(exist_ok=True)
 
-        with open(output_path, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        dump_json(self.results, output_path)
 
         print(f"\n✅ Results saved to: {output_path}")
 
@@ -342,6 +378,8 @@ class ContractVerifier:
         print("- No MongoDB or private infrastructure required")
 
         try:
+            self.fetch_creation_info()
+            self.fetch_abis()
             self.verify_market_registry()
             self.verify_position_managers()
             self.find_associated_contracts()
@@ -1,302 +0,0 @@
-#!/usr/bin/env python3
-"""
-TradeSta Event Statistics Verification Script
-
-Verifies protocol activity through event analysis:
-- PositionCreated events (position count per market)
-- PositionClosed events (closures)
-- PositionLiquidated events (liquidations)
-- LimitOrderExecuted events (order activity)
-
-This script uses ONLY public data sources:
-- Routescan API for event logs (with pagination)
-- No MongoDB or private infrastructure required
-
-Strategy:
-- Query all events using Routescan's getLogs endpoint
-- Use pagination to retrieve complete event history
-- Generate statistics for each PositionManager contract
-- Sample verification (first 3 markets) due to time constraints
-"""
-
-import sys
-import json
-from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Any
-
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent))
-
-from utils.routescan_api import RoutescanAPI
-from utils.web3_helpers import Web3Helper, EVENT_SIGNATURES
-
-class EventVerifier:
-    """Verify TradeSta protocol event statistics"""
-
-    def __init__(self, sample_size: int = 3):
-        self.api = RoutescanAPI(cache_dir="cache")
-        self.w3 = Web3Helper()
-        self.sample_size = sample_size  # Verify first N markets for demo
-
-        self.results = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "latest_block": self.w3.get_latest_block(),
-            "block_range": {
-                "from": 63_000_000,  # TradeSta deployment start
-                "to": None  # Will be set to latest block
-            },
-            "markets": [],
-            "summary": {
-                "total_markets_verified": 0,
-                "total_positions_created": 0,
-                "total_positions_closed": 0,
-                "total_liquidations": 0,
-                "total_orders_executed": 0
-            },
-            "verification_method": "public_api_only",
-            "sample_verification": True,
-            "sample_size": sample_size
-        }
-
-        self.results["block_range"]["to"] = self.results["latest_block"]
-
-        # Known addresses from analysis
-        from web3 import Web3
-
-        # Top 3 markets (AVAX, BTC, ETH) for sample verification
-        self.markets = [
-            {
-                "name": "AVAX/USD",
-                "position_manager": Web3.to_checksum_address("0x8d07fa9ac8b4bf833f099fb24971d2a808874c25")
-            },
-            {
-                "name": "BTC/USD",
-                "position_manager": Web3.to_checksum_address("0x7da6e6d1b3582a2348fa76b3fe3b5e88d95281e7")
-            },
-            {
-                "name": "ETH/USD",
-                "position_manager": Web3.to_checksum_address("0x5bd078689c358ca2c64daff8761dbf8cfddfc51f")
-            }
-        ][:sample_size]
-
-    def verify_position_created_events(self, market: Dict[str, str]) -> int:
-        """Count PositionCreated events for a market"""
-        print(f"\n  Querying PositionCreated events...")
-
-        events = self.api.get_all_logs(
-            address=market["position_manager"],
-            topic0=EVENT_SIGNATURES["PositionCreated"],
-            from_block=self.results["block_range"]["from"],
-            to_block=self.results["block_range"]["to"],
-            offset=10000  # Max per page
-        )
-
-        count = len(events)
-        print(f"  ✅ Found {count} PositionCreated events")
-
-        return count
-
-    def verify_position_closed_events(self, market: Dict[str, str]) -> int:
-        """Count PositionClosed events for a market"""
-        print(f"\n  Querying PositionClosed events...")
-
-        events = self.api.get_all_logs(
-            address=market["position_manager"],
-            topic0=EVENT_SIGNATURES["PositionClosed"],
-            from_block=self.results["block_range"]["from"],
-            to_block=self.results["block_range"]["to"],
-            offset=10000
-        )
-
-        count = len(events)
-        print(f"  ✅ Found {count} PositionClosed events")
-
-        return count
-
-    def verify_liquidation_events(self, market: Dict[str, str]) -> int:
-        """Count PositionLiquidated events for a market"""
-        print(f"\n  Querying PositionLiquidated events...")
-
-        events = self.api.get_all_logs(
-            address=market["position_manager"],
-            topic0=EVENT_SIGNATURES["PositionLiquidated"],
-            from_block=self.results["block_range"]["from"],
-            to_block=self.results["block_range"]["to"],
-            offset=10000
-        )
-
-        count = len(events)
-        print(f"  ✅ Found {count} PositionLiquidated events")
-
-        return count
-
-    def verify_order_events(self, market: Dict[str, str]) -> int:
-        """Count LimitOrderExecuted events for a market (Orders contract)"""
-        print(f"\n  Querying LimitOrderExecuted events...")
-        print(f"  Note: Orders contract address would need to be queried from PositionManager")
-        print(f"  Skipping for this sample verification")
-
-        # For full verification, would:
-        # 1. Query PositionManager for associated Orders contract address
-        # 2. Query Orders contract for LimitOrderExecuted events
-
-        return 0
-
-    def verify_market(self, market: Dict[str, str]):
-        """Verify all event statistics for a single market"""
-        print(f"\n{'='*80}")
-        print(f"VERIFYING MARKET: {market['name']}")
-        print(f"{'='*80}")
-        print(f"PositionManager: {market['position_manager']}")
-
-        market_data = {
-            "name": market["name"],
-            "position_manager": market["position_manager"].lower(),
-            "events": {}
-        }
-
-        # Count each event type
-        positions_created = self.verify_position_created_events(market)
-        positions_closed = self.verify_position_closed_events(market)
-        liquidations = self.verify_liquidation_events(market)
-        orders_executed = self.verify_order_events(market)
-
-        market_data["events"] = {
-            "positions_created": positions_created,
-            "positions_closed": positions_closed,
-            "liquidations": liquidations,
-            "orders_executed": orders_executed,
-            "open_positions": positions_created - positions_closed - liquidations
-        }
-
-        # Update summary
-        self.results["summary"]["total_positions_created"] += positions_created
-        self.results["summary"]["total_positions_closed"] += positions_closed
-        self.results["summary"]["total_liquidations"] += liquidations
-        self.results["summary"]["total_orders_executed"] += orders_executed
-
-        # Calculate derived metrics
-        if positions_created > 0:
-            market_data["metrics"] = {
-                "liquidation_rate": (liquidations / positions_created) * 100,
-                "closure_rate": ((positions_closed + liquidations) / positions_created) * 100,
-                "avg_positions_per_day": self._calculate_avg_positions_per_day(positions_created)
-            }
-
-        self.results["markets"].append(market_data)
-
-        # Print summary
-        print(f"\n  📊 Market Summary:")
-        print(f"     Positions Created: {positions_created}")
-        print(f"     Positions Closed: {positions_closed}")
-        print(f"     Liquidations: {liquidations}")
-        print(f"     Open Positions: {market_data['events']['open_positions']}")
-        if positions_created > 0:
-            print(f"     Liquidation Rate: {market_data['metrics']['liquidation_rate']:.2f}%")
-            print(f"     Closure Rate: {market_data['metrics']['closure_rate']:.2f}%")
-
-    def _calculate_avg_positions_per_day(self, total_positions: int) -> float:
-        """Calculate average positions per day based on block range"""
-        # Avalanche C-Chain: ~2 second block time
-        # Rough estimate of days
-        blocks = self.results["block_range"]["to"] - self.results["block_range"]["from"]
-        days = (blocks * 2) / (60 * 60 * 24)  # blocks * 2 sec / seconds per day
-
-        return total_positions / days if days > 0 else 0
-
-    def verify_all_markets(self):
-        """Verify event statistics for all sample markets"""
-        print(f"\n{'='*80}")
-        print(f"EVENT STATISTICS VERIFICATION")
-        print(f"{'='*80}")
-        print(f"\nSample Size: {self.sample_size} markets (out of 23 total)")
-        print(f"Block Range: {self.results['block_range']['from']:,} - {self.results['block_range']['to']:,}")
-
-        for market in self.markets:
-            self.verify_market(market)
-            self.results["summary"]["total_markets_verified"] += 1
-
-    def generate_report(self):
-        """Generate summary report"""
-        print(f"\n{'='*80}")
-        print(f"EVENT VERIFICATION SUMMARY")
-        print(f"{'='*80}")
-
-        summary = self.results["summary"]
-
-        print(f"\n📊 Verification Scope:")
-        print(f"   Block Range: {self.results['block_range']['from']:,} - {self.results['block_range']['to']:,}")
-        print(f"   Markets Verified: {summary['total_markets_verified']} (sample)")
-        print(f"   Total Markets: 23")
-
-        print(f"\n📈 Aggregate Statistics (Sample):")
-        print(f"   Positions Created: {summary['total_positions_created']:,}")
-        print(f"   Positions Closed: {summary['total_positions_closed']:,}")
-        print(f"   Liquidations: {summary['total_liquidations']:,}")
-        print(f"   Orders Executed: {summary['total_orders_executed']:,}")
-
-        total_closed = summary['total_positions_closed'] + summary['total_liquidations']
-        open_positions = summary['total_positions_created'] - total_closed
-
-        print(f"   Open Positions: {open_positions:,}")
-
-        if summary['total_positions_created'] > 0:
-            liq_rate = (summary['total_liquidations'] / summary['total_positions_created']) * 100
-            print(f"   Liquidation Rate: {liq_rate:.2f}%")
-
-        print(f"\n🎯 Overall Assessment:")
-        print(f"   ✅ Event statistics successfully verified via public API")
-        print(f"   ✅ Pagination enabled complete event retrieval")
-        print(f"   ℹ️  Sample verification (first {self.sample_size} markets)")
-        print(f"   ℹ️  Full verification would process all 23 markets")
-
-        print(f"\n⏱️  Performance:")
-        print(f"   Verification Method: Routescan API with pagination")
-        print(f"   Time Estimate (full verification): ~5-10 minutes")
-        print(f"   Cache: Enabled (subsequent runs instant)")
-
-    def save_results(self, filename: str = "events_verified.json"):
-        """Save results to JSON file"""
-        output_path = Path("results") / filename
-        output_path.parent.mkdir(exist_ok=True)
-
-        with open(output_path, 'w') as f:
-            json.dump(self.results, f, indent=2)
-
-        print(f"\n✅ Results saved to: {output_path}")
-
-    def run(self):
-        """Run full verification"""
-        print("="*80)
-        print("TRADESTA EVENT STATISTICS VERIFICATION")
-        print("="*80)
-        print("\nUsing ONLY public data sources:")
-        print("- Routescan API (event logs with pagination)")
-        print("- No MongoDB or private infrastructure required")
-
-        try:
-            self.verify_all_markets()
-            self.generate_report()
-            self.save_results()
-
-            print("\n" + "="*80)
-            print("VERIFICATION COMPLETE")
-            print("="*80)
-
-        except Exception as e:
-            print(f"\n❌ ERROR: {e}")
-            import traceback
-            traceback.print_exc()
-            sys.exit(1)
-
-
-def main():
-    # Default to 3 markets for sample verification
-    # For full verification, set sample_size=23
-    verifier = EventVerifier(sample_size=3)
-    verifier.run()
-
-
-if __name__ == "__main__":
-    main()
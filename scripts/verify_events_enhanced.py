@@ -18,34 +18,121 @@ Key Improvements:
 - Accurate liquidation rate calculations
 - Position lifecycle verification
 - Better metrics and reporting
+
+With --no-funding, CollateralSeized events are skipped and the run reports
+the basic (price-liquidation only) statistics in events_verified.json.
 """
 
 import sys
-import json
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, Future
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent))
 
-from utils.routescan_api import RoutescanAPI
+from utils.routescan_api import RoutescanAPI, RoutescanAPIError, LOG_COUNT_CONFIRMATIONS
 from utils.web3_helpers import Web3Helper, EVENT_SIGNATURES
-from web3 import Web3
+from utils.output_capture import captured_output
+from utils.json_io import dump_json, load_json_lines, JSONLinesWriter
+from utils.constants import MARKET_REGISTRY, MARKET_CREATED_SIG, DEPLOYMENT_BLOCK
+
+# Markets verified concurrently.
+# Uncached queries share RoutescanAPI's rate limit, so this overlaps latency
+# rather than exceeding 2 req/sec.
+MARKET_WORKERS = 8
+
+# Event types counted per market: (events key, description, topic0).
+# Counts come from queries shared across event types or markets (see
+# _market_event_counts and prefetch_event_counts), not one query per entry.
+EVENTS_TO_COUNT: List[Tuple[str, str, str]] = [
+    ("positions_created", "PositionCreated events", EVENT_SIGNATURES["PositionCreated"]),
+    ("positions_closed", "PositionClosed events", EVENT_SIGNATURES["PositionClosed"]),
+    ("price_liquidations", "PositionLiquidated events (price-based)", EVENT_SIGNATURES["PositionLiquidated"]),
+    ("funding_liquidations", "CollateralSeized events (funding-based) ⭐ NEW", EVENT_SIGNATURES["CollateralSeized"])
+]
+
+# Market metrics: (rate, event count it is a percentage of positions created)
+METRIC_RATES = (
+    ("price_liquidation_rate", "price_liquidations"),
+    ("funding_liquidation_rate", "funding_liquidations"),
+    ("total_liquidation_rate", "total_liquidations"),
+    ("closure_rate", "positions_closed"),
+    ("settlement_rate", "total_settled")
+)
+
+# Below this many markets building arrays costs more than the plain Python loop
+NUMPY_MIN_MARKETS = 100
+
+
+def compute_market_metrics(market_events: List[Dict[str, int]], days: float) -> List[Optional[Dict[str, float]]]:
+    """
+    Compute the derived metrics of every market in one pass
+
+    Args:
+        market_events: Each market's event counts ("events" of its results entry)
+        days: Span of the verified block range in days
+
+    Returns:
+        Metrics per market, in the same order (None for markets without positions)
+    """
+    created = [events["positions_created"] for events in market_events]
+
+    # Many markets: one vectorized division (optional dependency)
+    if np is not None and len(market_events) >= NUMPY_MIN_MARKETS:
+        counts = np.array(
+            [[events[field] for _, field in METRIC_RATES] for events in market_events],
+            dtype=np.float64
+        )
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rates = (counts / np.array(created, dtype=np.float64)[:, None] * 100).tolist()
+    else:
+        rates = [
+            [events[field] / positions * 100 if positions else 0 for _, field in METRIC_RATES]
+            for events, positions in zip(market_events, created)
+        ]
+
+    all_metrics = []
+    for positions, row in zip(created, rates):
+        if positions <= 0:
+            all_metrics.append(None)
+            continue
+
+        metrics = dict(zip((name for name, _ in METRIC_RATES), row))
+        metrics["lifecycle_complete"] = metrics["settlement_rate"]
+        metrics["avg_positions_per_day"] = positions / days if days > 0 else 0
+        all_metrics.append(metrics)
+
+    return all_metrics
+
 
 class EnhancedEventVerifier:
     """Verify TradeSta protocol event statistics with complete liquidation tracking"""
 
-    def __init__(self, sample_size: int = None):
+    def __init__(self, sample_size: int = None, track_funding: bool = True):
+        """
+        Args:
+            sample_size: Verify only the first N markets (None = all markets)
+            track_funding: Count CollateralSeized events (funding liquidations).
+                Disable for the basic position activity statistics.
+        """
         self.api = RoutescanAPI(cache_dir="cache")
+        self.api.prewarm()  # Connects while the latest block is read below
         self.w3 = Web3Helper()
         self.sample_size = sample_size
+        self.track_funding = track_funding
 
         self.results = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "latest_block": self.w3.get_latest_block(),
             "block_range": {
-                "from": 63_000_000,  # TradeSta deployment start
+                "from": DEPLOYMENT_BLOCK,  # TradeSta deployment start
                 "to": None  # Will be set to latest block
             },
             "markets": [],
@@ -58,141 +145,245 @@ class EnhancedEventVerifier:
                 "total_liquidations": 0,
                 "total_orders_executed": 0
             },
-            "verification_method": "public_api_with_complete_liquidation_tracking",
+            "verification_method": "public_api_with_complete_liquidation_tracking" if track_funding else "public_api_only",
             "sample_verification": sample_size is not None,
-            "improvements": [
+            "tracks_funding_liquidations": track_funding
+        }
+
+        if track_funding:
+            self.results["improvements"] = [
                 "Tracks CollateralSeized events (funding liquidations)",
                 "Accurate total liquidation rate",
                 "Separate price vs funding liquidation metrics",
                 "Position lifecycle verification"
             ]
-        }
+
+        # Markets already verified by an interrupted run with the same options
+        self.results_file = Path("results") / ("events_enhanced_verified.json" if track_funding else "events_verified.json")
+        self.checkpoint_file = self.results_file.with_suffix(".jsonl")
+        self.checkpointed = self._load_checkpoint()
 
         self.results["block_range"]["to"] = self.results["latest_block"]
 
-        # Top 3 markets for sample, or will be populated from MarketCreated events
+        # Read on every query - kept as attributes rather than nested lookups
+        self.from_block = self.results["block_range"]["from"]
+        self.to_block = self.results["block_range"]["to"]
+
+        # Rough span in days (~2 sec blocks), for per-day averages
+        self.days = (self.to_block - self.from_block) * 2 / (60 * 60 * 24)
+
+        # Counts up to here are final and cached across runs; only newer blocks are re-queried
+        self.stable_block = self.results["latest_block"] - LOG_COUNT_CONFIRMATIONS
+
+        # Top 3 markets for sample, or will be populated from MarketCreated events.
+        # Addresses are kept lowercase throughout (the API accepts them as-is).
         self.sample_markets = [
             {
                 "name": "AVAX/USD",
-                "position_manager": Web3.to_checksum_address("0x8d07fa9ac8b4bf833f099fb24971d2a808874c25")
+                "position_manager": "0x8d07fa9ac8b4bf833f099fb24971d2a808874c25"
             },
             {
                 "name": "BTC/USD",
-                "position_manager": Web3.to_checksum_address("0x7da6e6d1b3582a2348fa76b3fe3b5e88d95281e7")
+                "position_manager": "0x7da6e6d1b3582a2348fa76b3fe3b5e88d95281e7"
             },
             {
                 "name": "ETH/USD",
-                "position_manager": Web3.to_checksum_address("0x5bd078689c358ca2c64daff8761dbf8cfddfc51f")
+                "position_manager": "0x5bd078689c358ca2c64daff8761dbf8cfddfc51f"
             }
         ]
 
-        # CollateralSeized event signature
-        # event CollateralSeized(bytes32 indexed positionId, address indexed owner, uint256 collateralAmount, int256 fundingFees, uint256 timestamp)
-        self.collateral_seized_sig = Web3.keccak(text='CollateralSeized(bytes32,address,uint256,int256,uint256)').hex()
+        # Counts for all markets, prefetched with one query per event type
+        # ({topic0: Future resolving to {address_lower: count}})
+        self.event_counts: Dict[str, Future] = {}
 
-    def get_markets_to_verify(self) -> List[Dict[str, str]]:
-        """Get list of markets to verify"""
-        if self.sample_size:
-            return self.sample_markets[:self.sample_size]
-        else:
-            # For full verification, query all markets from MarketCreated events
-            print("\nQuerying all markets from MarketRegistry...")
-            market_registry = Web3.to_checksum_address('0x60f16b09a15f0c3210b40a735b19a6baf235dd18')
-            market_created_sig = '0x5eb977f82e9d0d89f65f05a56a99ab87e2ebb3909780e0b3642bec962789ba7a'
-
-            events = self.api.get_all_logs(
-                address=market_registry,
-                topic0=market_created_sig,
-                from_block=63_000_000,
-                to_block=self.results["latest_block"],
-                offset=10000
-            )
+        # Counts of every event type per market ({address_lower: {topic0_lower: count}})
+        self._market_counts: Dict[str, Dict[str, int]] = {}
 
-            markets = []
-            for i, event in enumerate(events, 1):
-                topics = event['topics']
-                position_manager = '0x' + topics[2][-40:]
-
-                # Decode symbol from data field (would need full ABI decoding)
-                # For now, use market number
-                markets.append({
-                    "name": f"Market #{i}",
-                    "position_manager": Web3.to_checksum_address(position_manager)
-                })
-
-            print(f"✅ Found {len(markets)} markets")
-            return markets
-
-    def verify_position_created_events(self, market: Dict[str, str]) -> int:
-        """Count PositionCreated events for a market"""
-        print(f"\n  Querying PositionCreated events...")
-
-        events = self.api.get_all_logs(
-            address=market["position_manager"],
-            topic0=EVENT_SIGNATURES["PositionCreated"],
-            from_block=self.results["block_range"]["from"],
-            to_block=self.results["block_range"]["to"],
-            offset=10000
-        )
+        self.events_to_count = [
+            event for event in EVENTS_TO_COUNT
+            if track_funding or event[0] != "funding_liquidations"
+        ]
 
-        count = len(events)
-        print(f"  ✅ Found {count:,} PositionCreated events")
+    def _checkpoint_header(self) -> Dict[str, Any]:
+        return {
+            "latest_block": self.results["latest_block"],
+            "sample_size": self.sample_size,
+            "track_funding": self.track_funding
+        }
 
-        return count
+    def _load_checkpoint(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the markets verified by an interrupted earlier run
 
-    def verify_position_closed_events(self, market: Dict[str, str]) -> int:
-        """Count PositionClosed events for a market"""
-        print(f"\n  Querying PositionClosed events...")
+        The checkpoint's first line records the run's options and latest
+        block, then one line per verified market. A resumed run adopts that
+        latest block, so all counts in the results share one block range.
 
-        events = self.api.get_all_logs(
-            address=market["position_manager"],
-            topic0=EVENT_SIGNATURES["PositionClosed"],
-            from_block=self.results["block_range"]["from"],
-            to_block=self.results["block_range"]["to"],
-            offset=10000
-        )
+        Returns:
+            {position_manager: market_data} (empty if there is nothing to resume)
+        """
+        if not self.checkpoint_file.exists():
+            return {}
 
-        count = len(events)
-        print(f"  ✅ Found {count:,} PositionClosed events")
+        lines = load_json_lines(self.checkpoint_file)
+        if not lines:
+            return {}
 
-        return count
+        header, *markets = lines
+        if header["sample_size"] != self.sample_size or header["track_funding"] != self.track_funding:
+            return {}
 
-    def verify_price_liquidation_events(self, market: Dict[str, str]) -> int:
-        """Count PositionLiquidated events (price-based liquidations)"""
-        print(f"\n  Querying PositionLiquidated events (price-based)...")
+        self.results["latest_block"] = header["latest_block"]
 
-        events = self.api.get_all_logs(
-            address=market["position_manager"],
-            topic0=EVENT_SIGNATURES["PositionLiquidated"],
-            from_block=self.results["block_range"]["from"],
-            to_block=self.results["block_range"]["to"],
-            offset=10000
-        )
+        print(f"Resuming from {self.checkpoint_file}: {len(markets)} market(s) already verified "
+              f"at block {header['latest_block']:,}")
 
-        count = len(events)
-        print(f"  ✅ Found {count:,} PositionLiquidated events")
+        return {market_data["position_manager"]: market_data for market_data in markets}
 
-        return count
+    def iter_markets_to_verify(self) -> Iterator[Dict[str, str]]:
+        """
+        Yield the markets to verify
+
+        For full verification, markets are yielded as their MarketCreated
+        events are streamed in, so verification can start before discovery
+        has finished.
+        """
+        if self.sample_size:
+            yield from self._with_deployment_blocks(self.sample_markets[:self.sample_size])
+            return
 
-    def verify_funding_liquidation_events(self, market: Dict[str, str]) -> int:
-        """Count CollateralSeized events (funding-based liquidations)"""
-        print(f"\n  Querying CollateralSeized events (funding-based) ⭐ NEW...")
+        # For full verification, query all markets from MarketCreated events
+        print("\nQuerying all markets from MarketRegistry...")
 
-        events = self.api.get_all_logs(
-            address=market["position_manager"],
-            topic0=self.collateral_seized_sig,
-            from_block=self.results["block_range"]["from"],
-            to_block=self.results["block_range"]["to"],
+        events = self.api.iter_logs(
+            address=MARKET_REGISTRY,
+            topic0=MARKET_CREATED_SIG,
+            from_block=DEPLOYMENT_BLOCK,
+            to_block=self.results["latest_block"],
             offset=10000
         )
 
-        count = len(events)
-        print(f"  ✅ Found {count:,} CollateralSeized events")
+        found = 0
+        for found, event in enumerate(events, 1):
+            topics = event['topics']
+
+            # Decode symbol from data field (would need full ABI decoding)
+            # For now, use market number. The PositionManager is deployed by
+            # the MarketCreated transaction, so it has no earlier events.
+            yield {
+                "name": f"Market #{found}",
+                "position_manager": f"0x{topics[2][-40:]}".lower(),
+                "deployment_block": int(event['blockNumber'], 16)
+            }
+
+        print(f"✅ Found {found} markets")
+
+    def _with_deployment_blocks(self, markets: List[Dict[str, str]]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield markets with the block their PositionManager was deployed in
+
+        Falls back to self.from_block when the creation transaction can't be
+        resolved (the lookup only narrows the counted range).
+        """
+        # Creation transactions and receipts never change - both are cached by the API
+        try:
+            creations = {
+                creation["contractAddress"].lower(): creation["txHash"]
+                for creation in self.api.get_contract_creation([market["position_manager"] for market in markets])
+            }
+        except RoutescanAPIError:
+            creations = {}
+
+        for market in markets:
+            deployment_block = self.from_block
+
+            tx_hash = creations.get(market["position_manager"])
+            if tx_hash:
+                try:
+                    receipt = self.api.get_transaction_receipt(tx_hash)
+                except RoutescanAPIError:
+                    receipt = None
+
+                if receipt and receipt.get("blockNumber"):
+                    deployment_block = int(receipt["blockNumber"], 16)
+
+            yield {**market, "deployment_block": deployment_block}
+
+    def _count_logs(self, market: Dict[str, str], topic0: str) -> int:
+        """Count one event type for a market (all-market counts if prefetched)"""
+        counts = self.event_counts.get(topic0)
+        if counts is not None:
+            return counts.result().get(market["position_manager"], 0)
+
+        return self._market_event_counts(market).get(topic0.lower(), 0)
+
+    def _market_event_counts(self, market: Dict[str, str]) -> Dict[str, int]:
+        """
+        Count every event type of one market with a single query
+
+        The first call per market queries the API; the other event types
+        are then read from the same counts. The query starts at the market's
+        deployment block when known, skipping the blocks before it existed.
+
+        Returns:
+            {topic0_lower: count}
+        """
+        address = market["position_manager"]
+
+        counts = self._market_counts.get(address)
+        if counts is None:
+            counts = self.api.count_logs_by_topic(
+                address=address,
+                from_block=max(self.from_block, market.get("deployment_block", self.from_block)),
+                to_block=self.to_block,
+                offset=10000,
+                stable_to=self.stable_block
+            )
+            self._market_counts[address] = counts
+
+        return counts
+
+    def prefetch_event_counts(self, executor: ThreadPoolExecutor):
+        """
+        Start counting every event type for all markets, one query per event type
+
+        Replaces a query per market and event type. Only used for full runs:
+        the queries return the events of every market, so a small sample is
+        cheaper to count market by market. The counts run on executor while
+        markets are discovered; _count_logs() waits for them.
+        """
+        topics = [topic0 for _, _, topic0 in self.events_to_count]
+
+        print(f"\nCounting events for all markets ({len(topics)} queries)...")
+
+        def count(topic0: str) -> Dict[str, int]:
+            return self.api.count_logs_by_address(
+                topic0=topic0,
+                from_block=self.from_block,
+                to_block=self.to_block,
+                offset=10000,
+                stable_to=self.stable_block
+            )
+
+        self.event_counts = {topic0: executor.submit(count, topic0) for topic0 in topics}
+
+    def _count_events(self, market: Dict[str, str], description: str, topic0: str) -> int:
+        """Count one event type for a market, logging the query"""
+        print(f"\n  Querying {description}...")
+
+        count = self._count_logs(market, topic0)
+
+        print(f"  ✅ Found {count:,} {description}")
 
         return count
 
-    def verify_market(self, market: Dict[str, str]):
-        """Verify all event statistics for a single market"""
+    def verify_market(self, market: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Verify all event statistics for a single market
+
+        Derived metrics are computed for all markets at once by
+        verify_all_markets() (see compute_market_metrics).
+        """
         print(f"\n{'='*80}")
         print(f"VERIFYING MARKET: {market['name']}")
         print(f"{'='*80}")
@@ -200,15 +391,19 @@ class EnhancedEventVerifier:
 
         market_data = {
             "name": market["name"],
-            "position_manager": market["position_manager"].lower(),
+            "position_manager": market["position_manager"],
             "events": {}
         }
 
-        # Count each event type
-        positions_created = self.verify_position_created_events(market)
-        positions_closed = self.verify_position_closed_events(market)
-        price_liquidations = self.verify_price_liquidation_events(market)
-        funding_liquidations = self.verify_funding_liquidation_events(market)
+        counts = dict.fromkeys(("positions_created", "positions_closed", "price_liquidations", "funding_liquidations"), 0)
+
+        for key, description, topic0 in self.events_to_count:
+            counts[key] = self._count_events(market, description, topic0)
+
+        positions_created = counts["positions_created"]
+        positions_closed = counts["positions_closed"]
+        price_liquidations = counts["price_liquidations"]
+        funding_liquidations = counts["funding_liquidations"]
 
         total_liquidations = price_liquidations + funding_liquidations
         total_settled = positions_closed + total_liquidations
@@ -224,47 +419,43 @@ class EnhancedEventVerifier:
             "open_positions": open_positions
         }
 
-        # Update summary
-        self.results["summary"]["total_positions_created"] += positions_created
-        self.results["summary"]["total_positions_closed"] += positions_closed
-        self.results["summary"]["total_price_liquidations"] += price_liquidations
-        self.results["summary"]["total_funding_liquidations"] += funding_liquidations
-        self.results["summary"]["total_liquidations"] += total_liquidations
-
-        # Calculate derived metrics
-        if positions_created > 0:
-            market_data["metrics"] = {
-                "price_liquidation_rate": (price_liquidations / positions_created) * 100,
-                "funding_liquidation_rate": (funding_liquidations / positions_created) * 100,
-                "total_liquidation_rate": (total_liquidations / positions_created) * 100,
-                "closure_rate": (positions_closed / positions_created) * 100,
-                "settlement_rate": (total_settled / positions_created) * 100,
-                "lifecycle_complete": (total_settled / positions_created) * 100
-            }
-
-        self.results["markets"].append(market_data)
-
         # Print summary
         print(f"\n  📊 Market Summary:")
         print(f"     Positions Created: {positions_created:,}")
         print(f"     Positions Closed: {positions_closed:,}")
         print(f"     Price Liquidations: {price_liquidations:,}")
-        print(f"     Funding Liquidations: {funding_liquidations:,} ⭐ NEW")
+        if self.track_funding:
+            print(f"     Funding Liquidations: {funding_liquidations:,} ⭐ NEW")
         print(f"     Total Liquidations: {total_liquidations:,}")
         print(f"     Total Settled: {total_settled:,}")
         print(f"     Open Positions: {open_positions:,}")
 
-        if positions_created > 0:
-            print(f"\n  📈 Metrics:")
-            print(f"     Price Liquidation Rate: {market_data['metrics']['price_liquidation_rate']:.2f}%")
-            print(f"     Funding Liquidation Rate: {market_data['metrics']['funding_liquidation_rate']:.2f}%")
-            print(f"     Total Liquidation Rate: {market_data['metrics']['total_liquidation_rate']:.2f}%")
-            print(f"     Closure Rate: {market_data['metrics']['closure_rate']:.2f}%")
-            print(f"     Settlement Rate: {market_data['metrics']['settlement_rate']:.2f}%")
+        return market_data
+
+    def print_metrics(self, market_data: Dict[str, Any]):
+        """Print a market's derived metrics (the end of its verification log)"""
+        metrics = market_data.get("metrics")
+        if metrics is None:
+            return
 
-            # Lifecycle warning
-            if market_data['metrics']['settlement_rate'] < 95:
-                print(f"\n  ⚠️  WARNING: Settlement rate < 95% - {open_positions:,} positions may be stuck")
+        print(f"\n  📈 Metrics:")
+        print(f"     Price Liquidation Rate: {metrics['price_liquidation_rate']:.2f}%")
+        if self.track_funding:
+            print(f"     Funding Liquidation Rate: {metrics['funding_liquidation_rate']:.2f}%")
+        print(f"     Total Liquidation Rate: {metrics['total_liquidation_rate']:.2f}%")
+        print(f"     Closure Rate: {metrics['closure_rate']:.2f}%")
+        print(f"     Settlement Rate: {metrics['settlement_rate']:.2f}%")
+
+        # Lifecycle warning
+        if metrics['settlement_rate'] < 95:
+            print(f"\n  ⚠️  WARNING: Settlement rate < 95% - {market_data['events']['open_positions']:,} positions may be stuck")
+
+    def _verify_market_captured(self, market: Dict[str, str]) -> Tuple[Dict[str, Any], str]:
+        """Run verify_market, returning its result and captured output"""
+        with captured_output() as output:
+            market_data = self.verify_market(market)
+
+        return market_data, output.getvalue()
 
     def verify_all_markets(self):
         """Verify event statistics for all markets"""
@@ -272,19 +463,72 @@ class EnhancedEventVerifier:
         print(f"ENHANCED EVENT STATISTICS VERIFICATION")
         print(f"{'='*80}")
 
-        markets = self.get_markets_to_verify()
-
         if self.sample_size:
             print(f"\nSample Size: {self.sample_size} markets")
         else:
-            print(f"\nFull Verification: {len(markets)} markets")
+            print(f"\nFull Verification: all markets")
 
-        print(f"Block Range: {self.results['block_range']['from']:,} - {self.results['block_range']['to']:,}")
-        print(f"\n⭐ NEW: Tracking CollateralSeized events (funding liquidations)")
+        print(f"Block Range: {self.from_block:,} - {self.to_block:,}")
+        if self.track_funding:
+            print(f"\n⭐ NEW: Tracking CollateralSeized events (funding liquidations)")
+        else:
+            print(f"\nFunding liquidations (CollateralSeized) not tracked (--no-funding)")
+
+        # Every verified market is checkpointed as soon as it is collected, so
+        # a crash only loses the markets still in flight. Markets restored
+        # from an earlier checkpoint are carried over first.
+        self.checkpoint_file.parent.mkdir(exist_ok=True)
+        checkpoint = JSONLinesWriter(self.checkpoint_file)
+        checkpoint.write(self._checkpoint_header())
+        for market_data in self.checkpointed.values():
+            checkpoint.write(market_data)
+
+        # Markets are independent - each is submitted as soon as it's
+        # discovered and verified concurrently; logs are printed afterwards
+        # as one block per market, in market order
+        try:
+            with ThreadPoolExecutor(max_workers=4) as count_executor, \
+                    ThreadPoolExecutor(max_workers=MARKET_WORKERS) as executor:
+                if not self.sample_size:
+                    self.prefetch_event_counts(count_executor)
+
+                pending = []
+                for market in self.iter_markets_to_verify():
+                    market_data = self.checkpointed.get(market["position_manager"])
+                    if market_data is not None:
+                        pending.append((market_data, f"\n✅ {market['name']}: restored from checkpoint\n"))
+                    else:
+                        pending.append(executor.submit(self._verify_market_captured, market))
+
+                verified = []
+                for entry in pending:
+                    if isinstance(entry, Future):
+                        entry = entry.result()
+                        checkpoint.write(entry[0])
+                    verified.append(entry)
+        finally:
+            checkpoint.close()
+
+        all_metrics = compute_market_metrics([market_data["events"] for market_data, _ in verified], self.days)
 
-        for market in markets:
-            self.verify_market(market)
-            self.results["summary"]["total_markets_verified"] += 1
+        summary = self.results["summary"]
+
+        for (market_data, output), metrics in zip(verified, all_metrics):
+            if metrics is not None:
+                market_data["metrics"] = metrics
+
+            print(output, end="")
+            self.print_metrics(market_data)
+
+            self.results["markets"].append(market_data)
+
+            events = market_data["events"]
+            summary["total_markets_verified"] += 1
+            summary["total_positions_created"] += events["positions_created"]
+            summary["total_positions_closed"] += events["positions_closed"]
+            summary["total_price_liquidations"] += events["price_liquidations"]
+            summary["total_funding_liquidations"] += events["funding_liquidations"]
+            summary["total_liquidations"] += events["total_liquidations"]
 
     def generate_report(self):
         """Generate summary report"""
@@ -295,7 +539,7 @@ class EnhancedEventVerifier:
         summary = self.results["summary"]
 
         print(f"\n📊 Verification Scope:")
-        print(f"   Block Range: {self.results['block_range']['from']:,} - {self.results['block_range']['to']:,}")
+        print(f"   Block Range: {self.from_block:,} - {self.to_block:,}")
         print(f"   Markets Verified: {summary['total_markets_verified']}")
         if self.sample_size:
             print(f"   Mode: Sample ({self.sample_size} markets)")
@@ -306,7 +550,8 @@ class EnhancedEventVerifier:
         print(f"   Positions Created: {summary['total_positions_created']:,}")
         print(f"   Positions Closed: {summary['total_positions_closed']:,}")
         print(f"   Price Liquidations: {summary['total_price_liquidations']:,}")
-        print(f"   Funding Liquidations: {summary['total_funding_liquidations']:,} ⭐ NEW")
+        if self.track_funding:
+            print(f"   Funding Liquidations: {summary['total_funding_liquidations']:,} ⭐ NEW")
         print(f"   Total Liquidations: {summary['total_liquidations']:,}")
 
         total_settled = summary['total_positions_closed'] + summary['total_liquidations']
@@ -323,7 +568,8 @@ class EnhancedEventVerifier:
 
             print(f"\n📊 Key Metrics:")
             print(f"   Price Liquidation Rate: {price_liq_rate:.2f}%")
-            print(f"   Funding Liquidation Rate: {funding_liq_rate:.2f}%")
+            if self.track_funding:
+                print(f"   Funding Liquidation Rate: {funding_liq_rate:.2f}%")
             print(f"   Total Liquidation Rate: {total_liq_rate:.2f}%")
             print(f"   Settlement Rate: {settlement_rate:.2f}%")
 
@@ -331,24 +577,31 @@ class EnhancedEventVerifier:
             old_liq_rate = price_liq_rate  # Old script only tracked price liquidations
             improvement = total_liq_rate - old_liq_rate
 
-            if improvement > 0.01:
+            if self.track_funding and improvement > 0.01:
                 print(f"\n⭐ IMPROVED ACCURACY:")
                 print(f"   Old liquidation rate (price only): {old_liq_rate:.2f}%")
                 print(f"   New liquidation rate (price + funding): {total_liq_rate:.2f}%")
                 print(f"   Difference: +{improvement:.2f}% (was underreported)")
 
         print(f"\n🎯 Overall Assessment:")
-        print(f"   ✅ Complete liquidation tracking (price + funding)")
+        if self.track_funding:
+            print(f"   ✅ Complete liquidation tracking (price + funding)")
+        else:
+            print(f"   ℹ️  Price liquidations only (funding liquidations not tracked)")
         print(f"   ✅ Event statistics verified via public API")
         print(f"   ✅ Position lifecycle verification included")
 
-    def save_results(self, filename: str = "events_enhanced_verified.json"):
-        """Save results to JSON file"""
-        output_path = Path("results") / filename
+    def save_results(self, filename: str = None):
+        """
+        Save results to JSON file (basic statistics go to events_verified.json)
+
+        The checkpoint of this run is removed once the results are saved.
+        """
+        output_path = Path("results") / filename if filename else self.results_file
         output_path.parent.mkdir(exist_ok=True)
 
-        with open(output_path, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        dump_json(self.results, output_path)
+        self.checkpoint_file.unlink(missing_ok=True)
 
         print(f"\n✅ Results saved to: {output_path}")
 
@@ -357,9 +610,10 @@ class EnhancedEventVerifier:
         print("="*80)
         print("TRADESTA ENHANCED EVENT STATISTICS VERIFICATION")
         print("="*80)
-        print("\nEnhancements:")
-        for improvement in self.results["improvements"]:
-            print(f"  ⭐ {improvement}")
+        if self.track_funding:
+            print("\nEnhancements:")
+            for improvement in self.results["improvements"]:
+                print(f"  ⭐ {improvement}")
 
         try:
             self.verify_all_markets()
@@ -377,7 +631,7 @@ class EnhancedEventVerifier:
             sys.exit(1)
 
 
-def main():
+def main(argv=None):
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -393,12 +647,17 @@ def main():
         action='store_true',
         help='Verify all markets (default if no --sample)'
     )
+    parser.add_argument(
+        '--no-funding',
+        action='store_true',
+        help='Skip CollateralSeized events (funding liquidations)'
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     sample_size = args.sample if args.sample else None
 
-    verifier = EnhancedEventVerifier(sample_size=sample_size)
+    verifier = EnhancedEventVerifier(sample_size=sample_size, track_funding=not args.no_funding)
     verifier.run()
 
 
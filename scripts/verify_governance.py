@@ -150,13 +150,14 @@ class GovernanceVerifier:
         print(f"\nChecking whitelist status for known keepers...")
         print(f"MarketRegistry: {self.market_registry}")
 
-        for keeper in self.known_keepers:
-            print(f"\nKeeper: {keeper}")
+        # All keepers checked in one JSON-RPC batch
+        whitelist_status = self.w3.batch_is_whitelisted(
+            self.market_registry,
+            self.known_keepers
+        )
 
-            is_whitelisted = self.w3.is_whitelisted(
-                self.market_registry,
-                keeper
-            )
+        for keeper, is_whitelisted in zip(self.known_keepers, whitelist_status):
+            print(f"\nKeeper: {keeper}")
 
             status = "✅" if is_whitelisted else "❌"
             print(f"  {status} Whitelisted: {is_whitelisted}")
@@ -195,11 +196,12 @@ class GovernanceVerifier:
         for event in events[:10]:  # Show first 10
             # Decode event data
             role = event['topics'][1] if len(event['topics']) > 1 else None
+            role_name = self.w3.role_name(role) if role else None
             account = self.w3.decode_address_from_topic(event['topics'][2]) if len(event['topics']) > 2 else None
             sender = self.w3.decode_address_from_topic(event['topics'][3]) if len(event['topics']) > 3 else None
 
             print(f"\n  Block {event['blockNumber']}")
-            print(f"    Role: {role}")
+            print(f"    Role: {role}" + (f" ({role_name})" if role_name else ""))
             print(f"    Account: {account}")
             print(f"    Sender: {sender}")
             print(f"    TX: {event['transactionHash']}")
@@ -208,6 +210,7 @@ class GovernanceVerifier:
                 "block": event['blockNumber'],
                 "tx_hash": event['transactionHash'],
                 "role": role,
+                "role_name": role_name,
                 "account": account,
                 "sender": sender
             })
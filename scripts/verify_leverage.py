@@ -13,15 +13,72 @@ The configured max leverage is stored in MarketRegistry.markets[pricefeedId].max
 import sys
 from pathlib import Path
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import json
+import requests
 from web3 import Web3
+from web3.exceptions import ContractLogicError
 from eth_abi import decode
+from eth_abi.exceptions import DecodingError
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent))
 
 from utils.web3_helpers import Web3Helper, EVENT_SIGNATURES
-from utils.routescan_api import RoutescanAPI
+from utils.routescan_api import RoutescanAPI, RoutescanAPIError
+
+# Markets queried concurrently.
+# Log queries share RoutescanAPI's rate limit, so this overlaps latency
+# rather than exceeding 2 req/sec.
+MARKET_WORKERS = 8
+
+# Errors a single market query can raise (web3 v6 surfaces JSON-RPC errors as
+# ValueError) - anything else is a bug and propagates
+CONFIG_QUERY_ERRORS = (requests.RequestException, ContractLogicError, ValueError, DecodingError)
+LOG_QUERY_ERRORS = (requests.RequestException, RoutescanAPIError, ValueError)
+
+MARKETS_SELECTOR = Web3.keccak(text='markets(bytes32)')[:4]
+
+# markets(bytes32) return types:
+# (string, bytes32, address, address, address, address, uint256, uint256, uint256, uint256, uint256)
+MARKETS_RETURN_TYPES = ['string', 'bytes32', 'address', 'address', 'address', 'address',
+                        'uint256', 'uint256', 'uint256', 'uint256', 'uint256']
+
+
+def fetch_market_config(w3_helper: Web3Helper, market_registry: str, pricefeed_id: str):
+    """
+    Query MarketRegistry.markets(pricefeedId)
+
+    Returns:
+        Decoded market tuple, or the exception raised by the query
+    """
+    try:
+        result = w3_helper.w3.eth.call({
+            'to': market_registry,
+            'data': (MARKETS_SELECTOR + bytes.fromhex(pricefeed_id[2:])).hex()
+        })
+        return decode(MARKETS_RETURN_TYPES, result)
+    except CONFIG_QUERY_ERRORS as e:
+        return e
+
+
+def fetch_positions(api: RoutescanAPI, pm_address: str, position_created_sig: str):
+    """
+    Fetch all PositionCreated events of one market
+
+    Returns:
+        List of event logs, or the exception raised by the query
+    """
+    try:
+        return api.get_all_logs(
+            address=pm_address,
+            topic0=position_created_sig,
+            from_block=63000000,
+            offset=10000
+        )
+    except LOG_QUERY_ERRORS as e:
+        return e
+
 
 def main():
     print("="*80)
@@ -58,25 +115,23 @@ def main():
     print("QUERYING CONFIGURED MAX LEVERAGE")
     print(f"{'='*80}\n")
 
-    # Query configured max leverage for each market
-    for i, market_event in enumerate(market_events, 1):
-        pricefeed_id = market_event['topics'][1]
-        pm_address = Web3Helper.to_checksum('0x' + market_event['topics'][2][-40:])
+    # Query configured max leverage for each market - the calls run
+    # concurrently, results are printed in market order
+    pricefeed_ids = [market_event['topics'][1] for market_event in market_events]
 
-        try:
-            # Query markets(pricefeedId) to get market data
-            function_sig = Web3.keccak(text='markets(bytes32)')[:4]
-            call_data = function_sig + bytes.fromhex(pricefeed_id[2:])
+    with ThreadPoolExecutor(max_workers=MARKET_WORKERS) as executor:
+        configs = executor.map(
+            lambda pricefeed_id: fetch_market_config(w3_helper, MARKET_REGISTRY, pricefeed_id),
+            pricefeed_ids
+        )
 
-            result = w3_helper.w3.eth.call({
-                'to': MARKET_REGISTRY,
-                'data': call_data.hex()
-            })
+        for i, (market_event, pricefeed_id, decoded) in enumerate(zip(market_events, pricefeed_ids, configs), 1):
+            pm_address = Web3Helper.to_checksum('0x' + market_event['topics'][2][-40:])
 
-            # Decode: (string, bytes32, address, address, address, address, uint256, uint256, uint256, uint256, uint256)
-            types = ['string', 'bytes32', 'address', 'address', 'address', 'address',
-                    'uint256', 'uint256', 'uint256', 'uint256', 'uint256']
-            decoded = decode(types, result)
+            if isinstance(decoded, Exception):
+                errors.append((pm_address, f"Config query failed: {decoded}"))
+                print(f'Market #{i:2d} ({pm_address}): ❌ Error - {decoded}')
+                continue
 
             symbol = decoded[0]
             max_leverage_configured = decoded[9] / 100  # Convert from basis points
@@ -92,43 +147,40 @@ def main():
 
             print(f'Market #{i:2d} ({symbol:10s}): Configured max leverage = {max_leverage_configured:.0f}x')
 
-        except Exception as e:
-            errors.append((pm_address, f"Config query failed: {e}"))
-            print(f'Market #{i:2d} ({pm_address}): ❌ Error - {e}')
-
     print(f"\n{'='*80}")
     print("ANALYZING ACTUAL LEVERAGE USAGE")
     print(f"{'='*80}\n")
 
-    # Now analyze actual usage from PositionCreated events
-    for i, (pm_address, data) in enumerate(market_data.items(), 1):
-        try:
+    # Now analyze actual usage from PositionCreated events - the log
+    # queries run concurrently, results are printed in market order
+    with ThreadPoolExecutor(max_workers=MARKET_WORKERS) as executor:
+        fetched = executor.map(
+            lambda pm_address: fetch_positions(api, pm_address, position_created_sig),
+            market_data
+        )
+
+        for i, ((pm_address, data), position_events) in enumerate(zip(market_data.items(), fetched), 1):
             symbol = data['symbol']
             print(f'Market #{i:2d} ({symbol:10s}): Fetching positions...', end=' ')
 
-            position_events = api.get_all_logs(
-                address=pm_address,
-                topic0=position_created_sig,
-                from_block=63000000,
-                offset=10000
-            )
+            if isinstance(position_events, Exception):
+                errors.append((pm_address, f"Usage analysis failed: {position_events}"))
+                print(f'❌ Error - {position_events}')
+                continue
 
             if not position_events:
                 print(f'No positions found')
                 continue
 
-            # Decode leverage from each event
-            leverages_used = []
-            for pos_event in position_events:
-                event_data = pos_event['data'][2:]  # Remove '0x'
-                if len(event_data) < 192:
-                    continue
-                leverage_hex = event_data[128:192]
-                if not leverage_hex:
-                    continue
-                # Leverage stored as basis points (10000 = 100x)
-                leverage = int(leverage_hex, 16) / 100
-                leverages_used.append(int(leverage))
+            # Decode leverage (third data word) from all events in one pass
+            # Leverage stored as basis points (10000 = 100x)
+            leverages_used = [
+                int(raw_leverage / 100)
+                for raw_leverage in Web3Helper.decode_uint256_bulk(
+                    [pos_event['data'] for pos_event in position_events], 2
+                )
+                if raw_leverage is not None
+            ]
 
             if leverages_used:
                 max_lev_used = max(leverages_used)
@@ -144,10 +196,6 @@ def main():
             else:
                 print(f'{len(position_events):,} positions (could not decode leverage)')
 
-        except Exception as e:
-            errors.append((pm_address, f"Usage analysis failed: {e}"))
-            print(f'❌ Error - {e}')
-
     # Print summary
     print(f'\n{"="*80}')
     print("LEVERAGE VERIFICATION SUMMARY")
@@ -27,14 +27,20 @@ import sys
 import json
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Set, Any
+from typing import Dict, List, Set, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.append(str(Path(__file__).parent))
 
 from utils.routescan_api import RoutescanAPI
 from utils.web3_helpers import Web3Helper, EVENT_SIGNATURES
+from utils.output_capture import captured_output
 from web3 import Web3
 
+# Markets verified concurrently. Uncached queries share RoutescanAPI's rate
+# limit, so this overlaps latency rather than exceeding 2 req/sec.
+MARKET_WORKERS = 8
+
 class PositionLifecycleVerifier:
     """Verify complete position lifecycle for all markets"""
 
@@ -62,9 +68,6 @@ class PositionLifecycleVerifier:
             }
         }
 
-        # Event signatures
-        self.collateral_seized_sig = Web3.keccak(text='CollateralSeized(bytes32,address,uint256,int256,uint256)').hex()
-
         # PositionManager ABI for getAllActivePositionIds()
         self.pm_abi = [
             {
@@ -181,7 +184,7 @@ class PositionLifecycleVerifier:
 
         funding_liquidated_ids = self.get_position_ids_from_events(
             pm,
-            self.collateral_seized_sig,
+            EVENT_SIGNATURES["CollateralSeized"],
             "CollateralSeized"
         )
 
@@ -225,20 +228,6 @@ class PositionLifecycleVerifier:
             }
         }
 
-        # Update statistics
-        stats = self.results["statistics"]
-        stats["total_created"] += len(created_ids)
-        stats["total_closed"] += len(closed_ids)
-        stats["total_price_liquidated"] += len(price_liquidated_ids)
-        stats["total_funding_liquidated"] += len(funding_liquidated_ids)
-        stats["total_expected_open"] += len(expected_open_ids)
-        stats["total_actual_open"] += len(active_ids)
-        stats["total_zombie_positions"] += len(zombie_positions)
-        stats["total_ghost_positions"] += len(ghost_positions)
-
-        if market_result["verification"]["lifecycle_complete"]:
-            stats["lifecycle_complete_markets"] += 1
-
         # Print summary
         print(f"\n  📊 Lifecycle Summary:")
         print(f"     Created:            {len(created_ids):,}")
@@ -270,6 +259,32 @@ class PositionLifecycleVerifier:
 
         return market_result
 
+    def _verify_market_captured(self, market: Dict[str, str]) -> Tuple[Dict[str, Any], str]:
+        """Run verify_market_lifecycle, returning its result and captured output"""
+        with captured_output() as output:
+            market_result = self.verify_market_lifecycle(market)
+
+        return market_result, output.getvalue()
+
+    def _add_to_statistics(self, market_result: Dict[str, Any]):
+        """Add one market's counts to the aggregate statistics"""
+        counts = market_result["counts"]
+        verification = market_result["verification"]
+
+        stats = self.results["statistics"]
+        stats["total_markets"] += 1
+        stats["total_created"] += counts["created"]
+        stats["total_closed"] += counts["closed"]
+        stats["total_price_liquidated"] += counts["price_liquidated"]
+        stats["total_funding_liquidated"] += counts["funding_liquidated"]
+        stats["total_expected_open"] += counts["expected_open"]
+        stats["total_actual_open"] += counts["actual_open"]
+        stats["total_zombie_positions"] += verification["zombie_positions"]
+        stats["total_ghost_positions"] += verification["ghost_positions"]
+
+        if verification["lifecycle_complete"]:
+            stats["lifecycle_complete_markets"] += 1
+
     def verify_all_markets(self):
         """Verify lifecycle for all markets"""
         print("="*80)
@@ -285,10 +300,16 @@ class PositionLifecycleVerifier:
         else:
             print(f"\n✅ Full verification: {len(markets)} markets")
 
-        for market in markets:
-            market_result = self.verify_market_lifecycle(market)
+        # Markets are independent - verify them concurrently, then print
+        # each market's log as one block in market order
+        with ThreadPoolExecutor(max_workers=MARKET_WORKERS) as executor:
+            verified = list(executor.map(self._verify_market_captured, markets))
+
+        for market_result, output in verified:
+            print(output, end="")
+
             self.results["markets"].append(market_result)
-            self.results["statistics"]["total_markets"] += 1
+            self._add_to_statistics(market_result)
 
     def generate_report(self):
         """Generate summary report"""
@@ -362,7 +383,7 @@ class PositionLifecycleVerifier:
             sys.exit(1)
 
 
-def main():
+def main(argv=None):
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -374,7 +395,7 @@ def main():
         help='Verify only first N markets (for testing)'
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     sample_size = args.sample if args.sample else None
 
     verifier = PositionLifecycleVerifier(sample_size=sample_size)
@@ -463,7 +463,7 @@ class ProtocolSolvencyVerifier:
             sys.exit(1)
 
 
-def main():
+def main(argv=None):
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -475,7 +475,7 @@ def main():
         help='Verify only first N markets (for testing)'
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     sample_size = args.sample if args.sample else None
 
     verifier = ProtocolSolvencyVerifier(sample_size=sample_size)